@@ -0,0 +1,82 @@
+# author: Jan Holan
+# mail: xholan11@stud.fit.vutbr.cz
+# date: 2026-10-18
+# file: acs_backend_equivalence.py
+
+import os
+import sys
+import argparse
+import tempfile
+import itertools
+import numpy as np
+
+# make the acs package importable when the script is run from anywhere
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import acs.aco_world as acow
+import acs.aco_solver as aco_solver
+import acs.aco_backend as acob
+from acs_benchmark import generate_instance, write_instance
+
+def solve(world : acow.ACOWorld, backend : str, seed : int, args, candidates : int, global_update : str, alpha : float, batched : bool) -> tuple[list[int], float, np.ndarray]:
+    """solve the instance by the backend with fixed seed
+    
+    :return: best tour, its cost and the pheromone matrix after the solving
+    """
+    solver = aco_solver.ACOSolver(
+        _world=world,
+        _alpha=alpha,
+        _beta=args.beta,
+        _rho=args.rho,
+        _n=args.n,
+        _tau0="greedy",
+        _q0=args.q0,
+        _alpha_decay=args.alpha_decay,
+        _batched=batched,
+        _global_update=global_update,
+        _candidates=candidates,
+        _backend=backend,
+        _seed=seed
+    )
+    solver.solve(args.iterations)
+    return solver.best_tour_idx, solver.best_tour_cost, world.pheromone.copy()
+    
+def main():
+    parser = argparse.ArgumentParser(
+        description="Check that all compute backends of the acs package give identical tours under fixed seeds, " \
+            "exit status is 1 if they differ."
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5, 20, 60], help="Numbers of nodes of the instances.")
+    parser.add_argument("--seeds", type=int, nargs="+", default=[1, 2, 3], help="Seeds of the solver.")
+    parser.add_argument("--iterations", type=int, default=3, help="Number of iterations for solving (default: 3).")
+    parser.add_argument("--beta", type=float, default=2.0, help="Beta parameter (default: 2.0).")
+    parser.add_argument("--rho", type=float, default=0.1, help="Rho parameter (default: 0.1).")
+    parser.add_argument("--n", type=int, default=8, help="Number of ants (default: 8).")
+    parser.add_argument("--q0", type=float, default=0.5, help="Probability threshold for exploitation (default: 0.5).")
+    parser.add_argument("--alpha_decay", type=float, default=0.1, help="Alpha decay rate (default: 0.1).")
+    args = parser.parse_args()
+    
+    backends = list(acob.BACKENDS)
+    failures = 0
+    with tempfile.TemporaryDirectory() as directory:
+        for kind, size in itertools.product(["uniform", "clustered"], args.sizes):
+            path = os.path.join(directory, f"{kind}_{size}.in")
+            write_instance(generate_instance(kind, size, size), path)
+            world = acow.ACOWorld(path)
+            # batched construction and sequential construction by the `Ant` objects
+            for seed, candidates, global_update, alpha, batched in itertools.product(args.seeds, [None, 4], ["all", "best_tour"], [1.0, 1.5], [True, False]):
+                results = [solve(world, backend, seed, args, candidates, global_update, alpha, batched) for backend in backends]
+                reference_tour, reference_cost, reference_pheromone = results[0]
+                for backend, (tour, cost, pheromone) in zip(backends[1:], results[1:]):
+                    if tour != reference_tour or cost != reference_cost or not np.array_equal(pheromone, reference_pheromone):
+                        failures += 1
+                        print(f"MISMATCH {kind} {size} seed={seed} candidates={candidates} global_update={global_update} " \
+                              f"alpha={alpha} batched={batched}: {backends[0]} {reference_cost} vs {backend} {cost}", file=sys.stderr)
+                              
+    if failures > 0:
+        print(f"{failures} mismatches between backends {', '.join(backends)}", file=sys.stderr)
+        sys.exit(1)
+    print(f"Backends {', '.join(backends)} give identical tours", file=sys.stderr)
+    
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+# author: Jan Holan
+# mail: xholan11@stud.fit.vutbr.cz
+# date: 2026-10-18
+# file: acs_benchmark.py
+
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import tempfile
+import tracemalloc
+import subprocess
+import numpy as np
+
+# make the acs package importable when the script is run from anywhere
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import acs.aco_world as acow
+import acs.aco_solver as aco_solver
+import acs.aco_helper as acoh
+
+def generate_instance(kind : str, size : int, seed : int) -> np.ndarray:
+    """generate the coordinates of the nodes of the instance
+    
+    :param str kind: "uniform" - nodes uniformly distributed in square 1000x1000, \
+        "clustered" - nodes normally distributed around ~sqrt(size) random centers
+    :param int size: number of nodes
+    :param int seed: seed of the generator
+    :return: array of shape (size,2) with coordinates
+    :rtype: np.ndarray
+    """
+    rng = np.random.default_rng(seed)
+    if kind == "uniform":
+        return rng.uniform(0, 1000, (size, 2))
+    elif kind == "clustered":
+        cluster_count = max(1, int(np.sqrt(size)))
+        centers = rng.uniform(0, 1000, (cluster_count, 2))
+        assignment = rng.integers(0, cluster_count, size)
+        return centers[assignment] + rng.normal(0, 1000 / (4 * cluster_count), (size, 2))
+    raise ValueError(f"Unknown instance kind {kind}.")
+    
+def write_instance(coords : np.ndarray, path : str) -> None:
+    """write the coordinates to the node file in format id;name;x;y"""
+    with open(path, "w") as file:
+        file.write("# generated benchmark instance\n")
+        for node_id, (x, y) in enumerate(coords.tolist(), start=1):
+            file.write(f"{node_id};N{node_id};{x:.3f};{y:.3f}\n")
+            
+def create_solver(world : acow.ACOWorld, args) -> aco_solver.ACOSolver:
+    return aco_solver.ACOSolver(
+        _world=world,
+        _alpha=args.alpha,
+        _beta=args.beta,
+        _rho=args.rho,
+        _n=args.n,
+        _tau0="greedy",
+        _q0=args.q0,
+        _alpha_decay=args.alpha_decay,
+        _start_node_id=None,
+        _batched=args.batched,
+        _global_update=args.global_update,
+        _candidates=args.candidates,
+        _backend=args.backend,
+        _seed=args.seed
+    )
+    
+def measure_peak_memory(path : str, args) -> int:
+    """peak memory (bytes) allocated while creating the world and solving one iteration"""
+    tracemalloc.start()
+    try:
+        world = acow.ACOWorld(path)
+        with create_solver(world, args) as solver:
+            solver.solve(1)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+        
+def run_instance(kind : str, size : int, args, directory : str) -> dict:
+    """run the benchmark on one generated instance
+    
+    :return: record with the results
+    :rtype: dict
+    """
+    path = os.path.join(directory, f"{kind}_{size}.in")
+    write_instance(generate_instance(kind, size, args.seed + size), path)
+    
+    start = time.perf_counter()
+    world = acow.ACOWorld(path)
+    world_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    _, _, greedy_nodes = acoh.greedy_solution(world)
+    greedy_time = time.perf_counter() - start
+    # the greedy solution is an open path, it is closed to be comparable with the tours of the ants
+    greedy_cost = world.get_tour_cost([node.id for node in greedy_nodes])
+    
+    start = time.perf_counter()
+    with create_solver(world, args) as solver:
+        solver_init_time = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        solver.solve(args.iterations)
+        solve_time = time.perf_counter() - start
+        
+    record = {
+        "kind" : kind,
+        "size" : size,
+        "world_time_s" : world_time,
+        "greedy_time_s" : greedy_time,
+        "solver_init_time_s" : solver_init_time,
+        "solve_time_s" : solve_time,
+        "iteration_time_s" : solve_time / args.iterations,
+        "tours_per_s" : args.n * args.iterations / solve_time,
+        "greedy_cost" : greedy_cost,
+        "best_cost" : solver.best_tour_cost,
+        "best_to_greedy" : solver.best_tour_cost / greedy_cost,
+    }
+    
+    # drop the world before measuring memory, so the instances do not affect each other
+    del solver, world
+    if args.memory:
+        record["peak_memory_bytes"] = measure_peak_memory(path, args)
+    return record
+    
+def get_environment() -> dict:
+    """describe the environment of the run, so the results can be compared across commits and machines"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        "commit" : commit,
+        "python" : platform.python_version(),
+        "numpy" : np.__version__,
+        "machine" : platform.machine(),
+        "processor" : platform.processor(),
+        "system" : platform.platform(),
+        "cpu_count" : os.cpu_count(),
+    }
+    
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark of the acs package on generated instances, results are written as JSON."
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 100, 200, 500, 1000, 2000, 5000], help="Numbers of nodes of the instances.")
+    parser.add_argument("--kinds", type=str, nargs="+", default=["uniform", "clustered"], choices=["uniform", "clustered"], help="Kinds of the instances.")
+    parser.add_argument("--seed", type=int, default=42, help="Seed for instance generation and the solver (default: 42).")
+    parser.add_argument("--iterations", type=int, default=5, help="Number of iterations for solving (default: 5).")
+    parser.add_argument("--alpha", type=float, default=1.0, help="Alpha parameter (default: 1.0).")
+    parser.add_argument("--beta", type=float, default=2.0, help="Beta parameter (default: 2.0).")
+    parser.add_argument("--rho", type=float, default=0.1, help="Rho parameter (default: 0.1).")
+    parser.add_argument("--n", type=int, default=10, help="Number of ants (default: 10).")
+    parser.add_argument("--q0", type=float, default=0.9, help="Probability threshold for exploitation (default: 0.9).")
+    parser.add_argument("--alpha_decay", type=float, default=0.1, help="Alpha decay rate (default: 0.1).")
+    parser.add_argument("--global_update", type=str, default="all", choices=["all", "best_tour"], help="Edges updated by the global pheromone update (default: 'all').")
+    parser.add_argument("--candidates", type=int, default=None, help="Size of candidate lists of nearest nodes (default: None - all nodes).")
+    parser.add_argument("--backend", type=str, default="vectorized", choices=["vectorized", "reference"], help="Compute backend of the tour construction and pheromone updates (default: 'vectorized').")
+    parser.add_argument("--batched", action="store_true", help="Construct tours of all ants at once (vectorized).")
+    parser.add_argument("--no_memory", dest="memory", action="store_false", help="Do not measure peak memory (it needs another run of each instance).")
+    parser.add_argument("--output", type=str, default=None, help="Path to the output JSON file (default: standard output).")
+    args = parser.parse_args()
+    
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for kind in args.kinds:
+            for size in args.sizes:
+                record = run_instance(kind, size, args, directory)
+                results.append(record)
+                print(f"{kind:>9} {size:>5}: world {record['world_time_s']:.3f}s, "
+                      f"iteration {record['iteration_time_s']:.3f}s, {record['tours_per_s']:.1f} tours/s, "
+                      f"best/greedy {record['best_to_greedy']:.3f}", file=sys.stderr)
+                      
+    report = {
+        "environment" : get_environment(),
+        "parameters" : vars(args),
+        "results" : results,
+    }
+    if args.output is None:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+            
+if __name__ == "__main__":
+    main()
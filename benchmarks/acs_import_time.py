@@ -0,0 +1,97 @@
+# author: Jan Holan
+# mail: xholan11@stud.fit.vutbr.cz
+# date: 2026-10-18
+# file: acs_import_time.py
+
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+import statistics
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data")
+
+# headless entry points and modules, the code run in a new interpreter and the top-level packages it must not import
+TARGETS = {
+    "python" : (["-c", "pass"], []),
+    "acs.aco_solver" : (["-c", "import acs.aco_solver"], ["PyQt5", "multiprocessing"]),
+    "acstsp" : (["-c", "import acstsp"], ["PyQt5", "multiprocessing"]),
+    "acsbatch" : (["-c", "import acsbatch"], ["PyQt5"]),
+    "acstsp run" : ([os.path.join(SRC_DIR, "acstsp.py"), os.path.join(DATA_DIR, "tests", "7nodes_test.in"), "--iterations", "1", "--seed", "1"], ["PyQt5", "multiprocessing"]),
+}
+
+def measure(arguments : list[str]) -> tuple[float, float, list[str]]:
+    """run the code in a new interpreter with `-X importtime`
+    
+    :return: wall time of the whole run in seconds, time of the imports in seconds (sum of the top-level imports) \
+        and names of all imported modules
+    :rtype: tuple[float, float, list[str]]
+    """
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-X", "importtime", *arguments], capture_output=True, text=True, cwd=SRC_DIR)
+    wall_time = time.perf_counter() - start
+    if result.returncode != 0:
+        raise Exception(f"Run of {' '.join(arguments)} failed:\n{result.stderr}")
+    
+    # lines of -X importtime: "import time: self [us] | cumulative | imported package" (nested ones are indented)
+    import_time = 0.0
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        modules.append(name.strip())
+        if not name.startswith("  "):
+            import_time += int(cumulative) / 1e6
+    return wall_time, import_time, modules
+    
+def main():
+    parser = argparse.ArgumentParser(
+        description="Cold start benchmark of the headless entry points of the acs package - each target is run " \
+            "in a new interpreter, exit status is 1 if a target imports a forbidden package (e.g. PyQt5) " \
+            "or its median wall time exceeds the limit."
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Number of runs of each target (default: 5).")
+    parser.add_argument("--max_ms", type=float, default=None, help="Limit of the median wall time of the targets above the bare interpreter in milliseconds (default: None - no limit).")
+    parser.add_argument("--output", type=str, default=None, help="Path to the output JSON file (default: standard output).")
+    args = parser.parse_args()
+    
+    results = {}
+    failures = []
+    for name, (arguments, forbidden) in TARGETS.items():
+        runs = [measure(arguments) for _ in range(args.repeat)]
+        modules = runs[0][2]
+        imported_forbidden = sorted(set(module.split(".")[0] for module in modules) & set(forbidden))
+        results[name] = {
+            "wall_time_ms" : 1000 * statistics.median(run[0] for run in runs),
+            "import_time_ms" : 1000 * statistics.median(run[1] for run in runs),
+            "modules" : len(modules),
+            "forbidden_imported" : imported_forbidden,
+        }
+        if imported_forbidden:
+            failures.append(f"{name} imports {', '.join(imported_forbidden)}")
+        print(f"{name:>15}: wall {results[name]['wall_time_ms']:.1f} ms, imports {results[name]['import_time_ms']:.1f} ms, " \
+              f"{len(modules)} modules", file=sys.stderr)
+              
+    # the limit is for the time added by the acs package, the interpreter start is not counted
+    if args.max_ms is not None:
+        baseline = results["python"]["wall_time_ms"]
+        for name, record in results.items():
+            if record["wall_time_ms"] - baseline > args.max_ms:
+                failures.append(f"{name} takes {record['wall_time_ms'] - baseline:.1f} ms over the interpreter start (limit {args.max_ms} ms)")
+                
+    if args.output is None:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+    else:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+    for failure in failures:
+        print("FAIL " + failure, file=sys.stderr)
+    sys.exit(1 if failures else 0)
+    
+if __name__ == "__main__":
+    main()
@@ -1,42 +1,118 @@
 from acs.aco_world import Node, Edge, ACOWorld
+from acs.aco_profiler import ACOProfiler
+from acs.aco_backend import ACOBackend, VectorizedBackend
 import acs.aco_settings as acoh
 import numpy as np
-import bisect
 
 class Ant:
     """class representing the ant in the ACO algorithm
     
     :info:
-        - !!! if you use this Ant class in AS algorithm, for moving USE `do_next_move_AS()` method !!! \n 
+        - !!! if you use this Ant class in AS algorithm, for moving USE `do_next_move_AS()` method !!! \n
         - !!! if you use this Ant class in ACS algorithm, for moving USE `do_next_move_ACS()` method !!!
+        - the ant works with dense node indices of the world, `current_node`, `visited_nodes` and `tour` \
+            are just views created from them
+        - not visited nodes are kept in the array `unvisited` (first `unvisited_count` items are valid), \
+            removing is done by swapping with the last valid item, so every step of the ant is O(1) + O(unvisited)
+        - if the world has candidate lists, the ant chooses only from not visited candidates of the current node, \
+            all not visited nodes are used only if all candidates are visited
+        - the ant has its own random generator, the random numbers for the whole tour are drawn at once \
+            (in `reset()`), so the ant does not depend on the global random state
+        - the choice info and the selection of the next node are computed by the compute backend \
+            (see `acs.aco_backend`), one ant at a time
     """
     
     # public
     id : int = None
-    current_node : Node = None
-    visited_nodes : list[Node] = []
-    tour : list[Edge] = []
+    current_idx : int = None
+    visited_idx : list[int] = []
     tour_cost : float = 0
+    # mask of visited nodes (including the current one)
+    visited_mask : np.ndarray = None
+    # indices of not visited nodes, only first unvisited_count items are valid
+    unvisited : np.ndarray = None
+    unvisited_count : int = 0
+    # profiler for counting the decisions of the ant, None if the profiling is not enabled
+    profiler : ACOProfiler = None
+    # random generator of the ant
+    random : np.random.Generator = None
+    # compute backend of the choice info and the selection of the next node
+    backend : ACOBackend = None
     # private
     __world : ACOWorld = None
+    # position of each node in the unvisited array
+    __unvisited_pos : np.ndarray = None
+    # random numbers drawn for the tour and the position of the next one to use
+    __random_values : np.ndarray = None
+    __random_pos : int = 0
     
-    def __init__(self, world : ACOWorld, id : int, start_node : Node):
+    def __init__(self, world : ACOWorld, id : int, start_node_idx : int, random : np.random.Generator = None, backend : ACOBackend = None):
+        """create the ant
+        
+        :param `ACOWorld` world: world the ant walks in
+        :param int id: id of the ant
+        :param int start_node_idx: index of the starting node for the ant
+        :param `np.random.Generator` random: random generator of the ant, if None, a new one with random seed is created
+        :param `ACOBackend` backend: compute backend of the moves, if None, the vectorized backend is used
+        """
         self.__world = world
         self.id = id
-        self.current_node = start_node
-        self.visited_nodes = []
-        self.tour = []
-        self.tour_cost = 0
-    
-    def reset(self, start_node : Node) -> None:
+        self.random = random if random is not None else np.random.default_rng()
+        self.backend = backend if backend is not None else VectorizedBackend()
+        self.reset(start_node_idx)
+        
+    def reset(self, start_node_idx : int) -> None:
         """reset the ant to the starting position
         
-        :param Node start_node: starting node for the ant
+        :param int start_node_idx: index of the starting node for the ant
         """
-        self.current_node = start_node
-        self.visited_nodes = []
-        self.tour = []
+        node_count = len(self.__world.node_list)
+        self.current_idx = start_node_idx
+        self.visited_idx = []
         self.tour_cost = 0
+        self.visited_mask = np.zeros(node_count, dtype=bool)
+        self.unvisited = np.arange(node_count)
+        self.__unvisited_pos = np.arange(node_count)
+        self.unvisited_count = node_count
+        self.__mark_visited(start_node_idx)
+        # at most two random numbers are needed for each move (exploitation/exploration and roulette wheel)
+        self.__random_values = self.random.random(2 * node_count)
+        self.__random_pos = 0
+        
+    @property
+    def current_node(self) -> Node:
+        return self.__world.node_list[self.current_idx]
+        
+    @property
+    def visited_nodes(self) -> list[Node]:
+        return [self.__world.node_list[idx] for idx in self.visited_idx]
+        
+    @property
+    def tour(self) -> list[Edge]:
+        """edges walked by the ant, in the order of walking
+        
+        :rtype: list[Edge]
+        """
+        path = self.visited_idx + [self.current_idx]
+        return [self.__world.get_edge(path[k], path[k+1]) for k in range(len(path) - 1)]
+        
+    @property
+    def last_move(self) -> tuple[int,int]:
+        """indices of the nodes of the last walked edge"""
+        return (self.visited_idx[-1], self.current_idx)
+        
+    def set_finished_tour(self, path : list[int], tour_cost : float) -> None:
+        """set the whole tour constructed outside of the ant (e.g. by the batched construction), \
+        the ant ends at its starting node
+        
+        :param list[int] path: indices of the visited nodes in order, starting with the start node
+        :param float tour_cost: cost of the tour including the return to the start node
+        """
+        self.visited_idx = path
+        self.current_idx = path[0]
+        self.tour_cost = tour_cost
+        self.visited_mask[:] = True
+        self.unvisited_count = 0
         
     def can_move(self) -> bool:
         """check if the ant can move to the next node
@@ -44,30 +120,24 @@ class Ant:
         :return: True if the ant can move, False otherwise
         :rtype: bool
         """
-        possible_edges = self.__get_possible_edges()
-        return possible_edges != []
-    
+        return self.unvisited_count > 0
+        
     def ant_has_returned_to_start(self) -> bool:
         """check if the ant has returned to the starting position
         
         :return: True if the ant has returned to the starting position, False otherwise
         :rtype: bool
         """
-        return self.current_node == self.visited_nodes[0] if len(self.visited_nodes) > 0 else False
-    
+        return self.current_idx == self.visited_idx[0] if len(self.visited_idx) > 0 else False
+        
     def do_final_move_to_start(self) -> None:
-        # get possible next edges
-        possible_edges = self.__world.get_adjacent_edges(self.current_node)
-        # get the edge that leads to the starting node
-        for edge in possible_edges:
-            if edge.node_first == self.current_node and edge.node_second == self.visited_nodes[0] or edge.node_first == self.visited_nodes[0] and edge.node_second == self.current_node :
-                self.visited_nodes.append(self.current_node)
-                self.tour.append(edge)
-                self.tour_cost += edge.weight
-                # change current node to the starting node
-                self.current_node = self.visited_nodes[0]
-                return
-    
+        # move along the edge that leads to the starting node
+        if (self.visited_idx == []):
+            return
+        start_idx = self.visited_idx[0]
+        if np.isfinite(self.__world.distance[self.current_idx, start_idx]):
+            self.__update_position(start_idx)
+            
     def do_next_move_ACS(self, q0 : float, alpha : float, beta : float) -> None:
         """move the ant to the next node according to the ACS (ant colony system) algorithm
         
@@ -78,97 +148,113 @@ class Ant:
         # check if the ant can move
         if (not self.can_move()):
             return
-        
+            
         # choose whether to exploit or explore
-        if (np.random.uniform(0, 1) < q0):
+        if (self.__next_random() < q0):
+            if self.profiler is not None:
+                self.profiler.count("exploit")
             self.__do_next_move_exploit(alpha, beta)
         else:
+            if self.profiler is not None:
+                self.profiler.count("explore")
             # exploration is done by the AS algorithm
             self.do_next_move_AS(alpha, beta)
-    
+            
     def __do_next_move_exploit(self,alpha,beta) -> None:
         """go for the edge with highest probability (no random choosing), it is equivalent to the to the first \
             part of the AS edge-choosing algorithm
         """
-        possible_edges = self.__get_possible_edges()
         # if no edge to move to, return
-        if (possible_edges == []):
+        if (not self.can_move()):
             return
-        
-        # get the probabilities for the next node (for all neighbors of the current node)
-        chosen_edge_list_idx = np.argmax(self.__get_prob_dist_for_edges(possible_edges, alpha, beta))
-        
-        # update the ant's position
-        self.__update_position(possible_edges[chosen_edge_list_idx])
+        self.__do_next_move(alpha, beta, True, 0.0)
         
     def do_next_move_AS(self, alpha, beta) -> None:
         """move the ant to the next node according to the AS (ant system) algorithm
-    
+        
         :param float alpha: alpha parameter
         :param float beta: beta parameter
         """
-        possible_edges = self.__get_possible_edges()
         # if no edge to move to, return
-        if (possible_edges == []):
+        if (not self.can_move()):
             return
+        # choose the next edge according to the probabilities (roulette wheel)
+        self.__do_next_move(alpha, beta, False, self.__next_random())
+        
+    def __do_next_move(self, alpha : float, beta : float, exploit : bool, random_value : float) -> None:
+        """select the next node by the backend and move the ant there
         
-        # get the probabilities for the next node (for all neighbors of the current node)
-        probabilities = self.__get_prob_dist_for_edges(possible_edges, alpha, beta)
-        edge_probabilities = np.cumsum(probabilities)
+        :param bool exploit: if True, the node with the highest choice info is selected, \
+            otherwise the roulette wheel with `random_value` is used
+        """
+        possible_nodes = self.__get_possible_nodes()
         
-        # choose the next edge according to the probabilities
-        random_number = np.random.uniform(0, 1)
-        selected_edge_idx = bisect.bisect_left(edge_probabilities, random_number)
+        # choice info (tau^alpha * eta^beta) of the edges to the possible nodes, one row for this ant
+        if self.profiler is not None:
+            self.profiler.count("edges_evaluated", len(possible_nodes))
+        choice = self.backend.choice_info(
+            self.__world.pheromone,
+            self.__world.get_eta_beta(beta),
+            np.array([self.current_idx]),
+            possible_nodes[None, :],
+            alpha
+        )
+        selected_node_list_idx = self.backend.select_next(choice, np.array([exploit]), np.array([random_value]))[0]
         
-        # select the next node according to the probabilities
-        chosen_edge = possible_edges[selected_edge_idx]
         # update the ant's position
-        self.__update_position(chosen_edge)
-
-    def __get_possible_edges(self) -> list[Edge]:
-        """get the possible edges for the current node, meaning all the edges, leading 
-        to the nodes that have not been visited yet from the current node
+        self.__update_position(int(possible_nodes[selected_node_list_idx]))
         
-        :return: list of possible edges
-        :rtype: list[Edge]
+    def __next_random(self) -> float:
+        """get the next random number from [0,1) drawn for the tour (new block is drawn, if all are used)"""
+        if self.__random_pos >= self.__random_values.size:
+            self.__random_values = self.random.random(self.__random_values.size)
+            self.__random_pos = 0
+        value = self.__random_values[self.__random_pos]
+        self.__random_pos += 1
+        return value
+        
+    def __get_possible_nodes(self) -> np.ndarray:
+        """get the possible next nodes for the current node, meaning all the nodes that have not been visited yet \
+        (the world is a complete graph, so each of them is connected to the current node), if the world has \
+        candidate lists, only not visited candidates are returned (if there are any)
+        
+        :return: indices of possible next nodes (can be a view into the unvisited array, do not modify)
+        :rtype: np.ndarray
         """
-        # get possible next edges
-        possible_edges = self.__world.get_adjacent_edges(self.current_node)
-        # remove the edges that leads to nodes already visited
-        possible_edges = [edge for edge in possible_edges if (edge.node_first not in self.visited_nodes) and (edge.node_second not in self.visited_nodes)]
-        return possible_edges
-    
-    def __get_prob_dist_for_edges(self, possible_edges, alpha, beta) -> list[float]:
-        """compute the probability distribution for all possible edges
+        if self.__world.candidates is not None:
+            candidate_nodes = self.__world.candidates[self.current_idx]
+            candidate_nodes = candidate_nodes[~self.visited_mask[candidate_nodes]]
+            if candidate_nodes.size > 0:
+                return candidate_nodes
+        return self.unvisited[:self.unvisited_count]
+        
+    def __mark_visited(self, node_idx : int) -> None:
+        """remove the node from the unvisited nodes (swap with the last valid item)
         
-        :return: list of probabilities for adjacent edges in order as the edges are sorted in the list possible_edges
-        :rtype: list[float]
+        :param int node_idx: index of the node
         """
+        if self.visited_mask[node_idx]:
+            return
+        self.visited_mask[node_idx] = True
+        pos = self.__unvisited_pos[node_idx]
+        last = self.unvisited_count - 1
+        last_node_idx = self.unvisited[last]
+        self.unvisited[pos] = last_node_idx
+        self.__unvisited_pos[last_node_idx] = pos
+        self.unvisited[last] = node_idx
+        self.__unvisited_pos[node_idx] = last
+        self.unvisited_count = last
         
-        # probability going from node [x] to [y] in step [k]: 
-        # prob_(x->y) = [(tau_(x->y))^alpha * (eta_(x->y))^beta] / [sum(tau_(x->z)^alpha * eta_(x->z)^beta)]
-        # go through all possible edges for the current node and compute the numerator for the formula for probability
-        probabilities = []
-        for edge in possible_edges:
-            tau = edge.pheromone
-            eta = 1 / edge.weight
-            # compute just the numerator
-            numerator = ((tau**alpha)*(eta**beta))
-            probabilities.append(numerator)
-
-        # normalize the probabilities by denominator (from formula)
-        denominator = sum(probabilities)
-        probabilities = [numerator/denominator for numerator in probabilities]
-        return probabilities
-    
-    def __update_position(self, chosen_edge : Edge) -> None:
-        """update the ant's position to the next node, add the edge and node to the visited nodes and path 
+    def __update_position(self, next_idx : int) -> None:
+        """update the ant's position to the next node, add the current node to the visited nodes
         
-        :param Edge chosen_edge: edge that the ant has chosen to move to the next node
+        :param int next_idx: index of the node the ant has chosen to move to
         """
+        if self.profiler is not None:
+            self.profiler.count("moves")
         # store the processed things
-        self.visited_nodes.append(self.current_node)
-        self.tour.append(chosen_edge)
-        self.tour_cost += chosen_edge.weight
+        self.visited_idx.append(self.current_idx)
+        self.tour_cost += self.__world.distance[self.current_idx, next_idx]
         # update the current node
-        self.current_node = chosen_edge.node_second if chosen_edge.node_first == self.current_node else chosen_edge.node_first
+        self.current_idx = next_idx
+        self.__mark_visited(next_idx)
@@ -0,0 +1,206 @@
+# author: Jan Holan
+# mail: xholan11@stud.fit.vutbr.cz
+# date: 2026-10-18
+# file: aco_backend.py
+
+from abc import ABC, abstractmethod
+import numpy as np
+
+class ACOBackend(ABC):
+    """interface of the compute backend - the hot kernels of the ACS (choice info, next node selection, \
+    pheromone updates and tour cost)
+    
+    :info:
+        - all backends must give the same results for the same inputs (including the random numbers, \
+            which are drawn by the caller), so the backend can be switched without changing the tours
+        - the arrays are indexed by dense node indices of the world
+    """
+    name : str = None
+    
+    @abstractmethod
+    def choice_info(self, pheromone : np.ndarray, eta_beta : np.ndarray, current : np.ndarray, nodes : np.ndarray, alpha : float) -> np.ndarray:
+        """compute the choice info (tau^alpha * eta^beta) of the edges from the current nodes of the ants
+        
+        :param `np.ndarray` current: current node of each ant
+        :param `np.ndarray` nodes: nodes to compute the choice info for, one row per ant, None for all nodes
+        :return: choice info, one row per ant
+        :rtype: np.ndarray
+        """
+        
+    @abstractmethod
+    def select_next(self, choice : np.ndarray, exploit : np.ndarray, random_values : np.ndarray) -> np.ndarray:
+        """select the column for each row of the choice info matrix, columns with zero value cannot be selected
+        
+        :param `np.ndarray` choice: choice info matrix, one row per ant
+        :param `np.ndarray` exploit: boolean array, True if the ant exploits (goes for the best column), \
+            otherwise the column is selected by the roulette wheel
+        :param `np.ndarray` random_values: uniform random numbers from [0,1) for the roulette wheel, one per row
+        :return: index of the selected column for each row
+        :rtype: np.ndarray
+        """
+        
+    @abstractmethod
+    def local_update(self, pheromone : np.ndarray, idx_from : np.ndarray, idx_to : np.ndarray, rho : float, tau0 : float) -> None:
+        """local update of the pheromone on the walked edges (in both directions), all new values are computed \
+        from the old ones (if more ants walk the same edge, the edge is updated only once)
+        """
+        
+    @abstractmethod
+    def global_update(self, pheromone : np.ndarray, tour : np.ndarray, tour_cost : float, alpha_decay : float, Q : float, evaporate_all : bool) -> np.ndarray:
+        """global update of the pheromone by the best tour - evaporation and deposit of Q/tour_cost on its edges
+        
+        :param `np.ndarray` tour: indices of the nodes of the closed tour in order
+        :param bool evaporate_all: if True, the pheromone evaporates on all edges, otherwise only on the edges of the tour
+        :return: new pheromone values on the edges of the tour
+        :rtype: np.ndarray
+        """
+        
+    @abstractmethod
+    def tour_cost(self, distance : np.ndarray, paths : np.ndarray) -> np.ndarray:
+        """compute the costs of the closed tours (the edges are summed in order of the tour)
+        
+        :param `np.ndarray` paths: indices of the visited nodes, one row per tour
+        :rtype: np.ndarray
+        """
+        
+class ReferenceBackend(ACOBackend):
+    """pure Python implementation of the kernels, element by element - slow, but simple to check"""
+    name = "reference"
+    
+    def choice_info(self, pheromone, eta_beta, current, nodes, alpha):
+        if nodes is None:
+            nodes = np.broadcast_to(np.arange(pheromone.shape[1]), (len(current), pheromone.shape[1]))
+        choice = np.zeros(nodes.shape)
+        for row in range(nodes.shape[0]):
+            node_from = int(current[row])
+            for col in range(nodes.shape[1]):
+                node_to = int(nodes[row, col])
+                choice[row, col] = (float(pheromone[node_from, node_to]) ** alpha) * float(eta_beta[node_from, node_to])
+        return choice
+        
+    def select_next(self, choice, exploit, random_values):
+        selected = np.empty(choice.shape[0], dtype=int)
+        for row in range(choice.shape[0]):
+            values = [float(value) for value in choice[row]]
+            # exploitation - go for the best edge (the first one of the best)
+            best_col = 0
+            for col in range(1, len(values)):
+                if values[col] > values[best_col]:
+                    best_col = col
+            if exploit[row]:
+                selected[row] = best_col
+                continue
+            # exploration - roulette wheel selection, the first column with cumulative value over the threshold
+            cumulative = []
+            total = 0.0
+            for value in values:
+                total += value
+                cumulative.append(total)
+            threshold = float(random_values[row]) * total
+            col = 0
+            while col < len(values) - 1 and cumulative[col] <= threshold:
+                col += 1
+            # rounding can end on column that cannot be selected, use exploitation then
+            selected[row] = best_col if values[col] == 0 else col
+        return selected
+        
+    def local_update(self, pheromone, idx_from, idx_to, rho, tau0):
+        updated = [
+            max((1 - rho) * float(pheromone[int(i), int(j)]) + rho * tau0, tau0)
+            for i, j in zip(idx_from, idx_to)
+        ]
+        for i, j, value in zip(idx_from, idx_to, updated):
+            pheromone[int(i), int(j)] = value
+        for i, j, value in zip(idx_from, idx_to, updated):
+            pheromone[int(j), int(i)] = value
+            
+    def global_update(self, pheromone, tour, tour_cost, alpha_decay, Q, evaporate_all):
+        tour = [int(node) for node in tour]
+        edges = list(zip(tour, tour[1:] + tour[:1]))
+        if evaporate_all:
+            node_count = pheromone.shape[0]
+            for i in range(node_count):
+                for j in range(node_count):
+                    pheromone[i, j] = float(pheromone[i, j]) * (1 - alpha_decay)
+            updated = [float(pheromone[i, j]) + Q / tour_cost for i, j in edges]
+        else:
+            updated = [(1 - alpha_decay) * float(pheromone[i, j]) + Q / tour_cost for i, j in edges]
+        for (i, j), value in zip(edges, updated):
+            pheromone[i, j] = value
+            pheromone[j, i] = value
+        return np.array(updated)
+        
+    def tour_cost(self, distance, paths):
+        costs = np.zeros(paths.shape[0])
+        for row in range(paths.shape[0]):
+            path = [int(node) for node in paths[row]]
+            cost = 0.0
+            for k in range(len(path)):
+                cost += float(distance[path[k], path[(k + 1) % len(path)]])
+            costs[row] = cost
+        return costs
+        
+class VectorizedBackend(ACOBackend):
+    """NumPy implementation of the kernels, whole colony (or tour) at once"""
+    name = "vectorized"
+    
+    def choice_info(self, pheromone, eta_beta, current, nodes, alpha):
+        if nodes is None:
+            return (pheromone[current] ** alpha) * eta_beta[current]
+        return (pheromone[current[:, None], nodes] ** alpha) * eta_beta[current[:, None], nodes]
+        
+    def select_next(self, choice, exploit, random_values):
+        # exploitation - go for the best edge
+        exploit_col = np.argmax(choice, axis=1)
+        if exploit.all():
+            return exploit_col
+        rows = np.arange(choice.shape[0])
+        # exploration - roulette wheel selection
+        cumulative = np.cumsum(choice, axis=1)
+        threshold = random_values * cumulative[:, -1]
+        explore_col = np.minimum((cumulative <= threshold[:, None]).sum(axis=1), choice.shape[1] - 1)
+        # rounding can end on column that cannot be selected, use exploitation then
+        explore_col = np.where(choice[rows, explore_col] == 0, exploit_col, explore_col)
+        return np.where(exploit, exploit_col, explore_col)
+        
+    def local_update(self, pheromone, idx_from, idx_to, rho, tau0):
+        updated = np.maximum((1 - rho) * pheromone[idx_from, idx_to] + rho * tau0, tau0)
+        pheromone[idx_from, idx_to] = updated
+        pheromone[idx_to, idx_from] = updated
+        
+    def global_update(self, pheromone, tour, tour_cost, alpha_decay, Q, evaporate_all):
+        tour_from = np.asarray(tour)
+        tour_to = np.roll(tour_from, -1)
+        if evaporate_all:
+            pheromone *= (1 - alpha_decay)
+            updated = pheromone[tour_from, tour_to] + Q / tour_cost
+        else:
+            updated = (1 - alpha_decay) * pheromone[tour_from, tour_to] + Q / tour_cost
+        pheromone[tour_from, tour_to] = updated
+        pheromone[tour_to, tour_from] = updated
+        return updated
+        
+    def tour_cost(self, distance, paths):
+        # summed step by step over the whole colony, so the order of the additions is the same as in a loop
+        costs = np.zeros(paths.shape[0])
+        for k in range(paths.shape[1]):
+            costs += distance[paths[:, k], paths[:, (k + 1) % paths.shape[1]]]
+        return costs
+        
+# available backends by their names
+BACKENDS = {
+    ReferenceBackend.name : ReferenceBackend,
+    VectorizedBackend.name : VectorizedBackend,
+}
+
+def get_backend(name : str) -> ACOBackend:
+    """create the backend by its name
+    
+    :param str name: name of the backend, one of `BACKENDS`
+    :rtype: ACOBackend
+    
+    :raises ValueError: if there is no backend with the name
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"backend must be one of {', '.join(BACKENDS)}.")
+    return BACKENDS[name]()
@@ -0,0 +1,90 @@
+# author: Jan Holan
+# mail: xholan11@stud.fit.vutbr.cz
+# date: 2026-10-18
+# file: aco_checkpoint.py
+
+import numpy as np
+import struct
+import json
+import os
+
+# format of the checkpoint file:
+#   - magic bytes with the version of the format
+#   - length of the header (little endian unsigned 64-bit integer)
+#   - header - JSON object with the state of the solver and the layout of the arrays
+#   - arrays in raw binary form (C order), each aligned to `ALIGNMENT` bytes, so they can be memory mapped
+MAGIC = b"ACOCKPT1"
+ALIGNMENT = 64
+
+def _align(offset : int) -> int:
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+    
+def write_checkpoint(path : str, header : dict, arrays : dict[str, np.ndarray]) -> None:
+    """write the checkpoint file, the file is written atomically (the old checkpoint stays valid until \
+    the new one is complete)
+    
+    :param str path: path to the checkpoint file
+    :param dict header: state stored in the header, it must be serializable to JSON
+    :param arrays: arrays stored in binary form by their names
+    
+    :raises Exception: if the file cannot be written
+    """
+    # offsets of the arrays are relative to the start of the data section
+    layout = {}
+    offset = 0
+    for name, array in arrays.items():
+        offset = _align(offset)
+        layout[name] = {"offset" : offset, "shape" : list(array.shape), "dtype" : array.dtype.str}
+        offset += array.nbytes
+    header_bytes = json.dumps({"state" : header, "arrays" : layout}).encode("utf-8")
+    data_start = _align(len(MAGIC) + 8 + len(header_bytes))
+    
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as file:
+            file.write(MAGIC)
+            file.write(struct.pack("<Q", len(header_bytes)))
+            file.write(header_bytes)
+            for name, array in arrays.items():
+                file.write(b"\0" * (data_start + layout[name]["offset"] - file.tell()))
+                file.write(np.ascontiguousarray(array).tobytes())
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, path)
+    except OSError as e:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise Exception(f"Cannot write checkpoint {path}: {e}")
+        
+def read_checkpoint(path : str) -> tuple[dict, dict[str, np.ndarray]]:
+    """read the checkpoint file, the arrays are memory mapped (read only), not loaded
+    
+    :param str path: path to the checkpoint file
+    :return: state stored in the header and the arrays by their names
+    :rtype: tuple[dict, dict[str, np.ndarray]]
+    
+    :raises Exception: if the file cannot be read or it is not a valid checkpoint
+    """
+    try:
+        with open(path, "rb") as file:
+            if file.read(len(MAGIC)) != MAGIC:
+                raise Exception(f"File {path} is not a checkpoint (or it has unsupported version).")
+            (header_length,) = struct.unpack("<Q", file.read(8))
+            header = json.loads(file.read(header_length).decode("utf-8"))
+        data_start = _align(len(MAGIC) + 8 + header_length)
+        file_size = os.path.getsize(path)
+        
+        arrays = {}
+        for name, spec in header["arrays"].items():
+            dtype = np.dtype(spec["dtype"])
+            shape = tuple(spec["shape"])
+            offset = data_start + spec["offset"]
+            if offset + dtype.itemsize * int(np.prod(shape)) > file_size:
+                raise Exception(f"Checkpoint {path} is truncated.")
+            if 0 in shape:
+                arrays[name] = np.empty(shape, dtype=dtype)
+            else:
+                arrays[name] = np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=shape)
+        return header["state"], arrays
+    except (OSError, ValueError, KeyError, struct.error) as e:
+        raise Exception(f"Cannot read checkpoint {path}: {e}")
@@ -0,0 +1,135 @@
+# author: Jan Holan
+# mail: xholan11@stud.fit.vutbr.cz
+# date: 2026-10-18
+# file: aco_construction.py
+
+from acs.aco_profiler import ACOProfiler
+from acs.aco_backend import ACOBackend, VectorizedBackend
+from typing import Callable
+import numpy as np
+import time
+
+# backend used, if no backend is given
+DEFAULT_BACKEND = VectorizedBackend()
+
+def local_update_tours(pheromone : np.ndarray, paths : np.ndarray, rho : float, tau0 : float, backend : ACOBackend = DEFAULT_BACKEND) -> None:
+    """deferred local update of the pheromone on the edges of the whole tours, step by step \
+    in the order the ants walked them, so the result does not depend on who constructed the tours
+    
+    :param `np.ndarray` paths: indices of the visited nodes, one row per ant
+    """
+    node_count = paths.shape[1]
+    for step in range(node_count):
+        backend.local_update(pheromone, paths[:, step], paths[:, (step + 1) % node_count], rho, tau0)
+        
+def undo_local_updates(pheromone : np.ndarray, undo_log : list[tuple[np.ndarray, np.ndarray, np.ndarray]]) -> None:
+    """restore the pheromone changed by the local updates of an abandoned construction, \
+    so the cut short iteration leaves the pheromone as it was (like the deferred local updates of the parallel construction)
+    
+    :param `np.ndarray` pheromone: pheromone matrix of the world
+    :param undo_log: indices of the updated edges (from, to) and their pheromone before the update, in the order of the updates
+    """
+    # in reverse order, so the edge updated more times gets its oldest value
+    for idx_from, idx_to, old_pheromone in reversed(undo_log):
+        pheromone[idx_from, idx_to] = old_pheromone
+        pheromone[idx_to, idx_from] = old_pheromone
+    undo_log.clear()
+    
+def construct_tours(distance : np.ndarray, pheromone : np.ndarray, eta_beta : np.ndarray, candidates : np.ndarray, start : np.ndarray, alpha : float, q0 : float, rho : float = None, tau0 : float = None, random = np.random, profiler : ACOProfiler = None, backend : ACOBackend = DEFAULT_BACKEND, deadline : float = None, stop : Callable[[], bool] = None) -> tuple[np.ndarray, np.ndarray] | None:
+    """construct the tours of all ants at once, in each step all ants move by one node
+    
+    the state of the colony (current nodes, visited masks, paths) is kept in arrays, \
+    so one step is a single operation of the backend over the colony; the random numbers for the whole \
+    construction are drawn here at once, so they are the same for any backend
+    
+    :param `np.ndarray` distance: distance matrix of the world
+    :param `np.ndarray` pheromone: pheromone matrix of the world
+    :param `np.ndarray` eta_beta: heuristic information (1/distance) powered by beta
+    :param `np.ndarray` candidates: candidate lists of the nodes, None if not used
+    :param `np.ndarray` start: indices of the starting nodes, one per ant
+    :param `float` alpha: alpha parameter, influence of pheromone on the edge
+    :param `float` q0: exploitation probability, 0<=q0<=1
+    :param `float` rho: evaporation rate for the local update, if None, the local update is not done \
+        (the pheromone is only read)
+    :param `float` tau0: initial pheromone value for the local update
+    :param random: source of random numbers (`np.random` module or `np.random.Generator`)
+    :param `ACOProfiler` profiler: profiler for counting the decisions and timing the local updates, None if not used
+    :param `ACOBackend` backend: backend computing the kernels
+    :param `float` deadline: value of `time.perf_counter()` when the construction is cut short, None for no limit
+    :param stop: function checked before each step, the construction is cut short when it returns True \
+        (e.g. the solving was interrupted from another thread), None if not used
+    :return: paths (indices of the visited nodes, one row per ant) and costs of the tours, \
+        None if the construction was cut short by the deadline or `stop` (the local updates done so far are undone)
+    :rtype: tuple[np.ndarray, np.ndarray] | None
+    """
+    node_count = distance.shape[0]
+    ant_count = start.size
+    ants = np.arange(ant_count)
+    
+    # state of the colony
+    current = start.copy()
+    visited = np.zeros((ant_count, node_count), dtype=bool)
+    visited[ants, current] = True
+    paths = np.empty((ant_count, node_count), dtype=int)
+    paths[:, 0] = start
+    # for each step and ant one random number for the choice between exploitation and exploration \
+    # and one for the roulette wheel
+    random_values = random.random((2, node_count, ant_count))
+    # pheromone before the local updates, for the case the construction is cut short
+    undo_log = []
+    
+    for step in range(1, node_count + 1):
+        if (deadline is not None and time.perf_counter() > deadline) or (stop is not None and stop()):
+            undo_local_updates(pheromone, undo_log)
+            return None
+        if step < node_count:
+            # choose whether to exploit or explore
+            exploit = random_values[0, step] < q0
+            fallback = ants
+            if candidates is not None:
+                # choice info only for the candidates of the current nodes
+                candidate_nodes = candidates[current]
+                candidate_visited = visited[ants[:, None], candidate_nodes]
+                choice = backend.choice_info(pheromone, eta_beta, current, candidate_nodes, alpha)
+                choice[candidate_visited] = 0
+                next_idx = candidate_nodes[ants, backend.select_next(choice, exploit, random_values[1, step])]
+                # ants with all candidates visited choose from all nodes
+                fallback = np.flatnonzero(candidate_visited.all(axis=1))
+            else:
+                next_idx = np.empty(ant_count, dtype=int)
+                
+            if fallback.size > 0:
+                # choice info for the current nodes of the ants, visited nodes cannot be chosen
+                choice = backend.choice_info(pheromone, eta_beta, current[fallback], None, alpha)
+                choice[visited[fallback]] = 0
+                next_idx[fallback] = backend.select_next(choice, exploit[fallback], random_values[1, step, fallback])
+                
+            if profiler is not None:
+                exploit_count = int(exploit.sum())
+                profiler.count("exploit", exploit_count)
+                profiler.count("explore", ant_count - exploit_count)
+                evaluated = int((~visited[fallback]).sum())
+                if candidates is not None:
+                    evaluated += int((~candidate_visited).sum())
+                profiler.count("edges_evaluated", evaluated)
+        else:
+            # return to the start
+            next_idx = start
+            
+        visited[ants, next_idx] = True
+        if step < node_count:
+            paths[:, step] = next_idx
+            
+        # local update of the pheromone on the walked edges
+        if rho is not None:
+            if profiler is not None:
+                local_update_start = time.perf_counter()
+            undo_log.append((current, next_idx, pheromone[current, next_idx]))
+            backend.local_update(pheromone, current, next_idx, rho, tau0)
+            if profiler is not None:
+                profiler.add_time("local_update", time.perf_counter() - local_update_start)
+        if profiler is not None:
+            profiler.count("moves", ant_count)
+        current = next_idx
+        
+    return paths, backend.tour_cost(distance, paths)
@@ -8,6 +8,23 @@ import numpy as np
 def euclidean_distance(node_first, node_second):
     return np.round(np.sqrt((node_first.x - node_second.x)**2 + (node_first.y - node_second.y)**2), 3)
 
+def euclidean_distance_matrix(coords_first, coords_second):
+    """compute the euclidean distances between all pairs of points at once (rounded the same way as `euclidean_distance`)
+    
+    :param np.ndarray coords_first: array of shape (M,2) with x,y coordinates
+    :param np.ndarray coords_second: array of shape (N,2) with x,y coordinates
+    :return: matrix of shape (M,N) with distances
+    :rtype: np.ndarray
+    """
+    dx = coords_first[:, 0, None] - coords_second[None, :, 0]
+    dy = coords_first[:, 1, None] - coords_second[None, :, 1]
+    return np.round(np.sqrt(dx**2 + dy**2), 3)
+
+# distance functions, that have vectorized counterpart computing the whole matrix of distances
+VECTORIZED_DISTANCE_FUNCTIONS = {
+    euclidean_distance : euclidean_distance_matrix
+}
+
 def greedy_solution(world):
     """compute the greedy solution for the TSP problem
     
@@ -15,34 +32,31 @@ def greedy_solution(world):
     :return: tuple of the path cost, list of edges and list of nodes
     :rtype: `tuple[float, list[Edge], list[Node]]`
     """
-    # create the solution
-    all_nodes = list(world.nodes.values())
-    solution_nodes = [all_nodes[0]]
-    solution_edges = []
+    # create the solution (work with dense node indices)
+    node_count = len(world.node_list)
+    visited = np.zeros(node_count, dtype=bool)
+    solution_idx = [0]
     path_cost = 0
     # start from the first node
-    current_node = all_nodes[0]
+    current_idx = 0
+    visited[current_idx] = True
     # go through all nodes
-    while len(solution_nodes) < len(all_nodes):
-        next_node = None
-        next_edge = None
-        min_distance = np.inf
-        
-        # find the closest node to the current node
-        for edge in world.get_adjacent_edges(current_node):
-            neighbor = edge.node_second if edge.node_first == current_node else edge.node_first
-            if neighbor not in solution_nodes:
-                if edge.weight < min_distance:
-                    min_distance = edge.weight
-                    next_edge = edge
-                    next_node = neighbor
+    while len(solution_idx) < node_count:
+        # find the closest not visited node to the current node
+        distances = np.where(visited, np.inf, world.distance[current_idx])
+        next_idx = int(np.argmin(distances))
+        min_distance = float(distances[next_idx])
         
         # add the node to the solution
-        solution_nodes.append(next_node)
-        solution_edges.append(next_edge)
+        solution_idx.append(next_idx)
+        visited[next_idx] = True
         # update the all path cost
         path_cost += min_distance
         # move to the next node
-        current_node = next_node
-        
-    return path_cost,solution_edges,solution_nodes
\ No newline at end of file
+        current_idx = next_idx
+    
+    # create the nodes and edges view of the solution
+    solution_nodes = [world.node_list[idx] for idx in solution_idx]
+    solution_edges = [world.get_edge(solution_idx[k], solution_idx[k+1]) for k in range(node_count - 1)]
+    
+    return path_cost,solution_edges,solution_nodes
@@ -0,0 +1,270 @@
+# author: Jan Holan
+# mail: xholan11@stud.fit.vutbr.cz
+# date: 2026-10-18
+# file: aco_islands.py
+
+from acs.aco_world import Node, Edge, ACOWorld
+import acs.aco_solver as aco_solver
+import acs.aco_settings as acos
+import multiprocessing
+import numpy as np
+import time
+import sys
+
+def _island_worker(connection, world : ACOWorld, solver_kwargs : dict, seed : np.random.SeedSequence) -> None:
+    """main loop of the worker process with one colony (island), the commands are received through the pipe:
+        - ("solve", iterations, time_limit, target_cost, send_pheromone) - solve until one of the stopping criteria \
+            is met and send the best tour, number of done iterations and stop reason (and the pheromone matrix)
+        - ("migrate", tour_idx, tour_cost, pheromone, weight) - accept the migrant tour and blend the pheromone
+        - ("stop",) - end the worker
+    
+    an error of a command is sent as ("error", exception) and the worker ends
+    """
+    try:
+        solver = aco_solver.ACOSolver(_world=world, _seed=seed, **solver_kwargs)
+    except Exception as e:
+        connection.send(("error", e))
+        return
+    connection.send(("ready",))
+    
+    while True:
+        command = connection.recv()
+        try:
+            if command[0] == "solve":
+                _, iterations, time_limit, target_cost, send_pheromone = command
+                stop_reason = solver.solve(iterations, time_limit=time_limit, target_cost=target_cost)
+                pheromone = world.pheromone if send_pheromone else None
+                connection.send(("solved", solver.best_tour_idx, solver.best_tour_cost, solver.iterations_done, stop_reason, pheromone))
+            elif command[0] == "migrate":
+                _, tour_idx, tour_cost, pheromone, weight = command
+                if tour_idx is not None:
+                    solver.accept_migrant_tour(tour_idx, tour_cost)
+                if pheromone is not None:
+                    solver.blend_pheromone(pheromone, weight)
+            else:
+                break
+        except Exception as e:
+            # the parent waits for the result of the solving, so the error is sent instead
+            connection.send(("error", Exception(f"Error in island worker: {e}")))
+            break
+    connection.close()
+    
+class ACOIslandSolver:
+    """island model of the ACS - independent colonies are solved in worker processes, each with its own \
+    pheromone matrix and seed, every `migration_interval` iterations the best tour of all colonies \
+    is sent to the other colonies (migration) and the pheromone can be blended toward the mean of the colonies
+    
+    :info:
+        - the interface is the same as of the `ACOSolver` (`solve()`, `get_best_tour()`, `best_tour_*` attributes)
+        - the workers are started when the solver is created and run until `close()` is called (also at the end of a `with` statement) or the program ends
+    """
+    
+    def __init__(self, _world : ACOWorld, _workers : int, _migration_interval : int = 10, _pheromone_blend : float = 0.0, _seed : int = None, **solver_kwargs):
+        """initialize the colonies in the worker processes
+        
+        :param `ACOWorld` world: initialized world with nodes and edges
+        :param `int` workers: number of colonies (worker processes)
+        :param `int` migration_interval: number of iterations between migrations
+        :param `float` pheromone_blend: weight of the mean pheromone of all colonies blended to the pheromone \
+            of each colony on migration, 0<=pheromone_blend<=1, 0 means no blending (the matrices are not transferred)
+        :param `int` seed: seed for the colonies (each colony gets its own seed derived from it), if None, \
+            the seeds are random
+        :param solver_kwargs: parameters of the `ACOSolver` for each colony (`_alpha`, `_beta`, `_rho`, `_n`, ...)
+        
+        :raises ValueError: if the parameters are not valid (also the ones of the `ACOSolver`)
+        """
+        if (_workers < 1):
+            raise ValueError("Number of workers must be greater than 0.")
+        if (_migration_interval < 1):
+            raise ValueError("Migration interval must be greater than 0.")
+        if (_pheromone_blend > 1 or _pheromone_blend < 0):
+            raise ValueError("pheromone_blend must be in range [0,1].")
+        if solver_kwargs.get("_ant_workers", 1) > 1:
+            raise ValueError("Ant workers are not supported by the island solver (workers cannot start processes).")
+            
+        self.world = _world
+        self.workers = _workers
+        self.migration_interval = _migration_interval
+        self.pheromone_blend = _pheromone_blend
+        
+        # the profiling is not collected over the processes
+        self.profiler = None
+        
+        self.best_tour_nodes = None
+        self.best_tour_edges = None
+        self.best_tour_idx = None
+        self.best_tour_cost = float('inf')
+        # why the last `solve()` stopped and how many iterations it did
+        self.stop_reason = None
+        self.iterations_done = 0
+        
+        # start the workers, each with its own seed
+        self.__connections = []
+        self.__processes = []
+        for seed in np.random.SeedSequence(_seed).spawn(self.workers):
+            connection, worker_connection = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_island_worker,
+                args=(worker_connection, self.world, solver_kwargs, seed),
+                daemon=True
+            )
+            process.start()
+            worker_connection.close()
+            self.__connections.append(connection)
+            self.__processes.append(process)
+            
+        # wait for the colonies to be initialized, so the errors of parameters are raised here
+        for island in range(self.workers):
+            self.__receive(island)
+            
+    def __send(self, island : int, command : tuple) -> None:
+        # a dead worker has its pipe closed, all workers are stopped then
+        try:
+            self.__connections[island].send(command)
+        except OSError:
+            self.__terminate()
+            raise Exception(f"Island worker {island} ended unexpectedly (it could be killed, e.g. for lack of memory).")
+            
+    def __receive(self, island : int) -> tuple:
+        # receive the message of the worker, if the worker failed or died, all workers are stopped \
+        # and the error is raised
+        try:
+            message = self.__connections[island].recv()
+        except (EOFError, OSError):
+            message = ("error", Exception(f"Island worker {island} ended unexpectedly (it could be killed, e.g. for lack of memory)."))
+        if message[0] == "error":
+            self.__terminate()
+            raise message[1]
+        return message
+        
+    def __terminate(self) -> None:
+        # stop the workers at once, the other workers can be in the middle of solving
+        for connection in self.__connections:
+            connection.close()
+        for process in self.__processes:
+            process.terminate()
+            process.join()
+        self.__connections = []
+        self.__processes = []
+        
+
+    def solve(self, num_of_iterations : int | None = 0, time_limit : float = None, target_cost : float = None, max_stagnant_iterations : int = None) -> acos.ACOStopReason:
+        """solve the problem in all colonies, the colonies migrate every `migration_interval` iterations, \
+        until one of the stopping criteria is met (see `ACOSolver.solve()`)
+        
+        :param `int` num_of_iterations: number of iterations (of each colony), None for no limit
+        :param `float` time_limit: time limit in seconds, None for no limit
+        :param `float` target_cost: the solving stops, when any colony finds a tour with this or lower cost, None for no target
+        :param `int` max_stagnant_iterations: the solving stops after this number of iterations without improvement \
+            of the best tour of all colonies (checked after each migration interval), None for no limit
+        :return: reason why the solving stopped, it is also stored in `stop_reason` (and the number of done \
+            iterations in `iterations_done`)
+        :rtype: `acos.ACOStopReason`
+        
+        :raises ValueError: if no stopping criterion is set or the criteria are not valid
+        :raises Exception: if a worker fails or dies (all workers are stopped then)
+        """
+        if not self.__processes:
+            raise Exception("Island workers are not running (the solver is closed or a worker failed).")
+        if (num_of_iterations is None and time_limit is None and target_cost is None and max_stagnant_iterations is None):
+            raise ValueError("At least one stopping criterion must be set.")
+        if (time_limit is not None and time_limit < 0):
+            raise ValueError("time_limit cannot be negative.")
+        if (max_stagnant_iterations is not None and max_stagnant_iterations < 1):
+            raise ValueError("max_stagnant_iterations must be greater than 0.")
+            
+        deadline = time.perf_counter() + time_limit if time_limit is not None else None
+        self.stop_reason = None
+        self.iterations_done = 0
+        stagnant_iterations = 0
+        while self.stop_reason is None:
+            if target_cost is not None and self.best_tour_cost <= target_cost:
+                self.stop_reason = acos.ACOStopReason.TARGET_COST
+                break
+            if max_stagnant_iterations is not None and stagnant_iterations >= max_stagnant_iterations:
+                self.stop_reason = acos.ACOStopReason.STAGNATION
+                break
+            if num_of_iterations is not None and self.iterations_done >= num_of_iterations:
+                self.stop_reason = acos.ACOStopReason.ITERATIONS
+                break
+            remaining = deadline - time.perf_counter() if deadline is not None else None
+            if remaining is not None and remaining <= 0:
+                self.stop_reason = acos.ACOStopReason.TIME_LIMIT
+                break
+                
+            iterations = self.migration_interval
+            if num_of_iterations is not None:
+                iterations = min(iterations, num_of_iterations - self.iterations_done)
+            send_pheromone = self.pheromone_blend > 0
+            for island in range(self.workers):
+                self.__send(island, ("solve", iterations, remaining, target_cost, send_pheromone))
+            results = [self.__receive(island) for island in range(self.workers)]
+            # the colonies can stop earlier (time limit, target cost), the slowest one is counted
+            self.iterations_done += max(result[3] for result in results)
+            
+            # find the best colony
+            best_island = min(range(self.workers), key=lambda island: results[island][2])
+            _, tour_idx, tour_cost, _, _, _ = results[best_island]
+            if tour_cost < self.best_tour_cost:
+                self.__save_best_tour(tour_idx, tour_cost)
+                stagnant_iterations = 0
+            else:
+                stagnant_iterations += iterations
+            if acos.VERBOSE:
+                print('Best island:', best_island, tour_cost, file=sys.stderr)
+                
+            if any(result[4] == acos.ACOStopReason.TIME_LIMIT for result in results):
+                self.stop_reason = acos.ACOStopReason.TIME_LIMIT
+                break
+            if (target_cost is not None and self.best_tour_cost <= target_cost) or \
+                (num_of_iterations is not None and self.iterations_done >= num_of_iterations):
+                # no migration after the last iterations
+                continue
+            mean_pheromone = np.mean([result[5] for result in results], axis=0) if send_pheromone else None
+            for island in range(self.workers):
+                # the best colony already has the tour
+                migrant = (None, None) if island == best_island else (tour_idx, tour_cost)
+                self.__send(island, ("migrate", *migrant, mean_pheromone, self.pheromone_blend))
+        return self.stop_reason
+        
+    def close(self) -> None:
+        """stop the worker processes"""
+        for connection in self.__connections:
+            try:
+                connection.send(("stop",))
+                connection.close()
+            except OSError:
+                pass
+        for process in self.__processes:
+            process.join()
+        self.__connections = []
+        self.__processes = []
+        
+    def __enter__(self) -> "ACOIslandSolver":
+        return self
+        
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+        
+    def __save_best_tour(self, tour_idx : list[int], tour_cost : float) -> None:
+        # save the best tour so far (with nodes and edges view)
+        self.best_tour_idx = tour_idx
+        self.best_tour_nodes = [self.world.node_list[idx] for idx in tour_idx]
+        path = tour_idx + tour_idx[:1]
+        self.best_tour_edges = [self.world.get_edge(path[k], path[k+1]) for k in range(len(tour_idx))] if len(tour_idx) > 1 else []
+        self.best_tour_cost = tour_cost
+        
+    def get_best_tour(self) -> tuple[list[Node], list[Edge], float]:
+        """get the best tour found by all colonies
+        
+        :return: tuple of nodes, edges and cost of the best tour
+        :rtype: tuple[list[Node], list[Edge], float]
+        """
+        return (self.best_tour_nodes, self.best_tour_edges, self.best_tour_cost)
+        
+    def stats(self) -> None:
+        """the profiling is not supported by the island solver
+        
+        :rtype: None
+        """
+        return None
@@ -0,0 +1,224 @@
+# author: Jan Holan
+# mail: xholan11@stud.fit.vutbr.cz
+# date: 2026-10-18
+# file: aco_local_search.py
+
+import numpy as np
+import time
+
+# supported local search methods (names used by the solver and command line):
+#   "2opt" - 2-opt moves (replace two edges by two other edges)
+#   "oropt" - Or-opt moves (move a segment of 1-3 nodes elsewhere in the tour, in the same orientation)
+#   "3opt" - restricted 3-opt - 2-opt moves and segment insertion moves (Or-opt moves, where the segment \
+#       can be also inserted reversed)
+LOCAL_SEARCH_METHODS = ("2opt", "oropt", "3opt")
+# number of nearest nodes tried as the new neighbour of a node in one move
+NEIGHBOURS = 10
+# maximal number of nodes of the segment moved by Or-opt / segment insertion move
+MAX_SEGMENT_LENGTH = 3
+# improvements smaller than this are ignored (rounding errors could cause endless cycling)
+EPSILON = 1e-9
+
+class _Tour:
+    """tour kept in an array with positions of the nodes, with the queue of nodes with don't-look bit off"""
+    
+    def __init__(self, path : list[int]):
+        self.nodes = list(path)
+        self.size = len(self.nodes)
+        self.position = [0] * self.size
+        for k, node in enumerate(self.nodes):
+            self.position[node] = k
+        self.active = [True] * self.size
+        self.queue = list(self.nodes)
+        
+    def next(self, node : int) -> int:
+        return self.nodes[(self.position[node] + 1) % self.size]
+        
+    def prev(self, node : int) -> int:
+        return self.nodes[self.position[node] - 1]
+        
+    def activate(self, nodes) -> None:
+        # turn off the don't-look bits of the nodes
+        for node in nodes:
+            if not self.active[node]:
+                self.active[node] = True
+                self.queue.append(node)
+                
+    def reverse(self, first : int, last : int) -> None:
+        """reverse the part of the tour between positions first and last (both included, going forward \
+        cyclically), the shorter of the part and its complement is reversed (the resulting tour is the same)
+        """
+        length = (last - first) % self.size + 1
+        if 2 * length > self.size:
+            first, last = (last + 1) % self.size, (first - 1) % self.size
+            length = self.size - length
+        nodes, position = self.nodes, self.position
+        if first + length <= self.size:
+            # no wrapping over the end of the array - reverse by slicing
+            nodes[first:first + length] = nodes[first:first + length][::-1]
+            for k in range(first, first + length):
+                position[nodes[k]] = k
+            return
+        for _ in range(length // 2):
+            nodes[first], nodes[last] = nodes[last], nodes[first]
+            position[nodes[first]] = first
+            position[nodes[last]] = last
+            first = (first + 1) % self.size
+            last = (last - 1) % self.size
+            
+    def move_segment(self, first : int, length : int, after : int, reverse : bool) -> None:
+        """move the segment of the tour starting at position first with the given length, so it follows \
+        the node at position after (outside of the segment), only the shorter part of the tour is rewritten
+        
+        :param bool reverse: if True, the segment is inserted in reversed orientation
+        """
+        nodes, position = self.nodes, self.position
+        gap = (after - first) % self.size - length + 1
+        if gap <= self.size - length - gap:
+            # segment followed by the nodes up to `after` => these nodes followed by the segment
+            start = first
+            span = [nodes[(first + k) % self.size] for k in range(length + gap)]
+            segment, rest = span[:length], span[length:]
+            span = rest + (segment[::-1] if reverse else segment)
+        else:
+            # nodes from the one following `after` up to the segment => segment followed by these nodes
+            start = (after + 1) % self.size
+            span = [nodes[(start + k) % self.size] for k in range(self.size - gap)]
+            rest, segment = span[:-length], span[-length:]
+            span = (segment[::-1] if reverse else segment) + rest
+        for k, node in enumerate(span):
+            idx = (start + k) % self.size
+            nodes[idx] = node
+            position[node] = idx
+            
+def _improve_2opt(tour : _Tour, a : int, distance : np.ndarray, neighbours : list[list[int]]) -> float:
+    """try the 2-opt moves replacing an edge of the node a (to its successor or predecessor) by an edge \
+    to one of its nearest nodes, the first improving move is done
+    
+    :return: change of the cost of the tour (negative) or 0, if no improving move was found
+    """
+    for successor in (True, False):
+        i = tour.position[a]
+        b = tour.next(a) if successor else tour.prev(a)
+        d_ab = distance[a, b]
+        for c in neighbours[a]:
+            d_ac = distance[a, c]
+            # new edge must be shorter than the removed one
+            if d_ac >= d_ab:
+                break
+            j = tour.position[c]
+            d = tour.next(c) if successor else tour.prev(c)
+            if c == b or d == a:
+                continue
+            delta = d_ac + distance[b, d] - d_ab - distance[c, d]
+            if delta < -EPSILON:
+                # a-b ... c-d => a-c ... b-d
+                if successor:
+                    tour.reverse((i + 1) % tour.size, j)
+                else:
+                    tour.reverse(i, (j - 1) % tour.size)
+                tour.activate((a, b, c, d))
+                return float(delta)
+    return 0.0
+    
+def _improve_segment(tour : _Tour, a : int, distance : np.ndarray, neighbours : list[list[int]], allow_reversed : bool) -> float:
+    """try the moves of segments (1..`MAX_SEGMENT_LENGTH` nodes) starting or ending at the node a, \
+    the segment is inserted between two neighbouring nodes, one of them must be one of the nearest \
+    nodes of the segment end, the first improving move is done
+    
+    :param bool allow_reversed: if True, the segment can be inserted also in reversed orientation
+    :return: change of the cost of the tour (negative) or 0, if no improving move was found
+    """
+    size = tour.size
+    for length in range(1, min(MAX_SEGMENT_LENGTH, size - 3) + 1):
+        # segments starting and ending at the node a
+        starts = (tour.position[a],) if length == 1 else (tour.position[a], (tour.position[a] - length + 1) % size)
+        for first in starts:
+            s1 = tour.nodes[first]
+            s2 = tour.nodes[(first + length - 1) % size]
+            p = tour.prev(s1)
+            n = tour.next(s2)
+            # gain of removing the segment and joining its neighbours
+            removal_gain = distance[p, s1] + distance[s2, n] - distance[p, n]
+            if removal_gain <= EPSILON:
+                continue
+            segment = set(tour.nodes[(first + k) % size] for k in range(length))
+            for end, other_end in ((s1, s2), (s2, s1)):
+                for c in neighbours[end]:
+                    d_c_end = distance[c, end]
+                    # new edge must be shorter than the gain of the removal
+                    if d_c_end >= removal_gain:
+                        break
+                    if c in segment:
+                        continue
+                    # c can precede or follow the segment end: u-end ... other_end-v or v-other_end ... end-u
+                    for u, v in ((c, tour.next(c)), (tour.prev(c), c)):
+                        if v in segment or u in segment:
+                            continue
+                        if u == c:
+                            insertion = d_c_end + distance[other_end, v]
+                        else:
+                            insertion = distance[u, other_end] + d_c_end
+                        delta = insertion - distance[u, v] - removal_gain
+                        if delta >= -EPSILON:
+                            continue
+                        # orientation of the inserted segment (following u): s1..s2 or s2..s1
+                        reverse = (end == s2) if u == c else (end == s1)
+                        if reverse and not allow_reversed:
+                            continue
+                        tour.move_segment(first, length, tour.position[u], reverse)
+                        tour.activate((p, n, s1, s2, u, v))
+                        return float(delta)
+    return 0.0
+    
+def local_search(method : str, path : list[int], distance : np.ndarray, neighbours : np.ndarray, deadline : float = None) -> tuple[list[int], float]:
+    """improve the tour by the local search method, until no improving move is found (or the time is up)
+    
+    :param str method: name of the method, one of `LOCAL_SEARCH_METHODS`
+    :param list[int] path: indices of the nodes of the closed tour in order
+    :param `np.ndarray` distance: distance matrix of the world
+    :param `np.ndarray` neighbours: nearest nodes of each node sorted by distance (e.g. candidate lists), \
+        only moves creating an edge to one of them are tried
+    :param float deadline: value of `time.perf_counter()` when the search stops, None for no limit
+    :return: improved tour (indices of the nodes in order) and the change of its cost (zero or negative)
+    :rtype: tuple[list[int], float]
+    
+    :info:
+        - the tour is kept in an array with positions of the nodes, so the delta of each move is computed \
+            in O(1) and only the shorter part of the tour is rewritten for the improving move
+        - don't-look bits - only nodes with changed neighbourhood are checked again (kept in the queue)
+        - the search for the new neighbour stops when the nodes are farther than the removed edge allows
+    """
+    if method not in LOCAL_SEARCH_METHODS:
+        raise ValueError(f"Unknown local search method {method}.")
+    tour = _Tour(path)
+    if tour.size < 4:
+        return tour.nodes, 0.0
+    neighbours = neighbours.tolist()
+    use_2opt = method in ("2opt", "3opt")
+    use_segment = method in ("oropt", "3opt")
+    allow_reversed = method == "3opt"
+    gain = 0.0
+    
+    while tour.queue:
+        if deadline is not None and time.perf_counter() > deadline:
+            break
+        a = tour.queue.pop()
+        tour.active[a] = False
+        delta = _improve_2opt(tour, a, distance, neighbours) if use_2opt else 0.0
+        if delta == 0.0 and use_segment:
+            delta = _improve_segment(tour, a, distance, neighbours, allow_reversed)
+        gain += delta
+    return tour.nodes, float(gain)
+    
+def two_opt(path : list[int], distance : np.ndarray, neighbours : np.ndarray, deadline : float = None) -> tuple[list[int], float]:
+    """improve the tour by 2-opt moves, see `local_search()`"""
+    return local_search("2opt", path, distance, neighbours, deadline)
+    
+def or_opt(path : list[int], distance : np.ndarray, neighbours : np.ndarray, deadline : float = None) -> tuple[list[int], float]:
+    """improve the tour by Or-opt moves, see `local_search()`"""
+    return local_search("oropt", path, distance, neighbours, deadline)
+    
+def three_opt(path : list[int], distance : np.ndarray, neighbours : np.ndarray, deadline : float = None) -> tuple[list[int], float]:
+    """improve the tour by 2-opt and segment insertion moves (restricted 3-opt), see `local_search()`"""
+    return local_search("3opt", path, distance, neighbours, deadline)
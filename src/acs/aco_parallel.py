@@ -0,0 +1,218 @@
+# author: Jan Holan
+# mail: xholan11@stud.fit.vutbr.cz
+# date: 2026-10-18
+# file: aco_parallel.py
+
+from acs.aco_world import ACOWorld
+from acs.aco_profiler import ACOProfiler
+import acs.aco_construction as acoc
+import acs.aco_backend as acob
+from multiprocessing import shared_memory
+import multiprocessing
+import numpy as np
+import weakref
+import time
+
+# arrays of the world attached by the worker process (set by the pool initializer)
+_worker_arrays : dict[str, np.ndarray] = {}
+# shared memory blocks of the worker process, they must live as long as the arrays
+_worker_blocks : list[shared_memory.SharedMemory] = []
+# compute backend of the worker process
+_worker_backend : acob.ACOBackend = None
+# event of the pool set when the solving is interrupted
+_worker_interrupted = None
+# event of the pool cleared when the solving is paused
+_worker_running = None
+
+def _attach_worker(layout : dict[str, tuple[str, tuple, str]], backend : str, interrupted, running) -> None:
+    """initializer of the worker process - attach the shared arrays of the world (done once per worker)
+    
+    :param layout: name of the shared memory block, shape and dtype for each array
+    :param backend: name of the compute backend
+    :param interrupted: `multiprocessing.Event` of the pool, the construction is cut short when it is set
+    :param running: `multiprocessing.Event` of the pool, the construction waits while it is cleared
+    """
+    global _worker_backend, _worker_interrupted, _worker_running
+    _worker_backend = acob.get_backend(backend)
+    _worker_interrupted = interrupted
+    _worker_running = running
+    for key, (name, shape, dtype) in layout.items():
+        block = shared_memory.SharedMemory(name=name)
+        _worker_blocks.append(block)
+        _worker_arrays[key] = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+        
+def _worker_stop() -> bool:
+    # checked in each step of the construction, it blocks while the pool is paused
+    _worker_running.wait()
+    return _worker_interrupted.is_set()
+    
+def _construct_tours_worker(start : np.ndarray, alpha : float, q0 : float, seed : int, profile : bool, time_left : float = None) -> tuple[np.ndarray, np.ndarray, dict] | None:
+    """construct the tours of the part of the colony on the pheromone snapshot (without local updates)
+    
+    :param `float` time_left: seconds left until the construction is cut short, None for no limit \
+        (the clocks of the processes are not compared, so the deadline is set here)
+    :return: paths, costs and counters of the ant decisions (None if not profiling), \
+        None if the construction was cut short
+    """
+    profiler = ACOProfiler() if profile else None
+    deadline = time.perf_counter() + time_left if time_left is not None else None
+    tours = acoc.construct_tours(
+        _worker_arrays["distance"],
+        _worker_arrays["pheromone"],
+        _worker_arrays["eta_beta"],
+        _worker_arrays.get("candidates"),
+        start, alpha, q0,
+        random=np.random.default_rng(seed),
+        profiler=profiler,
+        backend=_worker_backend,
+        deadline=deadline,
+        stop=_worker_stop
+    )
+    if tours is None:
+        return None
+    paths, costs = tours
+    return paths, costs, profiler.counters if profile else None
+    
+def _release_pool(pool, blocks : list[shared_memory.SharedMemory], world : ACOWorld = None, pheromone : np.ndarray = None) -> None:
+    """release the resources of the pool, which was not closed by `ACOAntPool.close()` \
+    (called when the pool is garbage collected, at exit or on error in the constructor)
+    
+    :param world, pheromone: if the world still uses the shared pheromone, it gets its own copy \
+        before the memory is unmapped
+    """
+    if pool is not None:
+        pool.terminate()
+        pool.join()
+    if world is not None and world.pheromone is pheromone:
+        world.pheromone = np.array(pheromone)
+    for block in blocks:
+        block.close()
+        block.unlink()
+            
+class ACOAntPool:
+    """pool of worker processes constructing the tours of one colony in parallel
+    
+    :info:
+        - distance, heuristic information and candidate lists are copied to shared memory once, \
+            when the pool is started, the pheromone matrix of the world is moved to shared memory, \
+            so the workers read the current pheromone without any copying per iteration
+        - the workers only read the pheromone, local updates are deferred and done by the solver \
+            after all tours are constructed (see `acs.aco_construction.local_update_tours()`)
+        - the world uses the shared pheromone until `close()` is called, then it gets its own copy back
+        - the pool can be used as a context manager, if it is not closed, the workers are terminated \
+            and the shared memory is released when the pool is garbage collected (or at exit)
+    """
+    
+    def __init__(self, world : ACOWorld, workers : int, beta : float, backend : str = "vectorized"):
+        """start the worker processes and share the arrays of the world with them
+        
+        :param `ACOWorld` world: world with initialized pheromone and candidate lists
+        :param `int` workers: number of worker processes
+        :param `float` beta: beta parameter, the heuristic information is shared already powered by beta
+        :param `str` backend: name of the compute backend of the workers
+        """
+        self.world = world
+        self.workers = workers
+        self.__blocks = []
+        
+        arrays = {
+            "distance" : world.distance,
+            "pheromone" : world.pheromone,
+            "eta_beta" : world.get_eta_beta(beta),
+        }
+        if world.candidates is not None:
+            arrays["candidates"] = world.candidates
+            
+        layout = {}
+        shared = {}
+        try:
+            for key, array in arrays.items():
+                block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+                self.__blocks.append(block)
+                shared[key] = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+                shared[key][...] = array
+                layout[key] = (block.name, array.shape, array.dtype.str)
+                
+            # set by `interrupt()`, read by the workers in each step of the construction
+            self.__interrupted = multiprocessing.Event()
+            # cleared by `pause()`, the workers wait in each step of the construction until it is set
+            self.__running = multiprocessing.Event()
+            self.__running.set()
+            self.__pool = multiprocessing.Pool(self.workers, initializer=_attach_worker, initargs=(layout, backend, self.__interrupted, self.__running))
+        except BaseException:
+            shared = None
+            _release_pool(None, self.__blocks)
+            raise
+        # the solver updates the pheromone directly in the shared memory
+        self.world.pheromone = shared["pheromone"]
+        # the finalizer must not reference the pool itself
+        self.__finalizer = weakref.finalize(self, _release_pool, self.__pool, self.__blocks, self.world, self.world.pheromone)
+        
+    def construct_tours(self, start : np.ndarray, alpha : float, q0 : float, random : np.random.Generator, profiler : ACOProfiler = None, deadline : float = None) -> tuple[np.ndarray, np.ndarray] | None:
+        """construct the tours of all ants, the ants are split to the workers in order
+        
+        :param `np.ndarray` start: indices of the starting nodes, one per ant
+        :param `float` alpha: alpha parameter, influence of pheromone on the edge
+        :param `float` q0: exploitation probability, 0<=q0<=1
+        :param `np.random.Generator` random: random generator the seeds of the workers are drawn from
+        :param `ACOProfiler` profiler: profiler the counters of the ant decisions are added to, None if not used
+        :param `float` deadline: value of `time.perf_counter()` when the construction in the workers is cut short, \
+            None for no limit
+        :return: paths (indices of the visited nodes, one row per ant) and costs of the tours, \
+            None if the construction was cut short by the deadline or by `interrupt()`
+        :rtype: tuple[np.ndarray, np.ndarray] | None
+        """
+        parts = [part for part in np.array_split(start, self.workers) if part.size > 0]
+        # seeds are drawn in the main process, so the result does not depend on the scheduling of the workers
+        seeds = random.integers(0, 2**63 - 1, len(parts))
+        time_left = deadline - time.perf_counter() if deadline is not None else None
+        results = self.__pool.starmap(
+            _construct_tours_worker,
+            [(part, alpha, q0, int(seed), profiler is not None, time_left) for part, seed in zip(parts, seeds)]
+        )
+        if any(result is None for result in results):
+            return None
+        if profiler is not None:
+            for _, _, counters in results:
+                for counter in ("exploit", "explore", "edges_evaluated"):
+                    profiler.count(counter, counters[counter])
+        return np.concatenate([paths for paths, _, _ in results]), np.concatenate([costs for _, costs, _ in results])
+        
+    def interrupt(self) -> None:
+        """cut the running construction short, it can be called from another thread \
+        (the workers return nothing until `reset_interrupt()` is called), the paused construction is resumed
+        """
+        self.__interrupted.set()
+        self.__running.set()
+        
+    def pause(self) -> None:
+        """pause the running construction in its current step, it can be called from another thread"""
+        self.__running.clear()
+        
+    def resume(self) -> None:
+        """continue the construction paused by `pause()`"""
+        self.__running.set()
+        
+    def reset_interrupt(self) -> None:
+        """allow the construction after `interrupt()`"""
+        self.__interrupted.clear()
+        
+    def close(self) -> None:
+        """stop the worker processes and release the shared memory"""
+        if self.__pool is None:
+            return
+        self.__finalizer.detach()
+        self.__pool.close()
+        self.__pool.join()
+        self.__pool = None
+        self.world.pheromone = np.array(self.world.pheromone)
+        for block in self.__blocks:
+            block.close()
+            block.unlink()
+        self.__blocks = []
+        
+    def __enter__(self) -> "ACOAntPool":
+        return self
+        
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -0,0 +1,73 @@
+# author: Jan Holan
+# mail: xholan11@stud.fit.vutbr.cz
+# date: 2026-10-18
+# file: aco_profiler.py
+
+import time
+
+class ACOProfiler:
+    """collects the time spent in the phases of the ACS iteration and counters of the ant decisions
+    
+    :info:
+        - the solver creates the profiler only if the profiling is enabled, otherwise there are no calls to it
+    """
+    # phases of one iteration, in order of their execution
+    PHASES = ("reset_ants", "construction", "local_update", "local_search", "sort_ants", "global_update")
+    # counters of the ant decisions
+    COUNTERS = ("moves", "edges_evaluated", "exploit", "explore")
+    
+    def __init__(self):
+        self.iterations = 0
+        self.phase_times = {phase : 0.0 for phase in self.PHASES}
+        self.phase_calls = {phase : 0 for phase in self.PHASES}
+        self.counters = {counter : 0 for counter in self.COUNTERS}
+        
+    def add_time(self, phase : str, seconds : float) -> None:
+        """add the time spent in the phase"""
+        self.phase_times[phase] += seconds
+        self.phase_calls[phase] += 1
+        
+    def count(self, counter : str, value : int = 1) -> None:
+        """increase the counter by the value"""
+        self.counters[counter] += value
+        
+    def timed(self, phase : str, function):
+        """wrap the function, so the time spent in it is added to the phase
+        
+        :return: wrapped function
+        """
+        def timed_function(*args, **kwargs):
+            start = time.perf_counter()
+            result = function(*args, **kwargs)
+            self.add_time(phase, time.perf_counter() - start)
+            return result
+        return timed_function
+        
+    def stats(self) -> dict:
+        """get the collected statistics
+        
+        :return: dictionary with the number of iterations, time and number of calls of each phase and the counters
+        :rtype: dict
+        """
+        return {
+            "iterations" : self.iterations,
+            "phases" : {
+                phase : {"time_s" : self.phase_times[phase], "calls" : self.phase_calls[phase]} for phase in self.PHASES
+            },
+            "counters" : dict(self.counters),
+        }
+        
+    def report(self) -> str:
+        """get the human readable per-phase breakdown of the collected statistics
+        
+        :rtype: str
+        """
+        total = sum(self.phase_times.values())
+        lines = [f"Iterations: {self.iterations}"]
+        for phase in self.PHASES:
+            share = 100 * self.phase_times[phase] / total if total > 0 else 0
+            lines.append(f"{phase:>15}: {self.phase_times[phase]:10.4f} s {share:6.2f} % ({self.phase_calls[phase]} calls)")
+        lines.append(f"{'total':>15}: {total:10.4f} s")
+        for counter in self.COUNTERS:
+            lines.append(f"{counter:>15}: {self.counters[counter]}")
+        return "\n".join(lines)
@@ -4,9 +4,24 @@
 # file: aco_settings.py
 
 from enum import Enum
+from typing import NamedTuple
 # set verbose
-class ACS2GUIMessage(Enum):
-    GLOBAL_PHEROMONE_UPDATE_DONE = 1
+# reason why the solving stopped
+class ACOStopReason(Enum):
+    ITERATIONS = "iterations"
+    TIME_LIMIT = "time_limit"
+    TARGET_COST = "target_cost"
+    STAGNATION = "stagnation"
+    INTERRUPTED = "interrupted"
+    
+# progress of the solving after one iteration (see `ACOSolver.solve_iter()`)
+class ACOIterationRecord(NamedTuple):
+    iteration : int # index of the iteration (from 0)
+    iteration_best_cost : float # cost of the best tour of the iteration
+    best_tour_cost : float # cost of the best tour so far
+    elapsed : float # time since the start of the solving in seconds
+    min_pheromone : float # minimal pheromone value after the global update
+    max_pheromone : float # maximal pheromone value after the global update
     
 global VERBOSE
 VERBOSE = False
\ No newline at end of file
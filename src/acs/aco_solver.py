@@ -5,14 +5,22 @@
 
 from acs.aco_world import Node, Edge, ACOWorld
 from acs.aco_ant import Ant
+from acs.aco_profiler import ACOProfiler
+import acs.aco_construction as acoc
+import acs.aco_local_search as acols
+import acs.aco_backend as acob
+import acs.aco_checkpoint as acock
 import acs.aco_settings as acos
+from typing import Iterator
+import numpy as np
+import threading
+import time
 import sys
 
 class ACOSolver:
     ant_colony : list[Ant] = []
-    GUIACTIVE : bool = False
     
-    def __init__(self, _world : ACOWorld, _alpha : float, _beta : float, _rho : float, _n : int, _tau0 : str | float = 0.01, _Q : float = 1, _q0 : float = 0.5, _alpha_decay : float = 0.1, _start_node_id : int =None,_gui_controller = None):
+    def __init__(self, _world : ACOWorld, _alpha : float, _beta : float, _rho : float, _n : int, _tau0 : str | float = 0.01, _Q : float = 1, _q0 : float = 0.5, _alpha_decay : float = 0.1, _start_node_id : int =None, _batched : bool = False, _global_update : str = "all", _candidates : int = None, _profile : bool = False, _ant_workers : int = 1, _local_search : str = None, _local_search_time : float = None, _backend : str = "vectorized", _seed : int | np.random.SeedSequence = None, _pheromone : np.ndarray = None):
         """initialize the solver with parameters for the ACO algorithm - ACS
         
         :param `ACOWorld` world: initialized world with nodes and edges
@@ -27,6 +35,29 @@ class ACOSolver:
             the pheromone will be set to 1/[n*(greedy solution)]; \n
             if :type:`float`, then the pheromone will be set to this value
         :param `int` start_node_id: id of the node where the ants will start, if None, no node will be set explicitly
+        :param `bool` batched: if True, the tours of all ants are constructed at once, step by step, \
+            with vectorized operations over the whole colony
+        :param `str` global_update: "all" - pheromone evaporates on all edges and is added to the edges of the best tour; \
+            "best_tour" - evaporation and deposit are done only on the edges of the best tour (as in the original ACS paper)
+        :param `int` candidates: size of the candidate lists (nearest nodes) the ants choose from first, \
+            if None, the ants choose from all not visited nodes
+        :param `bool` profile: if True, time spent in the phases of iterations and counters of ant decisions \
+            are collected, see `stats()`
+        :param `int` ant_workers: number of worker processes constructing the tours of the ants, if greater than 1, \
+            the tours are constructed in parallel on the pheromone shared with the workers and the local updates \
+            are done after the construction (call `close()` or use the solver in a `with` statement to stop the workers)
+        :param `str` local_search: local search method applied to the tour of each ant before the global update, \
+            "2opt", "oropt", "3opt" (see `acs.aco_local_search`) or None (no local search)
+        :param `float` local_search_time: time budget (seconds) of the local search in one iteration, \
+            the ants not improved within it keep their tours, if None, the time is not limited
+        :param `str` backend: compute backend of the kernels (choice info, next node selection, pheromone updates, \
+            tour cost), "vectorized" (NumPy) or "reference" (pure Python, slow), both give the same tours; \
+            the kernels are used by all kinds of the construction (the `Ant` objects, batched, parallel) \
+            and by the pheromone updates
+        :param `int`|`np.random.SeedSequence` seed: seed of the random generators of the solver and the ants, \
+            the runs with the same seed (and parameters) are identical, if None, the seed is random
+        :param `np.ndarray` pheromone: initial pheromone matrix (e.g. from the checkpoint), if set, tau0 must be \
+            a number and it is used only for the local updates, if None, the pheromone is initialized by tau0
         """
         self.world = _world
         
@@ -56,43 +87,125 @@ class ACOSolver:
             raise ValueError(f"Node with id {_start_node_id} does not exist in the world.")
         self.start_node_id = _start_node_id
         
-        self.gui_controller = _gui_controller
-        self.GUIACTIVE = False if self.gui_controller is None else True
+        self.batched = _batched
+        
+        if (_global_update not in ("all", "best_tour")):
+            raise ValueError("global_update must be 'all' or 'best_tour'.")
+        self.global_update = _global_update
+        
+        if (_candidates is not None and _candidates < 1):
+            raise ValueError("Number of candidates must be greater than 0.")
+        self.candidates = _candidates
+        self.world.init_candidates(_candidates)
+        
+        self.profiler = ACOProfiler() if _profile else None
+        
+        self.backend = acob.get_backend(_backend)
+        
+        # random generator of the solver (start nodes, batched construction), the ants get their own \
+        # generators spawned from the same seed
+        self.seed_sequence = _seed if isinstance(_seed, np.random.SeedSequence) else np.random.SeedSequence(_seed)
+        self.random = np.random.default_rng(self.seed_sequence)
+        
+        if (_ant_workers < 1):
+            raise ValueError("Number of ant workers must be greater than 0.")
+        self.ant_workers = _ant_workers
+        
+        if (_local_search is not None and _local_search not in acols.LOCAL_SEARCH_METHODS):
+            raise ValueError(f"local_search must be one of {', '.join(acols.LOCAL_SEARCH_METHODS)} or None.")
+        self.local_search = _local_search
+        if (_local_search_time is not None and _local_search_time <= 0):
+            raise ValueError("local_search_time must be greater than 0.")
+        self.local_search_time = _local_search_time
+        # nearest nodes tried by the local search moves
+        self.__local_search_neighbours = self.world.get_nearest_nodes(acols.NEIGHBOURS) if _local_search is not None else None
         
         self.best_tour_nodes = None
         self.best_tour_edges = None
+        self.best_tour_idx = None
         self.best_tour_cost = float('inf')
         
-        self.tau0 = self.world.init_pheromone(_tau0)
+        # why the last `solve()` stopped and how many iterations it did
+        self.stop_reason = None
+        self.iterations_done = 0
+        # number of iterations done by the solver over all `solve()` calls (kept in checkpoints)
+        self.iteration = 0
+        # value of `time.perf_counter()` when the running `solve()` has to stop, None for no limit
+        self.__deadline = None
+        # set by `interrupt()`, the running `solve()` stops as soon as possible
+        self.__interrupted = False
+        # cleared by `pause()`, the running `solve()` waits in the next step of the construction until it is set
+        self.__running = threading.Event()
+        self.__running.set()
+        # edges and their pheromone before the local updates of the running sequential construction
+        self.__undo_log = []
+        # generator of the iterations for `solve_one_step()`
+        self.__steps = None
+        
+        if _pheromone is None:
+            self.tau0 = self.world.init_pheromone(_tau0)
+        else:
+            np.copyto(self.world.pheromone, _pheromone)
+            self.tau0 = float(_tau0)
+        
+        # bounds of the pheromone values, local update always results in a value between the old value and tau0, \
+        # so the bounds have to be updated only by the global update
+        edge_mask = np.isfinite(self.world.distance)
+        initial_pheromone = self.world.pheromone[edge_mask]
+        self.min_pheromone = min(float(initial_pheromone.min()), self.tau0) if edge_mask.any() else self.tau0
+        self.max_pheromone = max(float(initial_pheromone.max()), self.tau0) if edge_mask.any() else self.tau0
+        
+        # start the workers, when the world is fully initialized (multiprocessing is loaded only for them)
+        self.__ant_pool = None
+        if self.ant_workers > 1:
+            from acs.aco_parallel import ACOAntPool
+            self.__ant_pool = ACOAntPool(self.world, self.ant_workers, self.beta, self.backend.name)
+        
+    def __get_start_nodes(self) -> list[int]:
+        # choose the start node for each ant according to the preferences (random nodes are drawn at once)
+        if self.start_node_id is not None:
+            return [self.world.node_index[self.start_node_id]] * self.n
+        return self.random.integers(0, len(self.world.node_list), self.n).tolist()
         
     def __create_ants(self) -> None:
-        # create the ants with world object instance and id
+        # create the ants with world object instance and id, each with its own random generator
         # and set the starting node for each ant
         self.ant_colony = []
-        for ant_id in range(self.n):
-            # choose the start node according to the preferences
-            if self.start_node_id is not None:
-                ant_start_node = self.world.nodes[self.start_node_id]
-            else:
-                ant_start_node = self.world.get_random_node()
-            # create the ant
-            self.ant_colony.append(Ant(self.world,ant_id,ant_start_node))
-    
+        ant_seeds = self.seed_sequence.spawn(self.n)
+        for ant_id, ant_start_node_idx in enumerate(self.__get_start_nodes()):
+            # create the ant (with profiler, if the profiling is enabled)
+            ant = Ant(self.world,ant_id,ant_start_node_idx,np.random.default_rng(ant_seeds[ant_id]),self.backend)
+            ant.profiler = self.profiler
+            self.ant_colony.append(ant)
+            
     def __reset_ants(self) -> None:
         # reset the ants - set the starting node for each ant
-        for ant in self.ant_colony:
-            # choose the start node according to the preferences
-            if self.start_node_id is not None:
-                ant_start_node = self.world.nodes[self.start_node_id]
-            else:
-                ant_start_node = self.world.get_random_node()
-            # reset the ant
-            ant.reset(ant_start_node)
-       
-    def __do_ants_solutions(self) -> list[Ant]:
+        for ant, ant_start_node_idx in zip(self.ant_colony, self.__get_start_nodes()):
+            ant.reset(ant_start_node_idx)
+            
+    def __do_ants_solutions(self) -> list[Ant] | None:
+        """construct the tours of all ants
+        
+        :return: the ants with finished tours, None if the construction was cut short by the deadline of `solve()` \
+            or by `interrupt()`, the pheromone is then left as it was before the construction in all kinds of the construction
+        """
+        if self.__ant_pool is not None:
+            return self.__do_ants_solutions_parallel()
+        if self.batched:
+            return self.__do_ants_solutions_batched()
+            
+        local_update_pheromones = self.__local_update_pheromones
+        # pheromone before the local updates, they are undone if the construction is cut short
+        self.__undo_log = []
+        if self.profiler is not None:
+            local_update_pheromones = self.profiler.timed("local_update", local_update_pheromones)
+            
         # create the solution for each ant
         finished_ants = 0 # the number of ants that have finished their path-finding
         while finished_ants < len(self.ant_colony):
+            if self.__cut_short():
+                acoc.undo_local_updates(self.world.pheromone, self.__undo_log)
+                return None
             for ant in self.ant_colony:
                 # if the ant has finished its path-finding, return him to its starting position
                 if not ant.can_move():
@@ -103,39 +216,147 @@ class ACOSolver:
                         # if the ant has not returned to the starting position, move it to the starting position
                         ant.do_final_move_to_start()
                         # update pheromone locally
-                        self.__local_update_pheromones(ant)
+                        local_update_pheromones(ant)
                         finished_ants += 1
                         continue
                 else:
                     # move the ant to the next node
                     ant.do_next_move_ACS(self.q0, self.alpha, self.beta)
                     # update pheromone locally
-                    self.__local_update_pheromones(ant)
+                    local_update_pheromones(ant)
                     # if the ant cannot move anymore after the current move, increment the finished_ants
                     if not ant.can_move() and ant.ant_has_returned_to_start():
                         finished_ants += 1
+                        
+        return self.ant_colony
+        
+    def __do_ants_solutions_batched(self) -> list[Ant] | None:
+        """construct the tours of all ants at once, in each step all ants move by one node \
+        (see `acs.aco_construction.construct_tours()`)
+        """
+        tours = acoc.construct_tours(
+            self.world.distance,
+            self.world.pheromone,
+            self.world.get_eta_beta(self.beta),
+            self.world.candidates,
+            np.array([ant.current_idx for ant in self.ant_colony]),
+            self.alpha,
+            self.q0,
+            rho=self.rho,
+            tau0=self.tau0,
+            random=self.random,
+            profiler=self.profiler,
+            backend=self.backend,
+            deadline=self.__deadline,
+            stop=self.__is_interrupted
+        )
+        if tours is None:
+            return None
+        paths, costs = tours
+        
+        # store the tours to the ants
+        for ant_idx, ant in enumerate(self.ant_colony):
+            ant.set_finished_tour(paths[ant_idx].tolist(), float(costs[ant_idx]))
+            
+        return self.ant_colony
+        
+    def __do_ants_solutions_parallel(self) -> list[Ant] | None:
+        """construct the tours of the ants in the worker processes on the current pheromone, \
+        the local updates are done after all tours are constructed, in the order of the ants and their steps
+        """
+        tours = self.__ant_pool.construct_tours(
+            np.array([ant.current_idx for ant in self.ant_colony]),
+            self.alpha,
+            self.q0,
+            self.random,
+            self.profiler,
+            deadline=self.__deadline
+        )
+        if tours is None:
+            return None
+        paths, costs = tours
+        
+        if self.profiler is not None:
+            local_update_start = time.perf_counter()
+        acoc.local_update_tours(self.world.pheromone, paths, self.rho, self.tau0, self.backend)
+        if self.profiler is not None:
+            self.profiler.add_time("local_update", time.perf_counter() - local_update_start)
+            self.profiler.count("moves", paths.size)
             
+        # store the tours to the ants
+        for ant_idx, ant in enumerate(self.ant_colony):
+            ant.set_finished_tour(paths[ant_idx].tolist(), float(costs[ant_idx]))
+            
+        return self.ant_colony
+        
+    def __do_local_search(self, ants : list[Ant]) -> list[Ant]:
+        # improve the tour of each ant by the local search
+        if self.local_search is None or self.__local_search_neighbours is None:
+            return ants
+        deadline = time.perf_counter() + self.local_search_time if self.local_search_time is not None else None
+        if self.__deadline is not None:
+            deadline = min(deadline, self.__deadline) if deadline is not None else self.__deadline
+        for ant in ants:
+            self.__running.wait()
+            if self.__interrupted or (deadline is not None and time.perf_counter() > deadline):
+                break
+            path, gain = acols.local_search(self.local_search, ant.visited_idx, self.world.distance, self.__local_search_neighbours, deadline)
+            if gain < 0:
+                ant.set_finished_tour(path, ant.tour_cost + gain)
+        return ants
+        
+    def __sort_ants(self, ants : list[Ant]) -> list[Ant]:
         # return the list of ants according to the total tour length
-        return sorted(self.ant_colony, key=lambda ant: ant.tour_cost)
+        return sorted(ants, key=lambda ant: ant.tour_cost)
         
     def __global_update_pheromones(self, ant : Ant) -> tuple[float,float]:
         """update the pheromone on trails
         
         :param `Ant` ant: the best ant that found the shortest path
+        :return: minimal and maximal pheromone value on the edges (for "best_tour" global update \
+            they are the bounds of the values)
         """
-        current_min_pheromone = float('inf')
-        current_max_pheromone = float('-inf')
-        for edge in self.world.edges:
-            ant_contribution = 0
-            if edge in ant.tour:
-                ant_contribution = self.Q / ant.tour_cost
-            # update the pheromone on the edge
-            edge.pheromone = (1 - self.alpha_decay) * edge.pheromone + ant_contribution
-            current_max_pheromone = max(current_max_pheromone, edge.pheromone)
-            current_min_pheromone = min(current_min_pheromone, edge.pheromone)
+        if self.global_update == "best_tour":
+            return self.__global_update_pheromones_best_tour(ant)
+            
+        pheromone = self.world.pheromone
+        edge_mask = np.isfinite(self.world.distance)
+        if ant.visited_idx != []:
+            # evaporate the pheromone on all edges and add the contribution of the ant on the edges of its tour
+            self.backend.global_update(pheromone, ant.visited_idx, ant.tour_cost, self.alpha_decay, self.Q, True)
+        else:
+            pheromone *= (1 - self.alpha_decay)
+            
+        if (not edge_mask.any()):
+            return (float('inf'), float('-inf'))
+        self.min_pheromone = float(pheromone[edge_mask].min())
+        self.max_pheromone = float(pheromone[edge_mask].max())
+        return (self.min_pheromone, self.max_pheromone)
+        
+    def __global_update_pheromones_best_tour(self, ant : Ant) -> tuple[float,float]:
+        """update the pheromone only on the edges of the tour of the best ant - both evaporation \
+        and deposit, so the update is O(N)
         
-        return (current_min_pheromone, current_max_pheromone)
+        :param `Ant` ant: the best ant that found the shortest path
+        """
+        return self.__update_tour_pheromones(ant.visited_idx, ant.tour_cost)
+        
+    def __update_tour_pheromones(self, tour_idx : list[int], tour_cost : float) -> tuple[float,float]:
+        """evaporate and deposit the pheromone on the edges of the closed tour
+        
+        :param `list[int]` tour_idx: indices of the nodes of the tour in order
+        :param `float` tour_cost: cost of the tour
+        """
+        if len(tour_idx) == 0:
+            return (self.min_pheromone, self.max_pheromone)
             
+        updated = self.backend.global_update(self.world.pheromone, tour_idx, tour_cost, self.alpha_decay, self.Q, False)
+        
+        # update the bounds of the pheromone values
+        self.min_pheromone = min(self.min_pheromone, float(updated.min()))
+        self.max_pheromone = max(self.max_pheromone, float(updated.max()))
+        return (self.min_pheromone, self.max_pheromone)
+        
     def __local_update_pheromones(self, ant : Ant) -> None:
         """update the pheromone on last added edge in the tour of ant
         
@@ -143,11 +364,42 @@ class ACOSolver:
         """
         # delta tau is set to t0 (initial pheromone value)
         # or it can be just 0
-        ant.tour[-1].pheromone = max(
-            (1 - self.rho) * ant.tour[-1].pheromone + self.rho * self.tau0,
-            self.tau0
-        )
-    
+        idx_from, idx_to = np.array([ant.last_move[0]]), np.array([ant.last_move[1]])
+        self.__undo_log.append((idx_from, idx_to, self.world.pheromone[idx_from, idx_to]))
+        self.backend.local_update(self.world.pheromone, idx_from, idx_to, self.rho, self.tau0)
+        
+    def accept_migrant_tour(self, tour_idx : list[int], tour_cost : float) -> None:
+        """accept the tour found by other colony - it becomes the best tour, if it is better \
+        than the best tour so far, and the pheromone is deposited on its edges (as by the global update)
+        
+        :param `list[int]` tour_idx: indices of the nodes of the tour in order
+        :param `float` tour_cost: cost of the tour
+        """
+        if tour_cost < self.best_tour_cost:
+            self.__save_best_tour(list(tour_idx), tour_cost)
+        self.__update_tour_pheromones(tour_idx, tour_cost)
+        
+    def blend_pheromone(self, pheromone : np.ndarray, weight : float) -> None:
+        """blend the pheromone of the world with the given pheromone matrix (e.g. of other colonies)
+        
+        :param `np.ndarray` pheromone: pheromone matrix of the same shape as the world's one
+        :param `float` weight: weight of the given matrix, 0<=weight<=1
+        """
+        self.world.pheromone *= (1 - weight)
+        self.world.pheromone += weight * pheromone
+        edge_mask = np.isfinite(self.world.distance)
+        if edge_mask.any():
+            self.min_pheromone = float(self.world.pheromone[edge_mask].min())
+            self.max_pheromone = float(self.world.pheromone[edge_mask].max())
+            
+    def __save_best_tour(self, tour_idx : list[int], tour_cost : float) -> None:
+        # save the best tour so far (with nodes and edges view)
+        self.best_tour_idx = tour_idx
+        self.best_tour_nodes = [self.world.node_list[idx] for idx in tour_idx]
+        path = tour_idx + tour_idx[:1]
+        self.best_tour_edges = [self.world.get_edge(path[k], path[k+1]) for k in range(len(tour_idx))] if len(tour_idx) > 1 else []
+        self.best_tour_cost = tour_cost
+        
     def get_best_tour(self) -> tuple[list[Node], list[Edge], float]:
         """get the best tour found by the ACO algorithm
         
@@ -155,61 +407,337 @@ class ACOSolver:
         :rtype: tuple[list[Node], list[Edge], float]
         """
         return (self.best_tour_nodes, self.best_tour_edges, self.best_tour_cost)
-    
-    def solve(self, num_of_iterations : int = 0) -> None:
-        """solve the problem with the ACO algorithm - ACS and defined number of steps
-            this methods handles whole process
-        :param `int` num_of_iterations: number of iterations
+        
+    def save_checkpoint(self, path : str) -> None:
+        """save the state of the solver to the checkpoint file, so the solving can be continued with the same \
+        results as without the interruption (see `load_checkpoint()`), it is meant to be called between iterations
+        
+        :param str path: path to the checkpoint file, the file is replaced atomically
+        
+        :info:
+            - the checkpoint holds the pheromone matrix, best tour, iteration counter, states of all random \
+                generators and parameters of the algorithm
+            - the world (nodes, distances) is not stored, only the ids of the nodes to check it on load
+            
+        :raises Exception: if the file cannot be written
         """
-        self.__create_ants()
+        header = {
+            "parameters" : {
+                "_alpha" : self.alpha,
+                "_beta" : self.beta,
+                "_rho" : self.rho,
+                "_n" : self.n,
+                "_Q" : self.Q,
+                "_q0" : self.q0,
+                "_alpha_decay" : self.alpha_decay,
+                "_start_node_id" : self.start_node_id,
+                "_batched" : self.batched,
+                "_global_update" : self.global_update,
+                "_candidates" : self.candidates,
+                "_local_search" : self.local_search,
+                "_local_search_time" : self.local_search_time,
+                "_backend" : self.backend.name,
+            },
+            "tau0" : self.tau0,
+            "min_pheromone" : self.min_pheromone,
+            "max_pheromone" : self.max_pheromone,
+            "best_tour_cost" : float(self.best_tour_cost),
+            "iteration" : self.iteration,
+            "seed_sequence" : {
+                "entropy" : self.seed_sequence.entropy,
+                "spawn_key" : list(self.seed_sequence.spawn_key),
+                "pool_size" : self.seed_sequence.pool_size,
+                "n_children_spawned" : self.seed_sequence.n_children_spawned,
+            },
+            "random" : self.random.bit_generator.state,
+            "ants" : [ant.random.bit_generator.state for ant in self.ant_colony],
+        }
+        arrays = {
+            "node_ids" : np.array([node.id for node in self.world.node_list], dtype=np.int64),
+            "best_tour" : np.array(self.best_tour_idx if self.best_tour_idx is not None else [], dtype=np.int64),
+            "pheromone" : self.world.pheromone,
+        }
+        acock.write_checkpoint(path, header, arrays)
+        
+    @classmethod
+    def load_checkpoint(cls, path : str, _world : ACOWorld, _profile : bool = False, _ant_workers : int = 1) -> "ACOSolver":
+        """create the solver from the checkpoint file saved by `save_checkpoint()`, the solving continues \
+        from the saved iteration with the same results as without the interruption
+        
+        :param str path: path to the checkpoint file
+        :param `ACOWorld` world: world the checkpoint was saved for (built from the same input files)
+        :param profile, ant_workers: see `__init__()`, they do not influence the results, \
+            so they are not stored in the checkpoint
+        :return: the solver with the restored state
+        :rtype: ACOSolver
+        
+        :info:
+            - the parameters of the algorithm are taken from the checkpoint
+            - the pheromone matrix is memory mapped and copied to the world, the greedy tour \
+                (for the initial pheromone) is not computed again
+                
+        :raises Exception: if the file is not a valid checkpoint or it was saved for another world
+        """
+        state, arrays = acock.read_checkpoint(path)
+        node_ids = np.array([node.id for node in _world.node_list], dtype=np.int64)
+        if not np.array_equal(arrays["node_ids"], node_ids):
+            raise Exception(f"Checkpoint {path} was saved for another world.")
             
-        for _ in range(num_of_iterations):
-            self.__reset_ants()
-            sorted_ants = self.__do_ants_solutions()
-            if acos.VERBOSE:
-                print('Best ant:', sorted_ants[0].tour_cost, file=sys.stderr)
+        seed_sequence = np.random.SeedSequence(
+            state["seed_sequence"]["entropy"],
+            spawn_key=tuple(state["seed_sequence"]["spawn_key"]),
+            pool_size=state["seed_sequence"]["pool_size"],
+            n_children_spawned=state["seed_sequence"]["n_children_spawned"]
+        )
+        solver = cls(
+            _world=_world,
+            _tau0=state["tau0"],
+            _profile=_profile,
+            _ant_workers=_ant_workers,
+            _seed=seed_sequence,
+            _pheromone=arrays["pheromone"],
+            **state["parameters"]
+        )
+        
+        solver.min_pheromone = state["min_pheromone"]
+        solver.max_pheromone = state["max_pheromone"]
+        solver.iteration = state["iteration"]
+        if arrays["best_tour"].size > 0:
+            solver.__save_best_tour(arrays["best_tour"].tolist(), state["best_tour_cost"])
+        solver.random.bit_generator.state = state["random"]
+        
+        # the ants draw their random numbers at the start of each iteration, so only the generators are restored
+        solver.ant_colony = []
+        for ant_id, ant_state in enumerate(state["ants"]):
+            ant = Ant(solver.world, ant_id, 0, np.random.default_rng(), solver.backend)
+            ant.random.bit_generator.state = ant_state
+            ant.profiler = solver.profiler
+            solver.ant_colony.append(ant)
+        return solver
+        
+    def close(self) -> None:
+        """stop the worker processes constructing the tours (if any), the solver can still be used \
+        afterwards, but without them
+        """
+        if self.__ant_pool is not None:
+            self.__ant_pool.close()
+            self.__ant_pool = None
             
+    def __enter__(self) -> "ACOSolver":
+        return self
+        
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        # the worker processes and the shared memory are released also on error
+        self.close()
+        
+    def stats(self) -> dict | None:
+        """get the statistics collected by profiling (time spent in phases of iterations, counters of ant decisions)
+        
+        :return: dictionary with the statistics, None if the profiling is not enabled
+        :rtype: dict | None
+        """
+        return self.profiler.stats() if self.profiler is not None else None
+        
+    def __do_iteration(self) -> tuple[list[Ant], float, float] | None:
+        """do one iteration of the ACS - construct the tours of all ants, update pheromones and save the best tour
+        
+        :return: ants sorted by their tour cost, minimal and maximal pheromone value after the global update, \
+            None if the iteration was cut short by the deadline (the global update is not done then)
+        :rtype: tuple[list[Ant], float, float] | None
+        """
+        if self.profiler is None:
+            self.__reset_ants()
+            ants = self.__do_ants_solutions()
+            if ants is None:
+                return None
+            sorted_ants = self.__sort_ants(self.__do_local_search(ants))
             # update pheromones for each path, but add pheromone only to those walked by the best ant
-            self.__global_update_pheromones(sorted_ants[0])
+            min_pheromone, max_pheromone = self.__global_update_pheromones(sorted_ants[0])
+        else:
+            start = time.perf_counter()
+            self.__reset_ants()
+            self.profiler.add_time("reset_ants", time.perf_counter() - start)
             
-            # save the best tour so far
-            if sorted_ants[0].tour_cost < self.best_tour_cost:
-                self.best_tour_nodes = sorted_ants[0].visited_nodes
-                self.best_tour_edges = sorted_ants[0].tour
-                self.best_tour_cost = sorted_ants[0].tour_cost
-    
+            # construction time is without local updates (they are measured separately)
+            start = time.perf_counter()
+            local_update_time = self.profiler.phase_times["local_update"]
+            ants = self.__do_ants_solutions()
+            self.profiler.add_time("construction", time.perf_counter() - start - (self.profiler.phase_times["local_update"] - local_update_time))
+            if ants is None:
+                return None
+                
+            start = time.perf_counter()
+            ants = self.__do_local_search(ants)
+            self.profiler.add_time("local_search", time.perf_counter() - start)
+            
+            start = time.perf_counter()
+            sorted_ants = self.__sort_ants(ants)
+            self.profiler.add_time("sort_ants", time.perf_counter() - start)
+            
+            start = time.perf_counter()
+            min_pheromone, max_pheromone = self.__global_update_pheromones(sorted_ants[0])
+            self.profiler.add_time("global_update", time.perf_counter() - start)
+            self.profiler.iterations += 1
+            
+        if acos.VERBOSE:
+            print('Best ant:', sorted_ants[0].tour_cost, file=sys.stderr)
+            
+        # save the best tour so far
+        if sorted_ants[0].tour_cost < self.best_tour_cost:
+            self.__save_best_tour(list(sorted_ants[0].visited_idx), sorted_ants[0].tour_cost)
+            
+        return sorted_ants, min_pheromone, max_pheromone
+        
+    def solve_iter(self, num_of_iterations : int | None = 0, time_limit : float = None, target_cost : float = None, max_stagnant_iterations : int = None) -> Iterator[acos.ACOIterationRecord]:
+        """solve the problem with the ACO algorithm - ACS, until one of the stopping criteria is met, \
+        the progress is yielded after each iteration
+        
+        :param `int` num_of_iterations: number of iterations, None for no limit
+        :param `float` time_limit: time limit in seconds (counted from this call), the running iteration is cut short, \
+            when the time is up (its tours are thrown away), None for no limit
+        :param `float` target_cost: the solving stops, when a tour with this or lower cost is found, None for no target
+        :param `int` max_stagnant_iterations: the solving stops after this number of iterations without \
+            improvement of the best tour, None for no limit
+        :return: generator of the records of the done iterations (without tours, the best tour is kept by the solver)
+        :rtype: Iterator[acos.ACOIterationRecord]
+        
+        :raises ValueError: if no stopping criterion is set or the criteria are not valid
+        
+        :info:
+            - when the generator is exhausted, the reason why the solving stopped is stored in `stop_reason` \
+                and the number of done iterations in `iterations_done`
+            - if the caller stops iterating earlier, `stop_reason` stays None
+        """
+        if (num_of_iterations is None and time_limit is None and target_cost is None and max_stagnant_iterations is None):
+            raise ValueError("At least one stopping criterion must be set.")
+        if (time_limit is not None and time_limit < 0):
+            raise ValueError("time_limit cannot be negative.")
+        if (max_stagnant_iterations is not None and max_stagnant_iterations < 1):
+            raise ValueError("max_stagnant_iterations must be greater than 0.")
+        # the ants are kept between the calls (and restored from the checkpoint), so the solving can continue
+        if not self.ant_colony:
+            self.__create_ants()
+        start = self.__start_solving(time_limit)
+        return self.__iterate(start, num_of_iterations, target_cost, max_stagnant_iterations)
+        
+    def __start_solving(self, time_limit : float | None) -> float:
+        # the state of the solving is reset here, not in the generator, so `interrupt()` called after \
+        # `solve_iter()` returned is never overwritten (the generator body runs first on the first `next()`)
+        start = time.perf_counter()
+        self.__deadline = start + time_limit if time_limit is not None else None
+        self.__interrupted = False
+        if self.__ant_pool is not None:
+            self.__ant_pool.reset_interrupt()
+        self.stop_reason = None
+        self.iterations_done = 0
+        return start
+        
+    def __iterate(self, start : float, num_of_iterations : int | None, target_cost : float | None, max_stagnant_iterations : int | None) -> Iterator[acos.ACOIterationRecord]:
+        # generator of `solve_iter()`, the stopping criteria are checked before each iteration
+        stagnant_iterations = 0
+        
+        while self.stop_reason is None:
+            if self.__interrupted:
+                self.stop_reason = acos.ACOStopReason.INTERRUPTED
+            elif target_cost is not None and self.best_tour_cost <= target_cost:
+                self.stop_reason = acos.ACOStopReason.TARGET_COST
+            elif max_stagnant_iterations is not None and stagnant_iterations >= max_stagnant_iterations:
+                self.stop_reason = acos.ACOStopReason.STAGNATION
+            elif num_of_iterations is not None and self.iterations_done >= num_of_iterations:
+                self.stop_reason = acos.ACOStopReason.ITERATIONS
+            elif self.__deadline is not None and time.perf_counter() >= self.__deadline:
+                self.stop_reason = acos.ACOStopReason.TIME_LIMIT
+            else:
+                best_tour_cost = self.best_tour_cost
+                iteration = self.__do_iteration()
+                if iteration is None:
+                    self.stop_reason = acos.ACOStopReason.INTERRUPTED if self.__interrupted else acos.ACOStopReason.TIME_LIMIT
+                    break
+                sorted_ants, min_pheromone, max_pheromone = iteration
+                self.iterations_done += 1
+                self.iteration += 1
+                stagnant_iterations = 0 if self.best_tour_cost < best_tour_cost else stagnant_iterations + 1
+                
+                yield acos.ACOIterationRecord(
+                    iteration=self.iteration - 1,
+                    iteration_best_cost=float(sorted_ants[0].tour_cost),
+                    best_tour_cost=float(self.best_tour_cost),
+                    elapsed=time.perf_counter() - start,
+                    min_pheromone=float(min_pheromone),
+                    max_pheromone=float(max_pheromone)
+                )
+            
+    def interrupt(self) -> None:
+        """stop the running `solve()` (or `solve_iter()`) as soon as possible, it can be called from another thread
+        
+        :info:
+            - the construction of the tours is cut short (its tours are thrown away), the flag is checked \
+                in each step of the construction (also by the ant workers); the local search stops before the next ant
+            - the solving stops with `stop_reason` set to `acos.ACOStopReason.INTERRUPTED`
+            - it only sets the flag, the flag is cleared by the next `solve_iter()` (or `solve()`) call
+            - the paused solving is resumed (and stopped)
+        """
+        self.__interrupted = True
+        self.__running.set()
+        if self.__ant_pool is not None:
+            self.__ant_pool.interrupt()
+            
+    def pause(self) -> None:
+        """pause the running `solve()` (or `solve_iter()`) immediately, it can be called from another thread
+        
+        :info:
+            - the thread of the solving waits in the current step of the construction (also the ant workers) \
+                or before the next ant of the local search, until `resume()` or `interrupt()` is called
+            - the time limit of the solving runs on while it is paused
+        """
+        self.__running.clear()
+        if self.__ant_pool is not None:
+            self.__ant_pool.pause()
+            
+    def resume(self) -> None:
+        """continue the solving paused by `pause()`"""
+        self.__running.set()
+        if self.__ant_pool is not None:
+            self.__ant_pool.resume()
+            
+    def __is_interrupted(self) -> bool:
+        # checked in each step of the construction, it blocks while the solving is paused
+        self.__running.wait()
+        return self.__interrupted
+        
+    def __cut_short(self) -> bool:
+        # the running iteration has to be cut short (interrupted or out of time)
+        self.__running.wait()
+        return self.__interrupted or (self.__deadline is not None and time.perf_counter() > self.__deadline)
+        
+    def solve(self, num_of_iterations : int | None = 0, time_limit : float = None, target_cost : float = None, max_stagnant_iterations : int = None) -> acos.ACOStopReason:
+        """solve the problem with the ACO algorithm - ACS, until one of the stopping criteria is met
+            this methods handles whole process, see `solve_iter()` for the parameters
+        :return: reason why the solving stopped, it is also stored in `stop_reason` (and the number of done \
+            iterations in `iterations_done`)
+        :rtype: `acos.ACOStopReason`
+        
+        :raises ValueError: if no stopping criterion is set or the criteria are not valid
+        """
+        for _ in self.solve_iter(num_of_iterations, time_limit, target_cost, max_stagnant_iterations):
+            pass
+        return self.stop_reason
+        
     def prepare_for_one_step_solving(self) -> None:
         """prepare the solver for solving ACS by externally calling solve_one_step method
-            in this case it just creates ants
+            in this case it just creates ants and the generator of iterations without a limit
         """
         self.__create_ants()
+        self.__steps = self.__iterate(self.__start_solving(None), None, None, None)
         
-    def solve_one_step(self) -> None:
+    def solve_one_step(self) -> acos.ACOIterationRecord:
         """do one step in solving the problem with the ACO algorithm - ACS 
         this method is meant to be called externally in a loop
         necessary to call `prepare_for_one_step_solving()` method before calling this method
         
         especialy for GUI purposes
+        
+        :return: record of the done iteration
+        :rtype: acos.ACOIterationRecord
         """
-        self.__reset_ants()
-        sorted_ants = self.__do_ants_solutions()
-        if acos.VERBOSE:
-            print('Best ant:', sorted_ants[0].tour_cost, file=sys.stderr)
-                        
-        min_pheromone, max_pheromone = self.__global_update_pheromones(sorted_ants[0])
-            
-        # save the best tour so far
-        if sorted_ants[0].tour_cost < self.best_tour_cost:
-            self.best_tour_nodes = sorted_ants[0].visited_nodes
-            self.best_tour_edges = sorted_ants[0].tour
-            self.best_tour_cost = sorted_ants[0].tour_cost
-            
-        # if gui active, notify about current progress
-        if (self.GUIACTIVE):
-            self.gui_controller.notify_from_aco_solver(
-                type=acos.ACS2GUIMessage.GLOBAL_PHEROMONE_UPDATE_DONE,
-                best_tour=sorted_ants[0].tour,
-                min_pheromone=min_pheromone,
-                max_pheromone=max_pheromone
-            )
-            
+        return next(self.__steps)
@@ -0,0 +1,246 @@
+# author: Jan Holan
+# mail: xholan11@stud.fit.vutbr.cz
+# date: 2026-10-18
+# file: aco_tsplib.py
+
+import numpy as np
+
+# edge weight types with coordinates, that are supported
+COORD_EDGE_WEIGHT_TYPES = ("EUC_2D", "CEIL_2D", "ATT", "GEO")
+# formats of the explicit edge weights, that are supported
+EXPLICIT_EDGE_WEIGHT_FORMATS = ("FULL_MATRIX", "UPPER_ROW", "LOWER_DIAG_ROW")
+# number of rows of the distance matrix computed at once from coordinates
+DISTANCE_BLOCK_SIZE = 1024
+
+def nint(values : np.ndarray) -> np.ndarray:
+    """nearest integer as defined by TSPLIB - (int)(x + 0.5)"""
+    return np.trunc(values + 0.5)
+    
+def euc_2d_distance_matrix(coords_first, coords_second):
+    dx = coords_first[:, 0, None] - coords_second[None, :, 0]
+    dy = coords_first[:, 1, None] - coords_second[None, :, 1]
+    return nint(np.sqrt(dx**2 + dy**2))
+    
+def ceil_2d_distance_matrix(coords_first, coords_second):
+    dx = coords_first[:, 0, None] - coords_second[None, :, 0]
+    dy = coords_first[:, 1, None] - coords_second[None, :, 1]
+    return np.ceil(np.sqrt(dx**2 + dy**2))
+    
+def att_distance_matrix(coords_first, coords_second):
+    dx = coords_first[:, 0, None] - coords_second[None, :, 0]
+    dy = coords_first[:, 1, None] - coords_second[None, :, 1]
+    rij = np.sqrt((dx**2 + dy**2) / 10.0)
+    tij = nint(rij)
+    return np.where(tij < rij, tij + 1, tij)
+    
+def geo_distance_matrix(coords_first, coords_second):
+    def to_radians(coords):
+        # coordinates are in DDD.MM format (degrees and minutes)
+        degrees = np.trunc(coords)
+        minutes = coords - degrees
+        return 3.141592 * (degrees + 5.0 * minutes / 3.0) / 180.0
+    latitude_first, longitude_first = to_radians(coords_first[:, 0]), to_radians(coords_first[:, 1])
+    latitude_second, longitude_second = to_radians(coords_second[:, 0]), to_radians(coords_second[:, 1])
+    q1 = np.cos(longitude_first[:, None] - longitude_second[None, :])
+    q2 = np.cos(latitude_first[:, None] - latitude_second[None, :])
+    q3 = np.cos(latitude_first[:, None] + latitude_second[None, :])
+    return np.trunc(6378.388 * np.arccos(np.clip(0.5 * ((1.0 + q1) * q2 - (1.0 - q1) * q3), -1.0, 1.0)) + 1.0)
+    
+DISTANCE_MATRIX_FUNCTIONS = {
+    "EUC_2D" : euc_2d_distance_matrix,
+    "CEIL_2D" : ceil_2d_distance_matrix,
+    "ATT" : att_distance_matrix,
+    "GEO" : geo_distance_matrix,
+}
+
+def _split_keyword(line : str) -> tuple[str, str]:
+    """split the specification line `KEY : VALUE` to key and value"""
+    if ":" in line:
+        key, value = line.split(":", 1)
+        return key.strip().upper(), value.strip()
+    return line.strip().upper(), ""
+    
+def _read_numbers(file, count : int):
+    """read `count` numbers from the file (they can be spread over more lines) and yield them \
+    as arrays, each array holds the numbers of one line
+    """
+    while count > 0:
+        line = file.readline()
+        if line == "":
+            raise Exception("Error: Unexpected end of TSPLIB file!")
+        if line.strip() == "":
+            continue
+        try:
+            numbers = np.array(line.split(), dtype=float)
+        except ValueError:
+            raise Exception("Error: Bad TSPLIB file format!")
+        count -= numbers.size
+        yield numbers
+        
+def _read_coords(file, dimension : int) -> tuple[np.ndarray, np.ndarray]:
+    """read the node coordinates section (lines `id x y`)
+    
+    :return: node ids and coordinates of shape (dimension,2)
+    """
+    node_ids = np.empty(dimension, dtype=np.int64)
+    coords = np.empty((dimension, 2))
+    for row in range(dimension):
+        line = file.readline()
+        while line != "" and line.strip() == "":
+            line = file.readline()
+        try:
+            node_id, x, y = line.split()[:3]
+            node_ids[row] = int(node_id)
+            coords[row] = float(x), float(y)
+        except ValueError:
+            raise Exception("Error: Bad TSPLIB node coordinates section!")
+    return node_ids, coords
+    
+def _read_explicit_weights(file, dimension : int, edge_weight_format : str) -> np.ndarray:
+    """stream the explicit edge weights section directly to the distance matrix, row by row
+    
+    :return: symmetric distance matrix with infinite diagonal
+    :rtype: np.ndarray
+    """
+    # length of each row of the section and where it is placed in the matrix
+    if edge_weight_format == "FULL_MATRIX":
+        row_length = lambda row: dimension
+        row_slice = lambda row: slice(0, dimension)
+        total = dimension * dimension
+    elif edge_weight_format == "UPPER_ROW":
+        row_length = lambda row: dimension - 1 - row
+        row_slice = lambda row: slice(row + 1, dimension)
+        total = dimension * (dimension - 1) // 2
+    else:
+        row_length = lambda row: row + 1
+        row_slice = lambda row: slice(0, row + 1)
+        total = dimension * (dimension + 1) // 2
+        
+    distance = np.empty((dimension, dimension))
+    row = 0
+    pending = np.empty(0)
+    for numbers in _read_numbers(file, total):
+        pending = numbers if pending.size == 0 else np.concatenate((pending, numbers))
+        # fill all the rows that are complete
+        while row < dimension and pending.size >= row_length(row):
+            length = row_length(row)
+            distance[row, row_slice(row)] = pending[:length]
+            if edge_weight_format != "FULL_MATRIX":
+                distance[row_slice(row), row] = pending[:length]
+            pending = pending[length:]
+            row += 1
+            
+    np.fill_diagonal(distance, np.inf)
+    return distance
+    
+def read_tsplib(path : str) -> tuple[dict[str, str], np.ndarray, np.ndarray, np.ndarray]:
+    """read the symmetric TSP instance in TSPLIB format (.tsp)
+    
+    :param str path: path to the file
+    :return: tuple of specification (header) of the file, node ids, node coordinates (zeros, \
+        if they are not in the file) and the distance matrix with infinite diagonal
+    :rtype: tuple[dict[str,str], np.ndarray, np.ndarray, np.ndarray]
+    
+    :raises Exception: if the file cannot be opened, has bad format or the instance is not supported
+    """
+    try:
+        file = open(path, "r")
+    except OSError as e:
+        raise Exception(str(e))
+        
+    specification = {}
+    node_ids = None
+    coords = None
+    distance = None
+    with file:
+        for line in file:
+            if line.strip() == "":
+                continue
+            key, value = _split_keyword(line)
+            if key == "EOF":
+                break
+            elif key.endswith("_SECTION") and "DIMENSION" not in specification:
+                raise Exception("Error: Bad TSPLIB file format!")
+            elif key == "NODE_COORD_SECTION" or key == "DISPLAY_DATA_SECTION":
+                node_ids, coords = _read_coords(file, int(specification["DIMENSION"]))
+            elif key == "EDGE_WEIGHT_SECTION":
+                edge_weight_format = specification.get("EDGE_WEIGHT_FORMAT", "")
+                if edge_weight_format not in EXPLICIT_EDGE_WEIGHT_FORMATS:
+                    raise Exception(f"Unsupported TSPLIB edge weight format {edge_weight_format}!")
+                distance = _read_explicit_weights(file, int(specification["DIMENSION"]), edge_weight_format)
+            elif key.endswith("_SECTION"):
+                raise Exception(f"Unsupported TSPLIB section {key}!")
+            else:
+                specification[key] = value
+                if key == "DIMENSION" and not value.isdigit():
+                    raise Exception("Error: Bad TSPLIB file format!")
+                    
+    if (specification.get("TYPE") or "TSP").split()[0] != "TSP":
+        raise Exception(f"Unsupported TSPLIB problem type {specification['TYPE']}!")
+    if "DIMENSION" not in specification:
+        raise Exception("Error: Bad TSPLIB file format!")
+    dimension = int(specification["DIMENSION"])
+    
+    edge_weight_type = specification.get("EDGE_WEIGHT_TYPE", "")
+    if edge_weight_type == "EXPLICIT":
+        if distance is None:
+            raise Exception("Error: Missing TSPLIB edge weight section!")
+    elif edge_weight_type in COORD_EDGE_WEIGHT_TYPES:
+        if coords is None:
+            raise Exception("Error: Missing TSPLIB node coordinates section!")
+        # compute the distances by blocks of rows, to bound the memory used by temporary arrays
+        distance_matrix_function = DISTANCE_MATRIX_FUNCTIONS[edge_weight_type]
+        distance = np.empty((dimension, dimension))
+        for block_start in range(0, dimension, DISTANCE_BLOCK_SIZE):
+            block_end = min(block_start + DISTANCE_BLOCK_SIZE, dimension)
+            distance[block_start:block_end] = distance_matrix_function(coords[block_start:block_end], coords)
+        np.fill_diagonal(distance, np.inf)
+    else:
+        raise Exception(f"Unsupported TSPLIB edge weight type {edge_weight_type}!")
+        
+    if node_ids is None:
+        node_ids = np.arange(1, dimension + 1)
+        coords = np.zeros((dimension, 2))
+        
+    return specification, node_ids, coords, distance
+    
+def read_tour(path : str) -> list[int]:
+    """read the tour in TSPLIB format (.tour), e.g. the optimal tour of the instance
+    
+    :param str path: path to the file
+    :return: list of node ids in order of the tour
+    :rtype: list[int]
+    
+    :raises Exception: if the file cannot be opened or has bad format
+    """
+    try:
+        file = open(path, "r")
+    except OSError as e:
+        raise Exception(str(e))
+        
+    tour = []
+    with file:
+        in_tour_section = False
+        for line in file:
+            if line.strip() == "":
+                continue
+            if not in_tour_section:
+                key, _ = _split_keyword(line)
+                if key == "TOUR_SECTION":
+                    in_tour_section = True
+                elif key == "EOF":
+                    break
+                continue
+            try:
+                node_ids = [int(value) for value in line.split()]
+            except ValueError:
+                raise Exception("Error: Bad TSPLIB tour file format!")
+            # the tour is terminated by -1
+            if -1 in node_ids:
+                tour.extend(node_ids[:node_ids.index(-1)])
+                break
+            tour.extend(node_ids)
+            
+    if tour == []:
+        raise Exception("No tour loaded, empty tour section!")
+    return tour
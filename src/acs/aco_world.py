@@ -3,9 +3,13 @@
 # date: 2024-11-18
 # file: aco_world.py
 import sys
+import os
+import hashlib
+import warnings
 import numpy as np
 import acs.aco_settings as acos
 import acs.aco_helper as acoh
+import acs.aco_tsplib as acotsp
 
 class Node:
     def __init__(self, _id : int, _x : float, _y : float, _name=None):
@@ -22,12 +26,41 @@ class Node:
         """function for printing out the node"""
         return f"{self.id} {self.name} {self.x} {self.y}"
     
+def _data_lines(file):
+    """lines of the input file without comments - only whole lines starting with # are comments, \
+    # inside a data line is its part (np.loadtxt would cut it off)
+    """
+    return (line for line in file if not line.strip().startswith("#"))
+    
 class Edge:
-    def __init__(self, _node_first : Node, _node_second : Node, _weight : float, _pheromone : float):
+    def __init__(self, _node_first : Node, _node_second : Node, _weight : float, _pheromone : float, _world : "ACOWorld" = None, _index : tuple[int,int] = None):
+        """create the edge between two nodes
+        
+        :param `ACOWorld` world: if set, the edge is just a view into the world's pheromone matrix \
+            and its pheromone is read from (and written to) the matrix at position `index`
+        :param `tuple[int,int]` index: dense indices of the nodes (node_first, node_second) in the world's matrices
+        """
         self.node_first = _node_first
         self.node_second = _node_second
         self.weight = _weight
-        self.pheromone = _pheromone
+        self._world = _world
+        self._index = _index
+        self._pheromone = _pheromone
+    
+    @property
+    def pheromone(self) -> float:
+        if self._world is not None:
+            return float(self._world.pheromone[self._index])
+        return self._pheromone
+    
+    @pheromone.setter
+    def pheromone(self, value : float) -> None:
+        if self._world is not None:
+            i, j = self._index
+            self._world.pheromone[i, j] = value
+            self._world.pheromone[j, i] = value
+        else:
+            self._pheromone = value
     
     def __str__(self):
         """function for printing out the edge"""
@@ -39,22 +72,46 @@ class Edge:
          
 class ACOWorld:
     """represents the world for the ACO algorithm
+    
+    the computation works only with dense node indices (0..N-1), the mapping between node id and index is \
+    stored in `node_index`; `distance` and `pheromone` are NxN matrices indexed by these indices, \
+    non-existing edges have `np.inf` distance
     """
     # dictionary of nodes, there are not necessary for the computation, there are just for visualization,
     # for creating edges between nodes, if the edges are not provided
     nodes : dict[int, Node] = {}
-    # list of edges between nodes, in case 
-    # of non existing edge file, edges will be created between each node
-    edges : list[Edge] = []
+    # nodes in order of their dense index
+    node_list : list[Node] = []
+    # mapping node id -> dense index
+    node_index : dict[int, int] = {}
+    # matrix of distances between nodes (np.inf if there is no edge)
+    distance : np.ndarray = None
+    # matrix of pheromones on the edges
+    pheromone : np.ndarray = None
+    # matrix of heuristic information (1/distance), 0 if there is no edge
+    eta : np.ndarray = None
+    # coordinates of the nodes, array of shape (N,2), in order of their dense index
+    coords : np.ndarray = None
+    # candidate lists - indices of the nearest nodes for each node, array of shape (N,k) sorted by distance,
+    # None if the candidate lists are not used
+    candidates : np.ndarray = None
+    # number of rows of the distance matrix computed at once by the vectorized distance function
+    DISTANCE_BLOCK_SIZE : int = 1024
+    # version of the format of the cache, it is part of the cache key
+    CACHE_VERSION : int = 1
     
-    def __init__(self, path_nodes, path_edges=None, distance_function=acoh.euclidean_distance) -> None | Exception:
+    def __init__(self, path_nodes, path_edges=None, distance_function=acoh.euclidean_distance, cache_dir : str = None) -> None | Exception:
         """initialize the world with nodes and edges
         
-        :param `str` path_nodes: path to the file with nodes
+        :param `str` path_nodes: path to the file with nodes, or to the TSPLIB instance (file with .tsp extension), \
+            in that case the edges are taken from the instance and `path_edges` and `distance_function` are not used
         :param `str` path_edges: path to the file with edges, if None, the edges will be created
             currently only complete graph is supported (as TSP needs complete graph)
         :param `function` distance_function: function for computing the distance between two nodes,
             used only if the edges are not provided
+        :param `str` cache_dir: directory for the cache of prepared worlds, if set, the prepared arrays (nodes, \
+            distance matrix, candidate lists, greedy tour cost) are stored there, keyed by the hash of the input \
+            files and the distance function, and loaded from there in the next runs
             
         :raises Exception: if the nodes or edges are not loaded correctly or the files have bad format
         """
@@ -63,17 +120,35 @@ class ACOWorld:
         
         # reset the edges and nodes for the new world (if the class is used multiple times)
         self.nodes = {}
-        self.edges = []
+        self.__edges = None
+        self.__complete = None
+        self.__greedy_cost = None
+        self.candidates = None
+        self.__nearest_nodes = {}
+        self.__eta_beta = None
+        self.__cache_path = None
         
         # load the nodes from file
         try:
-            self.__load_nodes(path_nodes)
-        
-            # load edges (or create them)
-            if (path_edges == None):
-                self.__create_edges()
-            else: 
-                self.__load_edges(path_edges)
+            if (cache_dir is not None):
+                self.__cache_path = os.path.join(cache_dir, self.__get_cache_key(path_nodes, path_edges))
+            
+            # load the prepared world from cache, if there is any
+            if (self.__load_cache()):
+                pass
+            elif (path_nodes.lower().endswith(".tsp")):
+                self.__load_tsplib(path_nodes)
+                self.__save_cache()
+            else:
+                self.__load_nodes(path_nodes)
+            
+                # load edges (or create them)
+                if (path_edges == None):
+                    self.__create_edges()
+                else: 
+                    self.__load_edges(path_edges)
+                
+                self.__save_cache()
             
             # check for graph completeness
             if (not self.check_for_graph_completion()):
@@ -81,9 +156,39 @@ class ACOWorld:
             
         except Exception as e:
             raise e
+    
+    @property
+    def edges(self) -> list[Edge]:
+        """list of edges between nodes - just a view into the world's matrices (for GUI and printing), \
+        it is created on the first access; the pheromone of the edges is read directly from the pheromone matrix
+        
+        :rtype: list[Edge]
+        """
+        if self.__edges is None:
+            rows, cols = np.nonzero(np.triu(np.isfinite(self.distance), k=1))
+            self.__edges = [self.get_edge(i, j) for i, j in zip(rows.tolist(), cols.tolist())]
+        return self.__edges
+    
+    def get_edge(self, idx_first : int, idx_second : int) -> Edge:
+        """get the edge between two nodes given by their dense indices
+        
+        :return: edge bound to the pheromone matrix of the world
+        :rtype: Edge
+        """
+        return Edge(
+            self.node_list[idx_first],
+            self.node_list[idx_second],
+            float(self.distance[idx_first, idx_second]),
+            .0,
+            self,
+            (idx_first, idx_second)
+        )
         
     def get_random_node(self) -> Node:
-        return np.random.choice(list(self.nodes.values()))
+        return self.node_list[self.get_random_node_idx()]
+    
+    def get_random_node_idx(self) -> int:
+        return int(np.random.randint(len(self.node_list)))
     
     def get_adjacent_edges(self, node) -> list[Edge]:
         """get the edges adjacent to the given node
@@ -91,28 +196,24 @@ class ACOWorld:
         :return: list of edges adjacent to the given node
         :rtype: list[Edge]
         """
-        adjacent_edges = []
-        for edge in self.edges:
-            if (edge.node_first == node or edge.node_second == node):
-                adjacent_edges.append(edge)
-        return adjacent_edges
+        idx = self.node_index[node.id]
+        return [self.get_edge(idx, int(j)) for j in np.flatnonzero(np.isfinite(self.distance[idx]))]
     
     def check_for_graph_completion(self) -> bool:
-        """check whether the graph is complete
+        """check whether the graph is complete, the result is computed only once and cached
         
         :rtype: bool
         :return: True if the graph is complete, False otherwise
         """
-        node_count = len(self.nodes)
-        all_nodes = list(self.nodes.values())
-        path_matrix = np.zeros((node_count, node_count))
-        for edge in self.edges:
-            path_matrix[all_nodes.index(edge.node_first)][all_nodes.index(edge.node_second)] = 1
-            path_matrix[all_nodes.index(edge.node_second)][all_nodes.index(edge.node_first)] = 1
-    
-        # condition for graph completeness - nodes connected to each other, that results from matrix
-        # adding node_count to the sum is because of the diagonal of the matrix (node connected to itself)
-        complete = (np.sum(path_matrix,axis=(0,1)) + node_count) == node_count ** 2
+        if self.__complete is not None:
+            return self.__complete
+        
+        # edges are already scattered to the distance matrix by node indices (in both directions),
+        # condition for graph completeness - nodes connected to each other (except the diagonal)
+        path_matrix = np.isfinite(self.distance)
+        np.fill_diagonal(path_matrix, True)
+        complete = bool(path_matrix.all())
+        self.__complete = complete
         
         if (acos.VERBOSE and not complete):
             print("Warning: The graph is not complete!", file=sys.stderr)
@@ -122,39 +223,63 @@ class ACOWorld:
         return complete
                 
     def __load_nodes(self, path) -> None | Exception:
-        # read the file line by lines, skip comments (lines starting with #)
-        nodes_loaded = {}
+        # read the whole file at once to array of strings, skip comments (starting with #) and blank lines,
+        # there have to be four values separated by semicolon on each line
         try:
             file = open(path, "r")
         except OSError as e:
             raise Exception(str(e))
         
-        for line in file.readlines(): 
-            try:
-                if (line[0] == "#" or line.strip() == ""):
-                    continue
-                # parse the node info from the line (there have to be four values separated by semicolon)
-                node_id, node_name, node_x, node_y = line.split(";")
-                if (node_id in nodes_loaded):
-                    print("** WARNING: Duplicate node id! **",file=sys.stderr)
-                    
-                # create the node and add it to the dictionary
-                nodes_loaded[int(node_id)] = (Node(int(node_id), float(node_x), float(node_y), node_name))
-            except:
-                file.close()
-                raise Exception("Error: Bad node file format!")
-        
-        file.close()
+        try:
+            with file, warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                columns = np.loadtxt(_data_lines(file), delimiter=";", comments=None, dtype=str, ndmin=2)
+            # check for empty file
+            if (columns.shape[0] == 0):
+                raise Exception("No nodes loaded, empty file!")
+            if (columns.shape[1] != 4):
+                raise ValueError
+            node_ids = columns[:, 0].astype(np.int64)
+            node_xs = columns[:, 2].astype(float)
+            node_ys = columns[:, 3].astype(float)
+        except ValueError:
+            raise Exception("Error: Bad node file format!")
         
-        # check for empty file
-        if (nodes_loaded.__len__() == 0):
-            raise Exception("No nodes loaded, empty file!")
+        if (np.unique(node_ids).size != node_ids.size):
+            print("** WARNING: Duplicate node id! **",file=sys.stderr)
         
+        # create the nodes and add them to the dictionary
+        nodes_loaded = {}
+        for node_id, node_name, node_x, node_y in zip(node_ids.tolist(), columns[:, 1].tolist(), node_xs.tolist(), node_ys.tolist()):
+            nodes_loaded[node_id] = Node(node_id, node_x, node_y, node_name)
+        
+        self.__set_nodes(nodes_loaded)
+    
+    def __set_nodes(self, nodes_loaded : dict[int, Node], distance : np.ndarray = None) -> None:
+        # set the nodes of the world and prepare the matrices (if the distance matrix is not given, no edges yet)
         self.nodes = nodes_loaded
+        self.node_list = list(nodes_loaded.values())
+        self.node_index = {node_id : idx for idx, node_id in enumerate(nodes_loaded.keys())}
+        self.coords = np.array([(node.x, node.y) for node in self.node_list], dtype=float)
+        
+        # prepare the matrices
+        node_count = len(self.node_list)
+        self.distance = np.full((node_count, node_count), np.inf) if distance is None else distance
+        self.pheromone = np.zeros((node_count, node_count))
         
         if (acos.VERBOSE):
             self.print_nodes()
     
+    def __load_tsplib(self, path) -> None | Exception:
+        # load the nodes and the distance matrix from the TSPLIB instance
+        _, node_ids, coords, distance = acotsp.read_tsplib(path)
+        
+        nodes_loaded = {}
+        for node_id, (node_x, node_y) in zip(node_ids.tolist(), coords.tolist()):
+            nodes_loaded[node_id] = Node(node_id, node_x, node_y, "")
+        self.__set_nodes(nodes_loaded, distance)
+        self.__update_eta()
+    
     def __load_edges(self, path, check_complete_graph=True) -> Exception | None:
         """load the edges from the file
         
@@ -166,59 +291,105 @@ class ACOWorld:
         :return: True if the graph is created successfully, false otherwise
         """
         
-        edges_loaded = []
         try:
             file = open(path, "r")
         except OSError:
             raise Exception("Error: Edge file opening error!")
         
-        for line in file.readlines(): 
-            try:
-                if (line[0] == "#" or line.strip() == ""):
-                    continue
-                node_first_id, node_second_id, weight = line.split(";")
-                if (node_first_id == node_second_id):
-                    raise Exception("Edge between the same node not supported!")
-                if (float(weight) < 0):
-                    raise Exception("Edge weight cannot be negative!")
-                if (int(node_first_id) not in self.nodes or int(node_second_id) not in self.nodes):
-                    raise Exception("Edge between non-existing nodes!")
-                edges_loaded.append(Edge(self.nodes[int(node_first_id)],self.nodes[int(node_second_id)], float(weight), .0))
-            except Exception as e:
-                file.close()
-                raise Exception(str(e))
-                   
-        file.close()
-        
-        self.edges = edges_loaded
+        # read the whole file at once to typed array, skip comments (starting with #) and blank lines
+        try:
+            with file, warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                edges_loaded = np.loadtxt(_data_lines(file), delimiter=";", comments=None, ndmin=1, dtype=[
+                    ("node_first_id", np.int64), ("node_second_id", np.int64), ("weight", float)
+                ])
+        except ValueError:
+            raise Exception("Error: Bad edge file format!")
         
         # check for empty file
-        if (edges_loaded.__len__() == 0):
+        if (edges_loaded.size == 0):
             raise Exception("No edges loaded, empty file!")
         
+        node_first_ids, node_second_ids, weights = edges_loaded["node_first_id"], edges_loaded["node_second_id"], edges_loaded["weight"]
+        
+        # map the node ids to indices (index of not existing node is marked as -1)
+        node_ids = np.fromiter(self.node_index.keys(), dtype=np.int64, count=len(self.node_index))
+        node_indices = np.fromiter(self.node_index.values(), dtype=np.int64, count=len(self.node_index))
+        order = np.argsort(node_ids)
+        sorted_ids = node_ids[order]
+        def ids_to_indices(ids : np.ndarray) -> np.ndarray:
+            pos = np.minimum(np.searchsorted(sorted_ids, ids), sorted_ids.size - 1)
+            return np.where(sorted_ids[pos] == ids, node_indices[order[pos]], -1)
+        idx_first, idx_second = ids_to_indices(node_first_ids), ids_to_indices(node_second_ids)
+        
+        # validate all edges at once, report the error of the first bad edge (in the order of the checks)
+        same_node = node_first_ids == node_second_ids
+        negative_weight = weights < 0
+        non_existing_node = (idx_first < 0) | (idx_second < 0)
+        bad_edges = same_node | negative_weight | non_existing_node
+        if bad_edges.any():
+            bad_edge = np.argmax(bad_edges)
+            if same_node[bad_edge]:
+                raise Exception("Edge between the same node not supported!")
+            if negative_weight[bad_edge]:
+                raise Exception("Edge weight cannot be negative!")
+            raise Exception("Edge between non-existing nodes!")
+        
+        # scatter the weights to the distance matrix in both directions, interleaved so that
+        # the last edge in the file between two nodes wins in both directions
+        rows = np.stack((idx_first, idx_second), axis=1).ravel()
+        cols = np.stack((idx_second, idx_first), axis=1).ravel()
+        self.distance[rows, cols] = np.repeat(weights, 2)
+        
+        self.__update_eta()
+        
         # print the edges, if verbose
         if (acos.VERBOSE):
             self.print_edges()
         
     def __create_edges(self) -> None:
         # create list of nodes, to be able to iterate normally over them (dict is not good for this...)
-        all_nodes = list(self.nodes.values())
+        all_nodes = self.node_list
         # calculate the number of nodes
         node_count = all_nodes.__len__()
         
-        # iterate over all nodes and create edge between each pair of nodes
-        for node_first_idx in range(0, node_count - 1):
-            for node_second_idx in range(node_first_idx + 1, node_count):
-                self.edges.append(Edge(
-                    all_nodes[node_first_idx], 
-                    all_nodes[node_second_idx], 
-                    self._distance_function(all_nodes[node_first_idx], all_nodes[node_second_idx]),
-                    .0
-                ))    
+        distance_matrix_function = acoh.VECTORIZED_DISTANCE_FUNCTIONS.get(self._distance_function)
+        if distance_matrix_function is not None:
+            # compute the distances by blocks of rows, to bound the memory used by temporary arrays
+            for block_start in range(0, node_count, self.DISTANCE_BLOCK_SIZE):
+                block_end = min(block_start + self.DISTANCE_BLOCK_SIZE, node_count)
+                self.distance[block_start:block_end] = distance_matrix_function(self.coords[block_start:block_end], self.coords)
+            # there are no edges between node and itself
+            np.fill_diagonal(self.distance, np.inf)
+        else:
+            # iterate over all nodes and create edge between each pair of nodes
+            for node_first_idx in range(0, node_count - 1):
+                for node_second_idx in range(node_first_idx + 1, node_count):
+                    weight = self._distance_function(all_nodes[node_first_idx], all_nodes[node_second_idx])
+                    self.distance[node_first_idx, node_second_idx] = weight
+                    self.distance[node_second_idx, node_first_idx] = weight
+        
+        self.__update_eta()
             
         # control printout of the edges
         if (acos.VERBOSE):
             self.print_edges()
+    
+    def __update_eta(self) -> None:
+        # heuristic information of the edges, non-existing edges (infinite distance) get 0
+        with np.errstate(divide="ignore"):
+            self.eta = 1 / self.distance
+        self.__eta_beta = None
+        
+    def get_eta_beta(self, beta : float) -> np.ndarray:
+        """get the heuristic information powered by beta (input of the choice info of the backends), \
+        it is computed only once for the last used beta
+        
+        :rtype: np.ndarray
+        """
+        if self.__eta_beta is None or self.__eta_beta[0] != beta:
+            self.__eta_beta = (beta, self.eta ** beta)
+        return self.__eta_beta[1]
       
     def init_pheromone(self, tau0) -> float:
         """initialize the pheromone on the edges
@@ -230,20 +401,161 @@ class ACOWorld:
         float_tau0 = .0 
         if (isinstance(tau0,str) and tau0 == "greedy"):
             # compute the greedy solution
-            greedy_solution_cost, _, _ = acoh.greedy_solution(self)
+            greedy_solution_cost = self.get_greedy_cost()
             # set the pheromone on the edges to 1/(greedy solution cost)
-            for edge in self.edges:
-                edge.pheromone = 1 / (len(self.nodes)*greedy_solution_cost)
+            self.pheromone[:] = np.where(np.isfinite(self.distance), 1 / (len(self.nodes)*greedy_solution_cost), .0)
             float_tau0 = 1 / greedy_solution_cost    
         elif (isinstance(tau0,float) or isinstance(tau0,int)):
-            for edge in self.edges:
-                edge.pheromone = float(tau0)
+            self.pheromone[:] = np.where(np.isfinite(self.distance), float(tau0), .0)
             float_tau0 = float(tau0)
         else:
             raise Exception("Bad initial phereomone value! (tau0 parameter)")
 
         return float_tau0
     
+    def init_candidates(self, k : int | None) -> None:
+        """precompute candidate lists - k nearest nodes for each node (sorted by distance)
+        
+        :param int k: number of nearest nodes in the list, if None, the candidate lists are not used
+        """
+        self.candidates = self.get_nearest_nodes(k) if k is not None else None
+    
+    def get_nearest_nodes(self, k : int) -> np.ndarray | None:
+        """get k nearest nodes for each node (sorted by distance), the lists are computed only once for each k
+        
+        :param int k: number of nearest nodes in the list (at most number of nodes - 1)
+        :return: array of shape (number of nodes, k) with node indices, None if there are less than 2 nodes
+        :rtype: np.ndarray | None
+        """
+        node_count = len(self.node_list)
+        if node_count < 2:
+            return None
+        k = min(k, node_count - 1)
+        
+        nearest_nodes = self.__nearest_nodes.get(k)
+        if nearest_nodes is None:
+            nearest_nodes = self.__load_cache_array(f"candidates_{k}")
+        if nearest_nodes is None:
+            nearest_nodes = np.empty((node_count, k), dtype=int)
+            for block_start in range(0, node_count, self.DISTANCE_BLOCK_SIZE):
+                block_end = min(block_start + self.DISTANCE_BLOCK_SIZE, node_count)
+                block = self.distance[block_start:block_end]
+                # k nearest nodes (the node itself has infinite distance, so it is never chosen)
+                nearest = np.argpartition(block, k - 1, axis=1)[:, :k]
+                order = np.argsort(np.take_along_axis(block, nearest, axis=1), axis=1)
+                nearest_nodes[block_start:block_end] = np.take_along_axis(nearest, order, axis=1)
+            self.__save_cache_array(f"candidates_{k}", nearest_nodes)
+        self.__nearest_nodes[k] = nearest_nodes
+        return nearest_nodes
+    
+    def get_tour_cost(self, node_ids : list[int]) -> float:
+        """compute the cost of the closed tour given by node ids (e.g. the optimal tour of TSPLIB instance)
+        
+        :param list[int] node_ids: ids of the nodes in order of the tour
+        :rtype: float
+        
+        :raises Exception: if the tour contains non-existing node
+        """
+        try:
+            tour = np.array([self.node_index[node_id] for node_id in node_ids])
+        except KeyError:
+            raise Exception("Tour contains non-existing node!")
+        return float(self.distance[tour, np.roll(tour, -1)].sum())
+    
+    def get_greedy_cost(self) -> float:
+        """get the cost of the greedy solution (computed only once, it is stored in the cache, if used)
+        
+        :rtype: float
+        """
+        if self.__greedy_cost is None:
+            greedy_cost = self.__load_cache_array("greedy_cost")
+            if greedy_cost is None:
+                greedy_cost, _, _ = acoh.greedy_solution(self)
+                self.__save_cache_array("greedy_cost", np.array(greedy_cost))
+            self.__greedy_cost = float(greedy_cost)
+        return self.__greedy_cost
+    
+    def __get_cache_key(self, path_nodes, path_edges) -> str:
+        """compute the cache key - hash of the content of the input files and the name of the distance function
+        
+        :rtype: str
+        """
+        key = hashlib.sha256(f"v{self.CACHE_VERSION}".encode())
+        for path in (path_nodes, path_edges):
+            key.update(b"\0file\0")
+            if path is None:
+                continue
+            try:
+                with open(path, "rb") as file:
+                    for chunk in iter(lambda: file.read(1 << 20), b""):
+                        key.update(chunk)
+            except OSError as e:
+                raise Exception(str(e))
+        distance_function = self._distance_function
+        key.update(f"\0{distance_function.__module__}.{distance_function.__qualname__}".encode())
+        return key.hexdigest()
+    
+    def __load_cache_array(self, name : str) -> np.ndarray | None:
+        """load the array from the cache (memory mapped, read only)
+        
+        :return: the array or None, if the cache is not used or the array is not there
+        """
+        if self.__cache_path is None:
+            return None
+        path = os.path.join(self.__cache_path, name + ".npy")
+        if not os.path.isfile(path):
+            return None
+        try:
+            return np.load(path, mmap_mode="r")
+        except (OSError, ValueError):
+            return None
+    
+    def __save_cache_array(self, name : str, array : np.ndarray) -> None:
+        """save the array to the cache (if the cache is used), the file is written atomically"""
+        if self.__cache_path is None:
+            return
+        try:
+            os.makedirs(self.__cache_path, exist_ok=True)
+            path = os.path.join(self.__cache_path, name + ".npy")
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as file:
+                np.save(file, array)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            # the cache is just an optimization, the computation can continue without it
+            print(f"** WARNING: Cannot write world cache: {e} **", file=sys.stderr)
+    
+    def __load_cache(self) -> bool:
+        """load the nodes and distance matrix from the cache
+        
+        :return: True if the world was loaded from the cache, False otherwise
+        :rtype: bool
+        """
+        arrays = [self.__load_cache_array(name) for name in ("node_ids", "node_names", "coords", "distance")]
+        if any(array is None for array in arrays):
+            return False
+        node_ids, node_names, coords, distance = arrays
+        
+        nodes_loaded = {}
+        for node_id, node_name, (node_x, node_y) in zip(node_ids.tolist(), node_names.tolist(), coords.tolist()):
+            nodes_loaded[node_id] = Node(node_id, node_x, node_y, node_name)
+        self.__set_nodes(nodes_loaded, distance)
+        self.__update_eta()
+        
+        if (acos.VERBOSE):
+            print("World loaded from cache " + self.__cache_path, file=sys.stderr)
+        return True
+    
+    def __save_cache(self) -> None:
+        """save the nodes and distance matrix to the cache"""
+        if self.__cache_path is None:
+            return
+        self.__save_cache_array("node_ids", np.array([node.id for node in self.node_list], dtype=np.int64))
+        self.__save_cache_array("node_names", np.array([str(node.name) for node in self.node_list], dtype=str))
+        self.__save_cache_array("coords", self.coords)
+        # distance matrix is the last one, its presence marks complete cache
+        self.__save_cache_array("distance", self.distance)
+    
     def print_edges(self) -> None:
         """print the edges in the world"""
         for edge in self.edges:
@@ -0,0 +1,177 @@
+# author: Jan Holan
+# mail: xholan11@stud.fit.vutbr.cz
+# date: 2026-10-18
+# file: acsbatch.py
+
+import acs.aco_world as acow
+import acs.aco_solver as aco_solver
+import multiprocessing
+import argparse
+import glob
+import json
+import time
+import sys
+import os
+import numpy as np
+
+def read_manifest(path : str) -> list[tuple[str, str | None]]:
+    """read the manifest with the instances, one instance per line: node file and optionally edge file \
+    separated by whitespace, empty lines and lines starting with # are skipped, relative paths are relative \
+    to the directory of the manifest
+    
+    :return: list of tuples (node file, edge file or None)
+    :rtype: list[tuple[str, str | None]]
+    
+    :raises Exception: if the manifest cannot be read or it has bad format
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    instances = []
+    try:
+        with open(path) as file:
+            for line_number, line in enumerate(file, start=1):
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                files = line.split()
+                if len(files) > 2:
+                    raise Exception(f"Bad format of the manifest {path} on line {line_number}: expected node file and optional edge file.")
+                files = [os.path.join(directory, file_path) for file_path in files]
+                instances.append((files[0], files[1] if len(files) > 1 else None))
+    except OSError as e:
+        raise Exception(str(e))
+    return instances
+    
+def _solve_instance(task : tuple[int, str, str | None, str | None, dict, dict, np.random.SeedSequence | None]) -> dict:
+    """solve one instance in the worker process
+    
+    :param task: index of the instance, node file, edge file, cache directory, parameters of the solver, \
+        stopping criteria and seed
+    :return: record with the results (or the error) of the instance
+    :rtype: dict
+    """
+    index, node_file, edge_file, cache_dir, solver_kwargs, stopping, seed = task
+    record = {"index" : index, "node_file" : node_file, "edge_file" : edge_file}
+    try:
+        start = time.perf_counter()
+        world = acow.ACOWorld(path_nodes=node_file, path_edges=edge_file, cache_dir=cache_dir)
+        record["load_time_s"] = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        with aco_solver.ACOSolver(_world=world, _seed=seed, **solver_kwargs) as solver:
+            solver.solve(**stopping)
+        record["solve_time_s"] = time.perf_counter() - start
+        
+        record["nodes"] = len(world.node_list)
+        record["cost"] = float(solver.best_tour_cost) if solver.best_tour_idx is not None else None
+        record["tour"] = [node.id for node in solver.best_tour_nodes] if solver.best_tour_nodes is not None else None
+        record["iterations"] = solver.iterations_done
+        record["stop_reason"] = solver.stop_reason.value
+    except Exception as e:
+        record["error"] = str(e)
+    return record
+    
+def main():
+    parser = argparse.ArgumentParser(
+        description="Batch mode - solve many instances in a pool of worker processes inside one process, " \
+            "one JSON line with the results is written per instance (in order of completion)."
+    )
+    parser.add_argument("--manifest", type=str, default=None, help="Path to the manifest, one instance per line: node file and optional edge file.")
+    parser.add_argument("--glob", type=str, default=None, help="Glob pattern of the node files (or TSPLIB .tsp files) of the instances.")
+    parser.add_argument("--output", type=str, default=None, help="Path to the output JSON lines file (default: standard output).")
+    parser.add_argument("--processes", type=int, default=os.cpu_count(), help="Number of worker processes (default: number of CPUs).")
+    parser.add_argument("--chunksize", type=int, default=1, help="Number of instances sent to a worker at once, higher values reduce the overhead for small instances (default: 1).")
+    parser.add_argument("--cache_dir", type=str, default=None, help="Directory for the cache of prepared worlds (optional).")
+    parser.add_argument("--seed", type=int, default=None, help="Seed of the random generators, each instance gets its own seed derived from it and its position (default: None - random).")
+    parser.add_argument("--iterations", type=int, default=None, help="Number of iterations for solving (default: 10, no limit if another stopping criterion is set).")
+    parser.add_argument("--time_limit", type=float, default=None, help="Time limit of solving of each instance in seconds (default: None - no limit).")
+    parser.add_argument("--target_cost", type=float, default=None, help="Stop solving when a tour with this or lower cost is found (default: None).")
+    parser.add_argument("--max_stagnant_iterations", type=int, default=None, help="Stop solving after this number of iterations without improvement of the best tour (default: None - no limit).")
+    parser.add_argument("--alpha", type=float, default=1.0, help="Alpha parameter (default: 1.0).")
+    parser.add_argument("--beta", type=float, default=2.0, help="Beta parameter (default: 2.0).")
+    parser.add_argument("--rho", type=float, default=0.1, help="Rho parameter (default: 0.1).")
+    parser.add_argument("--n", type=int, default=10, help="Number of ants (default: 10).")
+    parser.add_argument("--tau0", type=str, default="greedy", help="Initial pheromone value (default: 'greedy').")
+    parser.add_argument("--Q", type=float, default=1, help="Pheromone intensity (default: 1).")
+    parser.add_argument("--q0", type=float, default=0.9, help="Probability threshold for exploitation (default: 0.9).")
+    parser.add_argument("--alpha_decay", type=float, default=0.1, help="Alpha decay rate (default: 0.1).")
+    parser.add_argument("--global_update", type=str, default="all", choices=["all", "best_tour"], help="Edges updated by the global pheromone update (default: 'all').")
+    parser.add_argument("--candidates", type=int, default=None, help="Size of candidate lists of nearest nodes (default: None - all nodes).")
+    parser.add_argument("--local_search", type=str, default=None, choices=["2opt", "oropt", "3opt"], help="Local search applied to the tour of each ant (default: None).")
+    parser.add_argument("--local_search_time", type=float, default=None, help="Time budget of the local search in one iteration in seconds (default: None - no limit).")
+    parser.add_argument("--backend", type=str, default="vectorized", choices=["vectorized", "reference"], help="Compute backend of the tour construction and pheromone updates (default: 'vectorized').")
+    parser.add_argument("--batched", action="store_true", help="Construct tours of all ants at once (vectorized).")
+    args = parser.parse_args()
+    
+    if ((args.manifest is None) == (args.glob is None)):
+        print("Error: exactly one of --manifest and --glob must be set.", file=sys.stderr)
+        exit(1)
+    if (args.processes < 1 or args.chunksize < 1):
+        print("Error: --processes and --chunksize must be greater than 0.", file=sys.stderr)
+        exit(1)
+    if (args.iterations is None and args.time_limit is None and args.target_cost is None and args.max_stagnant_iterations is None):
+        args.iterations = 10
+        
+    tau0 = args.tau0
+    if (tau0 != "greedy"):
+        try:
+            tau0 = float(tau0)
+        except ValueError:
+            print("Error: tau0 must be 'greedy' or a number.", file=sys.stderr)
+            exit(1)
+            
+    try:
+        if (args.manifest is not None):
+            instances = read_manifest(args.manifest)
+        else:
+            instances = [(path, None) for path in sorted(glob.glob(args.glob))]
+    except Exception as e:
+        print("Error: " + str(e), file=sys.stderr)
+        exit(1)
+        
+    solver_kwargs = dict(
+        _alpha=args.alpha,
+        _beta=args.beta,
+        _rho=args.rho,
+        _n=args.n,
+        _tau0=tau0,
+        _Q=args.Q,
+        _q0=args.q0,
+        _alpha_decay=args.alpha_decay,
+        _global_update=args.global_update,
+        _candidates=args.candidates,
+        _local_search=args.local_search,
+        _local_search_time=args.local_search_time,
+        _backend=args.backend,
+        _batched=args.batched
+    )
+    stopping = dict(
+        num_of_iterations=args.iterations,
+        time_limit=args.time_limit,
+        target_cost=args.target_cost,
+        max_stagnant_iterations=args.max_stagnant_iterations
+    )
+    # the seed of the instance depends only on its position, not on the worker solving it
+    seeds = np.random.SeedSequence(args.seed).spawn(len(instances)) if args.seed is not None else [None] * len(instances)
+    tasks = [
+        (index, node_file, edge_file, args.cache_dir, solver_kwargs, stopping, seed)
+        for index, ((node_file, edge_file), seed) in enumerate(zip(instances, seeds))
+    ]
+    
+    start = time.perf_counter()
+    errors = 0
+    output = open(args.output, "w") if args.output is not None else sys.stdout
+    try:
+        with multiprocessing.Pool(max(1, min(args.processes, len(tasks)))) as pool:
+            for record in pool.imap_unordered(_solve_instance, tasks, chunksize=args.chunksize):
+                errors += "error" in record
+                output.write(json.dumps(record) + "\n")
+                output.flush()
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    elapsed = time.perf_counter() - start
+    print(f"{len(tasks)} instances solved in {elapsed:.3f}s ({len(tasks) / elapsed if elapsed > 0 else 0:.1f} instances/s), {errors} errors", file=sys.stderr)
+    exit(1 if errors > 0 else 0)
+    
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+# author: Jan Holan
+# mail: xholan11@stud.fit.vutbr.cz
+# date: 2026-10-18
+# file: acssweep.py
+
+import acs.aco_world as acow
+import acs.aco_solver as aco_solver
+import acs.aco_local_search as acols
+import multiprocessing
+import itertools
+import argparse
+import json
+import time
+import sys
+import os
+import numpy as np
+
+# parameters of the `ACOSolver` that can be swept and their types
+SWEEP_PARAMETERS = {
+    "alpha" : float,
+    "beta" : float,
+    "rho" : float,
+    "q0" : float,
+    "alpha_decay" : float,
+    "n" : int,
+}
+
+# world of the worker process (set by the pool initializer)
+_worker_world : acow.ACOWorld = None
+
+def _init_worker(world : acow.ACOWorld) -> None:
+    """initializer of the worker process - the prepared world is passed once per worker, not per run"""
+    global _worker_world
+    _worker_world = world
+    
+def _run_config(task : tuple[dict, int, int | None, float | None]) -> dict:
+    """solve the world with one configuration and seed
+    
+    :param task: configuration, seed, number of iterations and time limit of the run
+    :return: record with the configuration, seed and results of the run
+    :rtype: dict
+    """
+    config, seed, iterations, time_limit = task
+    record = {"config" : config, "seed" : seed}
+    try:
+        solver = aco_solver.ACOSolver(_world=_worker_world, _seed=seed, **{f"_{key}" : value for key, value in config.items()})
+        start = time.perf_counter()
+        solver.solve(iterations, time_limit=time_limit)
+        record["wall_time_s"] = time.perf_counter() - start
+        record["best_cost"] = float(solver.best_tour_cost)
+        record["iterations"] = solver.iterations_done
+        record["stop_reason"] = solver.stop_reason.value
+    except Exception as e:
+        record["error"] = str(e)
+    return record
+    
+def parse_param(spec : str) -> tuple[str, list | tuple]:
+    """parse the specification of the swept parameter
+    
+    :param str spec: NAME=v1,v2,... (values for the grid) or NAME=low:high (range for the random search)
+    :return: name of the parameter and the list of values or the tuple (low, high)
+    :rtype: tuple[str, list | tuple]
+    
+    :raises ValueError: if the specification is not valid
+    """
+    name, _, values = spec.partition("=")
+    name = name.strip()
+    if name not in SWEEP_PARAMETERS:
+        raise ValueError(f"Parameter {name} cannot be swept, use one of {', '.join(SWEEP_PARAMETERS)}.")
+    value_type = SWEEP_PARAMETERS[name]
+    try:
+        if ":" in values:
+            low, high = values.split(":")
+            return name, (value_type(low), value_type(high))
+        return name, [value_type(value) for value in values.split(",")]
+    except ValueError:
+        raise ValueError(f"Bad values of the parameter {name}: {values}")
+        
+def create_configs(specs : dict[str, list | tuple], base : dict, samples : int | None, search_seed : int) -> list[dict]:
+    """create the configurations of the sweep
+    
+    :param specs: swept parameters - list of values (grid) or range (low, high) (random search)
+    :param dict base: values of the parameters, that are not swept
+    :param int samples: number of configurations of the random search, if None, the whole grid is used
+    :param int search_seed: seed of the random search, the same seed gives the same configurations \
+        (so the sweep can be resumed)
+    :rtype: list[dict]
+    
+    :raises ValueError: if there is a range and the number of samples is not set
+    """
+    if samples is None:
+        ranges = [name for name, values in specs.items() if isinstance(values, tuple)]
+        if ranges:
+            raise ValueError(f"Ranges ({', '.join(ranges)}) need --samples (random search).")
+        names = list(specs)
+        return [{**base, **dict(zip(names, values))} for values in itertools.product(*specs.values())]
+        
+    rng = np.random.default_rng(search_seed)
+    configs = []
+    for _ in range(samples):
+        config = dict(base)
+        for name, values in specs.items():
+            if isinstance(values, list):
+                config[name] = values[int(rng.integers(len(values)))]
+            elif SWEEP_PARAMETERS[name] is int:
+                config[name] = int(rng.integers(values[0], values[1] + 1))
+            else:
+                config[name] = float(rng.uniform(values[0], values[1]))
+        configs.append(config)
+    return configs
+    
+def run_key(config : dict, seed : int) -> str:
+    # key of the run, to find the runs that are already done
+    return json.dumps([config, seed], sort_keys=True)
+    
+def load_done_runs(path : str) -> dict[str, dict]:
+    """load the records of the runs from the output file of the previous sweep
+    
+    :return: records by the keys of the runs (see `run_key()`)
+    """
+    done = {}
+    if not os.path.isfile(path):
+        return done
+    with open(path) as file:
+        for line in file:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # the last line can be cut off, when the sweep was killed
+                continue
+            if "error" not in record:
+                done[run_key(record["config"], record["seed"])] = record
+    return done
+    
+def summarize(records : list[dict], swept : list[str]) -> str:
+    """aggregate the records by the configuration to the table sorted by the mean cost
+    
+    :param swept: names of the swept parameters (columns of the table)
+    :rtype: str
+    """
+    groups = {}
+    for record in records:
+        if "error" in record:
+            continue
+        key = json.dumps(record["config"], sort_keys=True)
+        groups.setdefault(key, (record["config"], []))[1].append(record)
+        
+    rows = []
+    for config, runs in groups.values():
+        costs = [run["best_cost"] for run in runs]
+        times = [run["wall_time_s"] for run in runs]
+        rows.append((float(np.mean(costs)), min(costs), float(np.mean(times)), len(runs), config))
+    rows.sort(key=lambda row: (row[0], row[1]))
+    
+    header = [f"{name:>11}" for name in swept] + [f"{'runs':>5}", f"{'mean cost':>14}", f"{'best cost':>14}", f"{'mean time':>10}"]
+    lines = [" ".join(header)]
+    for mean_cost, best_cost, mean_time, runs, config in rows:
+        values = [f"{config[name]:>11.4g}" for name in swept]
+        lines.append(" ".join(values + [f"{runs:>5}", f"{mean_cost:>14.3f}", f"{best_cost:>14.3f}", f"{mean_time:>9.3f}s"]))
+    return "\n".join(lines)
+    
+def main():
+    parser = argparse.ArgumentParser(
+        description="Sweep of the ACS parameters - grid or random search, each configuration is solved with more seeds " \
+            "in parallel processes sharing the prepared world."
+    )
+    parser.add_argument("node_file", type=str, help="Path to the node file.")
+    parser.add_argument("edge_file", type=str, nargs="?", default=None, help="Path to the edge file (optional).")
+    parser.add_argument("--cache_dir", type=str, default=None, help="Directory for the cache of prepared worlds (optional).")
+    parser.add_argument("--param", type=str, action="append", default=[], metavar="NAME=SPEC",
+                        help=f"Swept parameter ({', '.join(SWEEP_PARAMETERS)}), SPEC is list of values v1,v2,... (grid) " \
+                            "or range low:high (random search), can be used more times.")
+    parser.add_argument("--samples", type=int, default=None, help="Number of configurations of the random search (default: None - whole grid).")
+    parser.add_argument("--search_seed", type=int, default=0, help="Seed of the random search (default: 0).")
+    parser.add_argument("--seeds", type=int, nargs="+", default=[1, 2, 3], help="Seeds of the solver, each configuration is solved with each seed (default: 1 2 3).")
+    parser.add_argument("--iterations", type=int, default=None, help="Number of iterations of each run (default: 10, no limit if --time_limit is set).")
+    parser.add_argument("--time_limit", type=float, default=None, help="Time limit of each run in seconds (default: None - no limit).")
+    parser.add_argument("--processes", type=int, default=os.cpu_count(), help="Number of worker processes (default: number of CPUs).")
+    parser.add_argument("--output", type=str, default=None, help="Path to the output JSON lines file with the results of the runs (optional).")
+    parser.add_argument("--resume", action="store_true", help="Skip the runs already in the output file and append the new ones.")
+    # values of the parameters that are not swept
+    parser.add_argument("--alpha", type=float, default=1.0, help="Alpha parameter (default: 1.0).")
+    parser.add_argument("--beta", type=float, default=2.0, help="Beta parameter (default: 2.0).")
+    parser.add_argument("--rho", type=float, default=0.1, help="Rho parameter (default: 0.1).")
+    parser.add_argument("--n", type=int, default=10, help="Number of ants (default: 10).")
+    parser.add_argument("--tau0", type=str, default="greedy", help="Initial pheromone value (default: 'greedy').")
+    parser.add_argument("--Q", type=float, default=1, help="Pheromone intensity (default: 1).")
+    parser.add_argument("--q0", type=float, default=0.9, help="Probability threshold for exploitation (default: 0.9).")
+    parser.add_argument("--alpha_decay", type=float, default=0.1, help="Alpha decay rate (default: 0.1).")
+    parser.add_argument("--global_update", type=str, default="all", choices=["all", "best_tour"], help="Edges updated by the global pheromone update (default: 'all').")
+    parser.add_argument("--candidates", type=int, default=None, help="Size of candidate lists of nearest nodes (default: None - all nodes).")
+    parser.add_argument("--local_search", type=str, default=None, choices=["2opt", "oropt", "3opt"], help="Local search applied to the tour of each ant (default: None).")
+    parser.add_argument("--backend", type=str, default="vectorized", choices=["vectorized", "reference"], help="Compute backend of the tour construction and pheromone updates (default: 'vectorized').")
+    parser.add_argument("--batched", action="store_true", help="Construct tours of all ants at once (vectorized).")
+    args = parser.parse_args()
+    
+    if (args.iterations is None and args.time_limit is None):
+        args.iterations = 10
+    if (args.resume and args.output is None):
+        print("Error: --resume needs --output.", file=sys.stderr)
+        exit(1)
+        
+    tau0 = args.tau0
+    if (tau0 != "greedy"):
+        try:
+            tau0 = float(tau0)
+        except ValueError:
+            print("Error: tau0 must be 'greedy' or a number.", file=sys.stderr)
+            exit(1)
+    base = {
+        "alpha" : args.alpha,
+        "beta" : args.beta,
+        "rho" : args.rho,
+        "n" : args.n,
+        "tau0" : tau0,
+        "Q" : args.Q,
+        "q0" : args.q0,
+        "alpha_decay" : args.alpha_decay,
+        "global_update" : args.global_update,
+        "candidates" : args.candidates,
+        "local_search" : args.local_search,
+        "backend" : args.backend,
+        "batched" : args.batched,
+    }
+    
+    try:
+        specs = dict(parse_param(spec) for spec in args.param)
+        configs = create_configs(specs, base, args.samples, args.search_seed)
+        
+        # prepare the world once, the parts computed lazily (greedy tour, nearest nodes) are computed here, \
+        # so the workers get them ready
+        world = acow.ACOWorld(path_nodes=args.node_file, path_edges=args.edge_file, cache_dir=args.cache_dir)
+        if (tau0 == "greedy"):
+            world.get_greedy_cost()
+        if (args.candidates is not None):
+            world.get_nearest_nodes(args.candidates)
+        if (args.local_search is not None):
+            world.get_nearest_nodes(acols.NEIGHBOURS)
+    except Exception as e:
+        print("Error: " + str(e), file=sys.stderr)
+        exit(1)
+        
+    done = load_done_runs(args.output) if args.resume else {}
+    records = []
+    tasks = []
+    for config in configs:
+        for seed in args.seeds:
+            record = done.get(run_key(config, seed))
+            if record is not None:
+                records.append(record)
+            else:
+                tasks.append((config, seed, args.iterations, args.time_limit))
+    print(f"{len(configs)} configurations x {len(args.seeds)} seeds, {len(records)} runs done already, {len(tasks)} to run", file=sys.stderr)
+    
+    start = time.perf_counter()
+    output = open(args.output, "a" if args.resume else "w") if args.output is not None else None
+    try:
+        with multiprocessing.Pool(max(1, min(args.processes, len(tasks))), initializer=_init_worker, initargs=(world,)) as pool:
+            for done_count, record in enumerate(pool.imap_unordered(_run_config, tasks), start=1):
+                records.append(record)
+                if output is not None:
+                    # each run is written at once, so the sweep can be resumed after it is killed
+                    output.write(json.dumps(record) + "\n")
+                    output.flush()
+                if "error" in record:
+                    print(f"Error in run {record['config']} seed {record['seed']}: {record['error']}", file=sys.stderr)
+                else:
+                    print(f"[{done_count}/{len(tasks)}] cost {record['best_cost']:.3f} in {record['wall_time_s']:.3f}s", file=sys.stderr)
+    finally:
+        if output is not None:
+            output.close()
+    print(f"Sweep done in {time.perf_counter() - start:.3f}s", file=sys.stderr)
+    
+    print(summarize(records, list(specs) if specs else list(SWEEP_PARAMETERS)))
+    
+if __name__ == "__main__":
+    main()
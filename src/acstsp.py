@@ -6,13 +6,11 @@
 import acs.aco_world as acow
 import acs.aco_solver as aco_solver
 import acs.aco_settings as acos
+import acs.aco_tsplib as acotsp
 import sys
+import os
 import argparse
 
-from PyQt5.QtWidgets import QApplication, QMainWindow, QScrollArea, QGraphicsView, QGraphicsScene, QGraphicsRectItem, QVBoxLayout,QWidget,QPushButton
-from PyQt5.QtCore import Qt, QLineF, QPointF
-from PyQt5.QtGui import QPen, QColor, QFont
-
 def main():
     # argument parser setup
     parser = argparse.ArgumentParser(
@@ -21,7 +19,7 @@ def main():
     parser.add_argument(
         "node_file", 
         type=str, 
-        help="Path to the nodes input file (required)."
+        help="Path to the nodes input file or TSPLIB instance with .tsp extension (required)."
     )
     parser.add_argument(
         "--edge_file", 
@@ -29,6 +27,8 @@ def main():
         default=None, 
         help="Path to the edges input file (optional)."
     )
+    parser.add_argument("--opt_tour", type=str, default=None, help="Path to the TSPLIB .tour file with the optimal tour, to print the gap to optimum (optional).")
+    parser.add_argument("--cache_dir", type=str, default=None, help="Directory for the cache of prepared worlds (optional).")
     parser.add_argument("--alpha", type=float, default=1.0, help="Alpha parameter (default: 1.0).")
     parser.add_argument("--beta", type=float, default=2.0, help="Beta parameter (default: 2.0).")
     parser.add_argument("--rho", type=float, default=0.1, help="Rho parameter (default: 0.1).")
@@ -38,30 +38,61 @@ def main():
     parser.add_argument("--q0", type=float, default=0.9, help="Probability threshold for exploitation (default: 0.9).")
     parser.add_argument("--alpha_decay", type=float, default=0.1, help="Alpha decay rate (default: 0.1).")
     parser.add_argument("--start_node", type=int, default=1, help="Start node ID (default: 1).")
-    parser.add_argument("--iterations", type=int, default=10, help="Number of iterations for solving (default: 10).")
+    parser.add_argument("--seed", type=int, default=None, help="Seed of the random generators, runs with the same seed are identical (default: None - random).")
+    parser.add_argument("--iterations", type=int, default=None, help="Number of iterations for solving (default: 10, no limit if another stopping criterion is set).")
+    parser.add_argument("--time_limit", type=float, default=None, help="Time limit of solving in seconds, the running iteration is cut short (default: None - no limit).")
+    parser.add_argument("--target_cost", type=float, default=None, help="Stop solving when a tour with this or lower cost is found (default: None).")
+    parser.add_argument("--max_stagnant_iterations", type=int, default=None, help="Stop solving after this number of iterations without improvement of the best tour (default: None - no limit).")
+    parser.add_argument("--global_update", type=str, default="all", choices=["all", "best_tour"], help="Edges updated by the global pheromone update (default: 'all').")
+    parser.add_argument("--candidates", type=int, default=None, help="Size of candidate lists of nearest nodes (default: None - all nodes).")
+    parser.add_argument("--local_search", type=str, default=None, choices=["2opt", "oropt", "3opt"], help="Local search applied to the tour of each ant (default: None).")
+    parser.add_argument("--local_search_time", type=float, default=None, help="Time budget of the local search in one iteration in seconds (default: None - no limit).")
+    parser.add_argument("--backend", type=str, default="vectorized", choices=["vectorized", "reference"], help="Compute backend of the tour construction and pheromone updates (default: 'vectorized').")
+    parser.add_argument("--batched", action="store_true", help="Construct tours of all ants at once (vectorized).")
+    parser.add_argument("--workers", type=int, default=1, help="Number of colonies solved in parallel processes (island model) (default: 1).")
+    parser.add_argument("--migration_interval", type=int, default=10, help="Number of iterations between migrations of the best tour among colonies (default: 10).")
+    parser.add_argument("--pheromone_blend", type=float, default=0.0, help="Weight of the mean pheromone of colonies blended on migration (default: 0.0).")
+    parser.add_argument("--ant_workers", type=int, default=1, help="Number of processes constructing the tours of one colony in parallel (default: 1).")
+    parser.add_argument("--checkpoint", type=str, default=None, help="Path to the checkpoint file of the solver, it is saved when the solving stops (optional).")
+    parser.add_argument("--checkpoint_every", type=int, default=None, help="Save the checkpoint every K iterations (default: None - only at the end).")
+    parser.add_argument("--resume", action="store_true", help="Continue from the checkpoint, if it exists (parameters of the algorithm are taken from it).")
+    parser.add_argument("--profile", action="store_true", help="Print time spent in phases of the iterations at the end.")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose output for debugging.")
     parser.add_argument("--display", action="store_true", help="Show solved graph.")
     args = parser.parse_args()
     
     # set verbose mode globally
     acos.VERBOSE = args.verbose
-
+    
+    # without other stopping criteria, the default number of iterations is used
+    if (args.iterations is None and args.time_limit is None and args.target_cost is None and args.max_stagnant_iterations is None):
+        args.iterations = 10
+    if ((args.checkpoint_every is not None or args.resume) and args.checkpoint is None):
+        print("Error: --checkpoint_every and --resume need --checkpoint.", file=sys.stderr)
+        exit(1)
+    if (args.checkpoint_every is not None and args.checkpoint_every < 1):
+        print("Error: --checkpoint_every must be greater than 0.", file=sys.stderr)
+        exit(1)
+    if (args.checkpoint is not None and args.workers > 1):
+        print("Error: Checkpoints are not supported by the island solver (--workers).", file=sys.stderr)
+        exit(1)
+        
     # print parameters
     print("\n--- Algorithm Parameters ---")
     for arg, value in vars(args).items():
         print(f"{arg}: {value}")
     print("----------------------------\n")
-
+    
     # initialize the world
     try:
         world = acow.ACOWorld(
             path_nodes=args.node_file, 
-            path_edges=args.edge_file
+            path_edges=args.edge_file,
+            cache_dir=args.cache_dir
         )
         
         # initialize the solver
-        solver = aco_solver.ACOSolver(
-            _world=world, 
+        solver_kwargs = dict(
             _alpha=args.alpha, 
             _beta=args.beta, 
             _rho=args.rho, 
@@ -70,140 +101,96 @@ def main():
             _Q=args.Q, 
             _q0=args.q0, 
             _alpha_decay=args.alpha_decay, 
-            _start_node_id=args.start_node
+            _start_node_id=args.start_node,
+            _batched=args.batched,
+            _global_update=args.global_update,
+            _candidates=args.candidates,
+            _profile=args.profile,
+            _ant_workers=args.ant_workers,
+            _local_search=args.local_search,
+            _local_search_time=args.local_search_time,
+            _backend=args.backend
         )
+        # load the optimal tour, if provided (before the solver starts its worker processes)
+        opt_tour_cost = None
+        if (args.opt_tour is not None):
+            opt_tour_cost = world.get_tour_cost(acotsp.read_tour(args.opt_tour))
+            
+        if (args.workers > 1):
+            # more colonies in parallel processes (multiprocessing is loaded only for them)
+            import acs.aco_islands as aco_islands
+            solver = aco_islands.ACOIslandSolver(
+                _world=world,
+                _workers=args.workers,
+                _migration_interval=args.migration_interval,
+                _pheromone_blend=args.pheromone_blend,
+                _seed=args.seed,
+                **solver_kwargs
+            )
+        elif (args.resume and os.path.isfile(args.checkpoint)):
+            # continue the interrupted solving, the iterations already done are counted
+            solver = aco_solver.ACOSolver.load_checkpoint(
+                args.checkpoint,
+                _world=world,
+                _profile=args.profile,
+                _ant_workers=args.ant_workers
+            )
+            print(f"Resumed from checkpoint {args.checkpoint} at iteration {solver.iteration}", file=sys.stderr)
+            if (args.iterations is not None):
+                args.iterations = max(args.iterations - solver.iteration, 0)
+        else:
+            solver = aco_solver.ACOSolver(_world=world, _seed=args.seed, **solver_kwargs)
+            
     except Exception as e:
         print("Error: " + str(e), file=sys.stderr)
         exit(1)
-
-
+        
+        
     # start solving acs
-    solver.solve(args.iterations)
-
+    try:
+        if (args.checkpoint is None):
+            solver.solve(args.iterations, time_limit=args.time_limit, target_cost=args.target_cost, max_stagnant_iterations=args.max_stagnant_iterations)
+        else:
+            for record in solver.solve_iter(args.iterations, time_limit=args.time_limit, target_cost=args.target_cost, max_stagnant_iterations=args.max_stagnant_iterations):
+                if (args.checkpoint_every is not None and (record.iteration + 1) % args.checkpoint_every == 0):
+                    solver.save_checkpoint(args.checkpoint)
+            solver.save_checkpoint(args.checkpoint)
+    except Exception as e:
+        print("Error: " + str(e), file=sys.stderr)
+        exit(1)
+    finally:
+        solver.close()
+        
     # print results
     nodes, bt, cost = solver.get_best_tour()
+    print("Stop reason: ", solver.stop_reason.value)
+    print("Iterations done: ", solver.iterations_done)
     print("Best tour cost: ", cost)
+    if (nodes is None):
+        print("No tour was found in the time limit.")
+        exit(0)
+    if (opt_tour_cost is not None):
+        print("Optimal tour cost: ", opt_tour_cost)
+        print(f"Gap to optimum: {100 * (cost - opt_tour_cost) / opt_tour_cost:.2f} %")
     print("****** Best tour edges ******")
     for edge in bt:
         print(edge)
     print("****** Best tour nodes ******")
     for node in nodes:
         print(node)
-
-    if (args.display):
-        app = QApplication(sys.argv)
-        window = MainWindow(solver, world)
-        sys.exit(app.exec_())
-
-class MainWindow(QMainWindow):
-    def __init__(self, solver : aco_solver.ACOSolver, world : acow.ACOWorld):
-        super().__init__()
-        self.initUI()
-        self.drawNodes(world.nodes)
-        self.drawEdges(world.edges)
-        self.set_computation_finised_gui(solver.best_tour_edges, solver.best_tour_nodes)
-        
-    def drawNodes(self,nodes):
-        # define a pen to draw the nodes with
-        pen = QPen(QColor(0, 0, 0))  # black color
-        pen.setWidth(2)  # Set line width
-        pen.setStyle(Qt.SolidLine) 
-        
-        # draw the nodes
-        for node in nodes.values():
-            item=self.scene.addEllipse(node.x - 5, node.y - 5, 10, 10, pen, pen.color())
-            txt =self.scene.addText(str(node.id), QFont("Arial", 12, weight=1000))
-            txt.setPos(node.x, node.y)
-            txt.setZValue(12)
-            # constatns here are just guessed ... to make the background not so large 
-            backg = QGraphicsRectItem(txt.x(),txt.y()+5,txt.boundingRect().width()-2,txt.boundingRect().height()-8)
-            backg.setBrush(QColor(158, 134, 28))
-            backg.setZValue(11)
-            self.scene.addItem(backg)
-            item.setZValue(10)
-        
-        self.scene.update()
-    
-    def drawEdges(self,edges):
-        # define a pen to draw the nodes with
-        pen = QPen(Qt.black)  # Blue color
-        pen.setWidth(1)  # Set line width
-        pen.setStyle(Qt.SolidLine) 
-        
-        # draw the edges
-        for edge in edges:            
-            self.scene.addLine(
-                QLineF(
-                    QPointF(edge.node_first.x,edge.node_first.y), 
-                    QPointF(edge.node_second.x,edge.node_second.y)
-                ),
-                pen
-            )
-        self.scene.update()
-    
-    def set_computation_finised_gui(self, best_tour_edges : list[acow.Edge], best_tour_nodes : list[acow.Node]):
-        # draw edges
-        # define a pen to draw the nodes with
-        pen = QPen(QColor(237, 188, 52))  # Blue color
-        pen.setWidth(2)  # Set line width
-        pen.setStyle(Qt.SolidLine) 
-        for edge in best_tour_edges:
-            self.scene.addLine(
-                QLineF(
-                    QPointF(edge.node_first.x,edge.node_first.y), 
-                    QPointF(edge.node_second.x,edge.node_second.y)
-                ),
-                pen
-            )
-            
-        # draw nodes
-        pen.setColor(QColor(40, 201, 54))
-        for node in best_tour_nodes:
-            item=self.scene.addEllipse(node.x - 5, node.y - 5, 10, 10, pen, pen.color())
-            item.setZValue(10)
-            
-        # update the scene
-        self.scene.update()
-    
-    def initUI(self):
-        self.setGeometry(100, 100, 800, 600)
-        self.setWindowTitle("Solution Visualization")
-
-        main_widget = QWidget(self)
-        self.setCentralWidget(main_widget)
-        
-        layout = QVBoxLayout()
         
-        # create GraphicsView and Scene
-        self.view = QGraphicsView(self)
-        self.scene = QGraphicsScene(self)
-        self.view.setScene(self.scene)
-        self.view.setStyleSheet("background-color: white; border: 1px solid black;")
-        layout.addWidget(self.view)
+    if (args.profile and solver.profiler is not None):
+        print("****** Profile ******")
+        print(solver.profiler.report())
         
-        # add buttons for zooming
-        btn_zoom_in = QPushButton("Zoom In", self)
-        btn_zoom_in.clicked.connect(self.__zoom_in)
-        btn_zoom_out = QPushButton("Zoom Out", self)
-        btn_zoom_out.clicked.connect(self.__zoom_out)
-        layout.addWidget(btn_zoom_in)
-        layout.addWidget(btn_zoom_out)
-        # zoom factor
-        self.zoom_factor = 1.0
-        
-        main_widget.setLayout(layout)
-        
-        self.show()
-    
-    def __zoom_in(self):
-        self.zoom_factor *= 1.25
-        self.view.resetTransform()
-        self.view.scale(self.zoom_factor, self.zoom_factor)
-    
-    def __zoom_out(self):
-        self.zoom_factor /= 1.25
-        self.view.resetTransform()
-        self.view.scale(self.zoom_factor, self.zoom_factor)
+    if (args.display):
+        # the visualization (and Qt) is loaded only when it is requested
+        try:
+            import gui.solutionwindow as solutionwindow
+        except ImportError as e:
+            print("Error: --display needs PyQt5: " + str(e), file=sys.stderr)
+            exit(1)
+        sys.exit(solutionwindow.show_solution(solver, world))
         
 if __name__ == "__main__":
     main()
@@ -1,11 +1,10 @@
 import gui.mainwindow as mw
 from acs.aco_solver import ACOSolver
 from acs.aco_world import ACOWorld
+from gui.solverworker import ACOSolverWorker, ACOSnapshot
 import acs.aco_settings as acos
-import threading
 
-from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import Qt, QTimer, QPointF
+from PyQt5.QtCore import Qt, QPointF
 import sys
 
 class ACOComputationState:
@@ -21,8 +20,9 @@ class AntGuiController:
     def __init__(self):
         self.node_file_path=None
         self.edge_file_path=None
-        self.timer = None
-        self.lock = threading.Lock()
+        self.worker = None
+        # stopped workers with running threads
+        self.stopping_workers = []
     
     def setControllersView(self, view):
         self.view : mw.MainWindow = view
@@ -35,20 +35,6 @@ class AntGuiController:
         print(path, file=sys.stderr)
         self.edge_file_path=path
     
-    def notify_from_aco_solver(self, type : acos.ACS2GUIMessage, **kwargs) -> None:
-        match type:
-            case acos.ACS2GUIMessage.GLOBAL_PHEROMONE_UPDATE_DONE:
-                if acos.VERBOSE:
-                    print("Global pheromone update message received", file=sys.stderr)
-                # update the view with the new pheromone values
-                self.view.update_edges(
-                    self.world.edges,
-                    kwargs["best_tour"],
-                    kwargs["min_pheromone"],
-                    kwargs["max_pheromone"]
-                )
-                QApplication.processEvents()
-        
     def __handle_aco_gui(self, num_iterations : int, comp_speed : float) -> None:
         if acos.VERBOSE:
             print("ACS gui started",file=sys.stderr)
@@ -57,50 +43,71 @@ class AntGuiController:
 
         self.current_step = 0
         
-        self.solver.prepare_for_one_step_solving()
+        # the solver runs in the worker thread, the view is updated only from the snapshots sent by the worker
+        worker = ACOSolverWorker(self.solver, self.world, num_iterations, comp_speed)
+        worker.iteration_done.connect(lambda snapshot: self.__iteration_done(worker, snapshot, num_iterations))
+        worker.finished.connect(lambda stop_reason: self.__computation_finished(worker, stop_reason))
+        worker.failed.connect(lambda message: self.__computation_failed(worker, message))
+        self.worker = worker
+        worker.start()
+        
+    def __iteration_done(self, worker : ACOSolverWorker, snapshot : ACOSnapshot, num_iterations : int) -> None:
+        # snapshots of a stopped worker can still be queued
+        if worker is not self.worker:
+            return
+        record = snapshot.record
+        self.current_step = record.iteration + 1
+        self.view.update_edges(self.world.edges, None, record.min_pheromone, record.max_pheromone, snapshot.edge_pheromone)
+        self.view.update_iteration_count(self.current_step, num_iterations)
         
-        def one_step_handler():
-            # make sure more than one thread isnt increasing the step
-            with self.lock:
-                self.current_step += 1
-                my_step = self.current_step
+    def __computation_finished(self, worker : ACOSolverWorker, stop_reason : acos.ACOStopReason | None) -> None:
+        if worker is not self.worker or stop_reason is None:
+            return
+        # the worker is done, so the solver can be read
+        self.ACO_STATE = ACOComputationState.ACO_DONE
+        self.view.set_computation_finised_gui(self.solver.best_tour_edges, self.solver.best_tour_nodes)
+        self.view.log_message("Computation finished:",bold=True)
+        self.view.log_message(f"Best tour length: {self.solver.best_tour_cost}")
+        for i, node in enumerate(self.solver.best_tour_nodes):
+            self.view.log_message(f"{i}. Node: {node}")
             
-            # check for possibilities of step that is represented by the current thread
-            if my_step == num_iterations:
-                self.timer.stop()
-                self.ACO_STATE = ACOComputationState.ACO_DONE
-                self.solver.solve_one_step()
-                self.view.update_iteration_count(self.current_step, num_iterations)
-                self.view.set_computation_finised_gui(self.solver.best_tour_edges, self.solver.best_tour_nodes)
-                self.view.log_message("Computation finished:",bold=True)
-                self.view.log_message(f"Best tour length: {self.solver.best_tour_cost}")
-                for i, node in enumerate(self.solver.best_tour_nodes):
-                    self.view.log_message(f"{i}. Node: {node}")
-            elif my_step > num_iterations:
-                return
-            else:
-                self.solver.solve_one_step()
-                self.view.update_iteration_count(self.current_step, num_iterations)
-           
-        # start solving
-        self.timer = QTimer(self.view)
-        self.timer.timeout.connect(lambda: one_step_handler() if self.ACO_STATE == ACOComputationState.ACO_RUNNING else None)
-        self.timer.start(comp_speed*1000)  # 1 second interval
+    def __computation_failed(self, worker : ACOSolverWorker, message : str) -> None:
+        if worker is not self.worker:
+            return
+        self.ACO_STATE = ACOComputationState.ACO_DONE
+        self.view.log_message("Error: " + message, bold=True, warning=True)
+        
+    def __stop_worker(self, wait : bool = False) -> None:
+        """stop the worker, without waiting the references are kept until its thread is done \
+        (the running iteration is cut short)
+        """
+        if self.worker is None:
+            return
+        worker = self.worker
+        self.worker = None
+        worker.stop()
+        if wait:
+            worker.wait()
+        elif worker.thread.isRunning():
+            self.stopping_workers.append(worker)
+            worker.thread.finished.connect(lambda: self.stopping_workers.remove(worker))
     
     def pauseACO(self) -> None:
+        # nothing to pause, if the solving is not running
+        if self.worker is None:
+            return
         self.ACO_STATE = ACOComputationState.ACO_PAUSED
-        self.timer.stop()
+        self.worker.pause()
     
     def continueACO(self) -> None:
+        if self.worker is None:
+            return
         self.ACO_STATE = ACOComputationState.ACO_RUNNING
-        self.timer.start()
+        self.worker.resume()
     
     def resetACO(self) -> None:
         self.ACO_STATE = ACOComputationState.ACO_READY
-        if (self.timer != None):
-            self.timer.stop()
-            del self.timer
-            self.timer = None
+        self.__stop_worker()
         self.world = None
         self.solver = None
         self.current_step = 0
@@ -109,6 +116,12 @@ class AntGuiController:
         
         self.view.reset_scene_context()
         self.view.resetUI()
+        
+    def shutdown(self) -> None:
+        """stop the computation and wait for the worker threads, called when the window is closed"""
+        self.__stop_worker(wait=True)
+        for worker in list(self.stopping_workers):
+            worker.wait()
     
     def rebootSame(self):
         store_path=self.edge_file_path
@@ -168,6 +181,7 @@ class AntGuiController:
         _alpha_decay = params["_alpha_decay"] if params["_alpha_decay"]!=None else 0.1
         _start_node_id = int(params["_start_node_id"]) if params["_start_node_id"]!=None else None
         num_iterations = int(params["num_iterations"]) if params["num_iterations"]!=None else 10
+        _local_search = params.get("_local_search")
         
         # logging parameters to window
         self.view.log_message("ACO Parameters:",bold=True)
@@ -181,6 +195,7 @@ class AntGuiController:
         self.view.log_message(f"Start Node ID: {_start_node_id}")
         self.view.log_message(f"Number of ants (N): {_n}")
         self.view.log_message(f"Number of iterations: {num_iterations}")
+        self.view.log_message(f"Local search: {_local_search}")
         
         # set up the world
         try:
@@ -193,7 +208,6 @@ class AntGuiController:
             # set up the solver
             solver = ACOSolver(
             _world=world,
-            _gui_controller=self,
             _alpha=_alpha,
             _beta=_beta,
             _rho=_rho,
@@ -203,6 +217,7 @@ class AntGuiController:
             _q0=_q0,
             _alpha_decay=_alpha_decay,
             _start_node_id=_start_node_id,
+            _local_search=_local_search,
         )
         
         except Exception as e:
@@ -3,7 +3,7 @@ from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout,
     QLineEdit, QPushButton, QHBoxLayout, 
     QFileDialog, QScrollArea,QGraphicsView, QGraphicsScene,
-    QTextEdit, QLabel, QSlider, QGraphicsTextItem, QGraphicsRectItem, QMessageBox
+    QTextEdit, QLabel, QSlider, QGraphicsTextItem, QGraphicsRectItem, QMessageBox, QComboBox
 )
 from PyQt5.QtCore import Qt,QDir,QPointF, QLineF,QCoreApplication
 from PyQt5.QtGui import QPen, QColor,QFont
@@ -57,6 +57,20 @@ class MainWindow(QMainWindow):
             textbox.setPlaceholderText(f"{self.textboxes_params[i][0]}")
             self.inputs.append((self.textboxes_params[i][2],textbox))
             left_layout.addWidget(textbox)
+        
+        # local search applied to the tours of the ants
+        # these tuples define the label and the name of the method passed to the ACO
+        self.local_search_methods = [
+            ("No local search", None),
+            ("2-opt local search", "2opt"),
+            ("Or-opt local search", "oropt"),
+            ("3-opt local search", "3opt")
+        ]
+        self.local_search_combobox = QComboBox(self)
+        self.local_search_combobox.setFixedSize(180, 30)
+        for label, _ in self.local_search_methods:
+            self.local_search_combobox.addItem(label)
+        left_layout.addWidget(self.local_search_combobox)
             
         # add buttons to the left layout
         load_node_file_button = QPushButton("Load node file", self)
@@ -167,6 +181,11 @@ class MainWindow(QMainWindow):
         # add layout to the main widget
         main_widget.setLayout(mylayout)
     
+    def closeEvent(self, event):
+        # the solver thread must be done before the window is destroyed
+        self.controller.shutdown()
+        super().closeEvent(event)
+    
     def draw_nodes(self, nodes : dict[int, Node], start_node=None) -> None:
         if acos.VERBOSE:
             print("Draw nodes",file=sys.stderr)
@@ -235,7 +254,8 @@ class MainWindow(QMainWindow):
         """
         self.iteration_count_label.setText(f"Iterace: {current_iteration}/{max_iterations}")
         
-    def update_edges(self, edges : list[Edge], best_tour : list[Edge], min_pheromone, max_pheromone) -> None:
+    def update_edges(self, edges : list[Edge], best_tour : list[Edge], min_pheromone, max_pheromone, pheromone=None) -> None:
+        # pheromone - values in order of the edges (snapshot from the solver worker), if None, read from the edges
         if acos.VERBOSE:
             print("Update edges",file=sys.stderr)
         
@@ -247,11 +267,12 @@ class MainWindow(QMainWindow):
         # remove the old edges
         for edge in self.edge_ui:
             self.scene.removeItem(edge)
-            self.edge_ui.remove(edge)
+        self.edge_ui = []
 
         # draw the new edges
-        for edge in edges:
-            pen.setColor(self.__get_color_from_value(edge.pheromone, min_pheromone, max_pheromone))
+        for i, edge in enumerate(edges):
+            edge_pheromone = edge.pheromone if pheromone is None else pheromone[i]
+            pen.setColor(self.__get_color_from_value(edge_pheromone, min_pheromone, max_pheromone))
             lineitem = self.scene.addLine(
                 QLineF(
                     QPointF(edge.node_first.x,edge.node_first.y), 
@@ -426,6 +447,7 @@ class MainWindow(QMainWindow):
             self.inputs[current_item][1].setStyleSheet("border: 2px solid red;")    
             return None
         
+        params["_local_search"] = self.local_search_methods[self.local_search_combobox.currentIndex()][1]
         return params
     
     def reset_scene_context(self):
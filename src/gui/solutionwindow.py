@@ -0,0 +1,134 @@
+# author: Jan Holan
+# mail: xholan11@stud.fit.vutbr.cz
+# date: 2026-10-18
+# file: solutionwindow.py
+
+import acs.aco_world as acow
+import acs.aco_solver as aco_solver
+import sys
+
+from PyQt5.QtWidgets import QApplication, QMainWindow, QGraphicsView, QGraphicsScene, QGraphicsRectItem, QVBoxLayout,QWidget,QPushButton
+from PyQt5.QtCore import Qt, QLineF, QPointF
+from PyQt5.QtGui import QPen, QColor, QFont
+
+class SolutionWindow(QMainWindow):
+    """window with the solved graph - all edges, the best tour and its nodes"""
+    
+    def __init__(self, solver : aco_solver.ACOSolver, world : acow.ACOWorld):
+        super().__init__()
+        self.initUI()
+        self.drawNodes(world.nodes)
+        self.drawEdges(world.edges)
+        self.set_computation_finised_gui(solver.best_tour_edges, solver.best_tour_nodes)
+        
+    def drawNodes(self,nodes):
+        # define a pen to draw the nodes with
+        pen = QPen(QColor(0, 0, 0))  # black color
+        pen.setWidth(2)  # Set line width
+        pen.setStyle(Qt.SolidLine) 
+        
+        # draw the nodes
+        for node in nodes.values():
+            item=self.scene.addEllipse(node.x - 5, node.y - 5, 10, 10, pen, pen.color())
+            txt =self.scene.addText(str(node.id), QFont("Arial", 12, weight=1000))
+            txt.setPos(node.x, node.y)
+            txt.setZValue(12)
+            # constatns here are just guessed ... to make the background not so large 
+            backg = QGraphicsRectItem(txt.x(),txt.y()+5,txt.boundingRect().width()-2,txt.boundingRect().height()-8)
+            backg.setBrush(QColor(158, 134, 28))
+            backg.setZValue(11)
+            self.scene.addItem(backg)
+            item.setZValue(10)
+            
+        self.scene.update()
+        
+    def drawEdges(self,edges):
+        # define a pen to draw the nodes with
+        pen = QPen(Qt.black)  # Blue color
+        pen.setWidth(1)  # Set line width
+        pen.setStyle(Qt.SolidLine) 
+        
+        # draw the edges
+        for edge in edges:            
+            self.scene.addLine(
+                QLineF(
+                    QPointF(edge.node_first.x,edge.node_first.y), 
+                    QPointF(edge.node_second.x,edge.node_second.y)
+                ),
+                pen
+            )
+        self.scene.update()
+        
+    def set_computation_finised_gui(self, best_tour_edges : list[acow.Edge], best_tour_nodes : list[acow.Node]):
+        # draw edges
+        # define a pen to draw the nodes with
+        pen = QPen(QColor(237, 188, 52))  # Blue color
+        pen.setWidth(2)  # Set line width
+        pen.setStyle(Qt.SolidLine) 
+        for edge in best_tour_edges:
+            self.scene.addLine(
+                QLineF(
+                    QPointF(edge.node_first.x,edge.node_first.y), 
+                    QPointF(edge.node_second.x,edge.node_second.y)
+                ),
+                pen
+            )
+            
+        # draw nodes
+        pen.setColor(QColor(40, 201, 54))
+        for node in best_tour_nodes:
+            item=self.scene.addEllipse(node.x - 5, node.y - 5, 10, 10, pen, pen.color())
+            item.setZValue(10)
+            
+        # update the scene
+        self.scene.update()
+        
+    def initUI(self):
+        self.setGeometry(100, 100, 800, 600)
+        self.setWindowTitle("Solution Visualization")
+        
+        main_widget = QWidget(self)
+        self.setCentralWidget(main_widget)
+        
+        layout = QVBoxLayout()
+        
+        # create GraphicsView and Scene
+        self.view = QGraphicsView(self)
+        self.scene = QGraphicsScene(self)
+        self.view.setScene(self.scene)
+        self.view.setStyleSheet("background-color: white; border: 1px solid black;")
+        layout.addWidget(self.view)
+        
+        # add buttons for zooming
+        btn_zoom_in = QPushButton("Zoom In", self)
+        btn_zoom_in.clicked.connect(self.__zoom_in)
+        btn_zoom_out = QPushButton("Zoom Out", self)
+        btn_zoom_out.clicked.connect(self.__zoom_out)
+        layout.addWidget(btn_zoom_in)
+        layout.addWidget(btn_zoom_out)
+        # zoom factor
+        self.zoom_factor = 1.0
+        
+        main_widget.setLayout(layout)
+        
+        self.show()
+        
+    def __zoom_in(self):
+        self.zoom_factor *= 1.25
+        self.view.resetTransform()
+        self.view.scale(self.zoom_factor, self.zoom_factor)
+        
+    def __zoom_out(self):
+        self.zoom_factor /= 1.25
+        self.view.resetTransform()
+        self.view.scale(self.zoom_factor, self.zoom_factor)
+
+def show_solution(solver : aco_solver.ACOSolver, world : acow.ACOWorld) -> int:
+    """show the window with the solved graph and run the Qt application until the window is closed
+    
+    :return: exit code of the application
+    :rtype: int
+    """
+    app = QApplication(sys.argv)
+    window = SolutionWindow(solver, world)
+    return app.exec_()
@@ -0,0 +1,103 @@
+# author: Jan Holan
+# mail: xholan11@stud.fit.vutbr.cz
+# date: 2026-10-18
+# file: solverworker.py
+
+from acs.aco_solver import ACOSolver
+from acs.aco_world import ACOWorld
+import acs.aco_settings as acos
+from typing import NamedTuple
+import numpy as np
+import threading
+
+from PyQt5.QtCore import QObject, QThread, pyqtSignal
+
+# immutable state of the solving after one iteration, it is sent from the worker thread to the GUI
+class ACOSnapshot(NamedTuple):
+    record : acos.ACOIterationRecord # progress of the iteration
+    edge_pheromone : np.ndarray # pheromone on the edges in order of `ACOWorld.edges` (read only copy)
+    
+class ACOSolverWorker(QObject):
+    """runs the solver in its own thread, the progress is sent to the GUI thread by signals
+    
+    the solver and the world must not be touched by the GUI thread while the worker runs, the GUI gets \
+    only the snapshots; pause, continue and stop can be called from any thread
+    """
+    # `ACOSnapshot` after each iteration
+    iteration_done = pyqtSignal(object)
+    # `acos.ACOStopReason` when the solving is done (None if it was stopped by `stop()`)
+    finished = pyqtSignal(object)
+    # message of the error raised by the solver
+    failed = pyqtSignal(str)
+    
+    def __init__(self, solver : ACOSolver, world : ACOWorld, num_iterations : int, delay : float = 0):
+        """
+        :param `ACOSolver` solver: prepared solver, it is used only by the worker thread from now on
+        :param `ACOWorld` world: world of the solver
+        :param `int` num_iterations: number of iterations
+        :param `float` delay: delay between the iterations in seconds
+        """
+        super().__init__()
+        self.solver = solver
+        self.num_iterations = num_iterations
+        self.delay = delay
+        # indices of the edges into the pheromone matrix, the edges are created here in the GUI thread
+        self.__edge_rows = np.array([edge._index[0] for edge in world.edges], dtype=int)
+        self.__edge_cols = np.array([edge._index[1] for edge in world.edges], dtype=int)
+        self.__world = world
+        # set if the solving is not paused
+        self.__running = threading.Event()
+        self.__running.set()
+        self.__stopped = threading.Event()
+        self.__iterations = None
+        self.thread = None
+        
+    def start(self) -> None:
+        """start the solving in a new thread"""
+        # the solving is started here in the GUI thread, so `stop()` called after this method is never lost
+        self.__iterations = self.solver.solve_iter(self.num_iterations)
+        self.thread = QThread()
+        self.moveToThread(self.thread)
+        self.thread.started.connect(self.run)
+        self.finished.connect(self.thread.quit)
+        self.failed.connect(self.thread.quit)
+        self.thread.start()
+        
+    def run(self) -> None:
+        """solve the problem, it runs in the worker thread"""
+        try:
+            for record in self.__iterations:
+                edge_pheromone = self.__world.pheromone[self.__edge_rows, self.__edge_cols]
+                edge_pheromone.flags.writeable = False
+                self.iteration_done.emit(ACOSnapshot(record, edge_pheromone))
+                
+                # wait between the iterations and while paused, both are cut short by `stop()`
+                self.__stopped.wait(self.delay)
+                self.__running.wait()
+                if self.__stopped.is_set():
+                    self.__iterations.close()
+                    break
+            self.finished.emit(None if self.__stopped.is_set() else self.solver.stop_reason)
+        except Exception as e:
+            self.failed.emit(str(e))
+            
+    def pause(self) -> None:
+        """pause the solving immediately, the running iteration waits in its current step (see `ACOSolver.pause()`)"""
+        self.__running.clear()
+        self.solver.pause()
+        
+    def resume(self) -> None:
+        """continue the paused solving"""
+        self.__running.set()
+        self.solver.resume()
+        
+    def stop(self) -> None:
+        """stop the solving as soon as possible, the running iteration is cut short"""
+        self.__stopped.set()
+        self.__running.set()
+        self.solver.interrupt()
+        
+    def wait(self) -> None:
+        """wait until the worker thread is done"""
+        if self.thread is not None:
+            self.thread.wait()